@@ -0,0 +1,51 @@
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+
+from benchmarks.runner import THRESHOLD, compare, record, run_benchmarks
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Stat Arb benchmarks", prog="python -m benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="Time benchmarks, optionally appending the results to a history")
+    run.add_argument("-k", "--pattern", default="*", help="Glob of benchmark names to run")
+    run.add_argument("-r", "--repeat", type=int, default=5, help="Timed calls per benchmark size")
+    run.add_argument("--max-size", type=int, help="Skip sizes above this, for a quick run")
+    run.add_argument("-o", "--history", type=Path, help="JSON lines history to append the results to")
+
+    comparison = subparsers.add_parser("compare", help="Flag regressions between two recorded runs")
+    comparison.add_argument("history", type=Path, help="JSON lines history holding the current run")
+    comparison.add_argument("--baseline-history", type=Path, help="History holding the baseline run")
+    comparison.add_argument("--baseline", help="Run id to compare against, defaults to the previous run")
+    comparison.add_argument("--current", help="Run id to compare, defaults to the latest run")
+    comparison.add_argument("-t", "--threshold", type=float, default=THRESHOLD, help="Relative slow down")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run_benchmarks(args.pattern, args.repeat, args.max_size)
+        if args.history is not None:
+            record(results, args.history)
+        return 0
+
+    try:
+        comparisons = compare(args.history, args.baseline, args.current, args.baseline_history)
+    except ValueError as e:
+        comparison.error(str(e))  # exits with the usage
+
+    regressions = 0
+    for x in comparisons:
+        flag = "REGRESSION" if x.is_regression(args.threshold) else ""
+        regressions += bool(flag)
+        print(
+            f"{x.name:<28} {x.size:<8} {x.baseline_seconds * 1e3:>10.3f} ms -> "
+            f"{x.current_seconds * 1e3:>10.3f} ms {x.ratio:>6.2f}x {flag}"
+        )
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Generator, Union
+
+Timed = Callable[[], Any]
+
+# Build the inputs for one size, returning the zero argument callable to time. A generator setup yields it
+# instead, and the code after its yield tears the inputs down once timed
+Setup = Callable[[int], Union[Timed, Generator[Timed, None, None]]]
+
+
+@dataclass
+class Benchmark:
+    name: str
+    parameter: str  # what the sizes count e.g. observations, pairs or tickers
+    sizes: list[int]
+    setup: Setup
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, parameter: str, sizes: list[int]) -> Callable[[Setup], Setup]:
+    """Register a benchmark setup function."""
+
+    def register(setup: Setup) -> Setup:
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark already registered: {name}")
+        BENCHMARKS[name] = Benchmark(name, parameter, sizes, setup)
+        return setup
+
+    return register
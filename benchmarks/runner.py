@@ -0,0 +1,172 @@
+import datetime as dt
+import fnmatch
+import json
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+from benchmarks.registry import BENCHMARKS, Benchmark, Timed
+
+THRESHOLD = 0.1  # relative slow down flagged as a regression
+
+
+@dataclass
+class BenchmarkResult:
+    run_id: str
+    name: str
+    parameter: str
+    size: int
+    repeat: int
+    min_seconds: float
+    median_seconds: float
+    commit: str
+    machine: str
+    timestamp: str
+
+
+@dataclass
+class Comparison:
+    name: str
+    size: int
+    baseline_seconds: float
+    current_seconds: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_seconds / self.baseline_seconds
+
+    def is_regression(self, threshold: float = THRESHOLD) -> bool:
+        return self.ratio > 1 + threshold
+
+
+def run_benchmarks(
+    pattern: str = "*", repeat: int = 5, max_size: Optional[int] = None, run_id: Optional[str] = None
+) -> list[BenchmarkResult]:
+    """
+    Time every registered benchmark matching the glob pattern at each of its sizes.
+
+    Each timing follows one untimed warm up call, and the minimum over repeats is the headline figure as the
+    least affected by other load on the machine.
+    """
+    import benchmarks.startup  # noqa: F401 registers the benchmarks
+    import benchmarks.suite  # noqa: F401
+
+    timestamp = dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds")
+    commit = _git_commit()
+    run_id = run_id or f"{timestamp}-{commit}"
+    machine = f"{platform.machine()}-{platform.python_implementation()}{platform.python_version()}"
+
+    results = []
+    for benchmark in BENCHMARKS.values():
+        if not fnmatch.fnmatch(benchmark.name, pattern):
+            continue
+
+        for size in benchmark.sizes:
+            if max_size is not None and size > max_size:
+                continue
+
+            with _prepared(benchmark, size) as func:
+                func()
+
+                times = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    func()
+                    times.append(time.perf_counter() - start)
+
+            result = BenchmarkResult(
+                run_id,
+                benchmark.name,
+                benchmark.parameter,
+                size,
+                repeat,
+                min(times),
+                statistics.median(times),
+                commit,
+                machine,
+                timestamp,
+            )
+            print(f"{result.name:<28} {result.parameter:>12}={size:<8} {result.min_seconds * 1e3:>10.3f} ms")
+            results.append(result)
+
+    return results
+
+
+@contextmanager
+def _prepared(benchmark: Benchmark, size: int) -> Iterator[Timed]:
+    """The callable to time, tearing down a generator setup on exit."""
+    built = benchmark.setup(size)
+    if not isinstance(built, Generator):
+        yield built
+        return
+
+    try:
+        yield next(built)
+    finally:
+        next(built, None)
+
+
+def record(results: list[BenchmarkResult], history: Path) -> None:
+    """Append results to a JSON lines history, created if missing."""
+    history.parent.mkdir(parents=True, exist_ok=True)
+    with open(history, "a") as f:
+        for result in results:
+            f.write(json.dumps(asdict(result)) + "\n")
+
+
+def load_history(history: Path) -> list[BenchmarkResult]:
+    if not history.exists():
+        return []
+
+    with open(history) as f:
+        return [BenchmarkResult(**json.loads(line)) for line in f if line.strip()]
+
+
+def compare(
+    history: Path,
+    baseline: Optional[str] = None,
+    current: Optional[str] = None,
+    baseline_history: Optional[Path] = None,
+) -> list[Comparison]:
+    """
+    Compare the minimum timings of two runs, by default the last run in the history against the one before.
+
+    Given a baseline history, e.g. one committed from the main branch, the baseline run defaults to the last
+    run there instead, so timings can be compared across commits and machines' histories.
+    """
+    results = load_history(history)
+    run_ids = list(dict.fromkeys(x.run_id for x in results))
+
+    current = current or (run_ids[-1] if run_ids else None)
+    if baseline_history is not None:
+        baseline_results = load_history(baseline_history)
+        baseline = baseline or (baseline_results[-1].run_id if baseline_results else None)
+        results = baseline_results + results
+    elif baseline is None:
+        earlier = run_ids[: run_ids.index(current)] if current in run_ids else []
+        baseline = earlier[-1] if earlier else None
+    if baseline is None or current is None:
+        raise ValueError("History needs two runs to compare")
+
+    baseline_times = {(x.name, x.size): x.min_seconds for x in results if x.run_id == baseline}
+
+    return [
+        Comparison(x.name, x.size, baseline_times[(x.name, x.size)], x.min_seconds)
+        for x in results
+        if x.run_id == current and (x.name, x.size) in baseline_times
+    ]
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
@@ -0,0 +1,33 @@
+"""Cold import time of each entry point, each import timed in a fresh interpreter."""
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Callable
+
+from benchmarks.registry import Setup, benchmark
+
+ROOT = Path(__file__).parent.parent
+
+ENTRY_POINTS = {
+    "interpreter": None,  # baseline cost of starting python
+    "cli": "stat_arb.cli",
+    "database": "stat_arb.model.local_store.yfinance_cache.db_run",
+    "ticker": "stat_arb.model.local_store.ticker_snapshot.ticker_snapshot",
+    "columnar": "stat_arb.model.local_store.columnar_store.columnar_run",
+    "scan": "stat_arb.model.pair_scanner.scan_run",
+    "app": "stat_arb.app",
+}
+
+
+def cold_import(module: str | None) -> Setup:
+    command = [sys.executable, "-c", f"import {module}" if module else "pass"]
+
+    def setup(_: int) -> Callable[[], object]:
+        return lambda: subprocess.run(command, cwd=ROOT, check=True)
+
+    return setup
+
+
+for name, module in ENTRY_POINTS.items():
+    benchmark(f"import_{name}", "processes", [1])(cold_import(module))
@@ -0,0 +1,168 @@
+"""Benchmarks of the model layer on seeded synthetic cointegrated data."""
+
+import datetime as dt
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.registry import benchmark
+from stat_arb.model.data.cointegration_simulator import simulate_cointegrated
+from stat_arb.model.data.local_data_handler import LocalDataHandler
+from stat_arb.model.data.price_cache import PRICE_CACHE
+from stat_arb.model.local_store.yfinance_cache.database_util import connect, write_prices
+from stat_arb.model.regressor import KalmanFilterRegressor, NaiveRegressor, RollingWindowRegressor
+from stat_arb.model.regressor.kalman_filter_regressor import KalmanFilterRegressorInputs
+from stat_arb.model.regressor.naive_regressor import NaiveRegressorInputs
+from stat_arb.model.regressor.rolling_window_regressor import RollingWindowRegressorInputs
+from stat_arb.model.statistics import CointegratedAugmentedDickeyFuller, ErrorCorrectionModel
+from stat_arb.model.trading_strategy import (
+    OrnsteinUhlenbeckSDE,
+    OrnsteinUhlenbeckSDEFit,
+    OrnsteinUhlenbeckSDEFitInputs,
+    RollingWindow,
+    RollingWindowInputs,
+    ToyStrategy,
+    ToyStrategyInputs,
+    compute_metrics,
+)
+
+SEED = 0
+
+N_OBS = [1_000, 5_000, 20_000]
+N_PAIRS = [10, 100, 1_000]
+N_TICKERS = [10, 100]
+
+START = dt.datetime(2000, 1, 3)
+
+
+def pair(n_obs: int) -> tuple[pd.Series, pd.Series]:
+    """A cointegrated pair of price series on a business day calendar."""
+    sim = simulate_cointegrated(1, n_obs, 2, rng=np.random.default_rng(SEED))
+    dates = pd.bdate_range(START, periods=n_obs)
+
+    return pd.Series(sim.prices[0, :, 0], dates, name="A"), pd.Series(sim.prices[0, :, 1], dates, name="B")
+
+
+def panel(n_obs: int, n_pairs: int) -> tuple[np.ndarray, list[tuple[int, int]]]:
+    """Price panel of shape (n_obs, 2 * n_pairs) with columns i and n_pairs + i cointegrated."""
+    sim = simulate_cointegrated(n_pairs, n_obs, 2, rng=np.random.default_rng(SEED))
+    prices = np.concatenate([sim.prices[..., 0].T, sim.prices[..., 1].T], axis=1)
+
+    return prices, [(i, n_pairs + i) for i in range(n_pairs)]
+
+
+def residual(n_obs: int) -> tuple[pd.Series, pd.Series, pd.Series]:
+    price_a, price_b = pair(n_obs)
+    return price_a, price_b, NaiveRegressor(price_a, price_b).get_residual(NaiveRegressorInputs())
+
+
+@benchmark("naive_regressor", "observations", N_OBS)
+def naive_regressor(n_obs: int):
+    price_a, price_b = pair(n_obs)
+    return lambda: NaiveRegressor(price_a, price_b).get_residual(NaiveRegressorInputs())
+
+
+@benchmark("naive_regressor_batch", "pairs", N_PAIRS)
+def naive_regressor_batch(n_pairs: int):
+    prices, pairs = panel(1_000, n_pairs)
+    return lambda: NaiveRegressor.fit_batch(prices, pairs)
+
+
+@benchmark("rolling_window_regressor", "observations", N_OBS)
+def rolling_window_regressor(n_obs: int):
+    price_a, price_b = pair(n_obs)
+    return lambda: RollingWindowRegressor(price_a, price_b).get_residual(RollingWindowRegressorInputs(252))
+
+
+@benchmark("kalman_filter_regressor", "observations", N_OBS)
+def kalman_filter_regressor(n_obs: int):
+    price_a, price_b = pair(n_obs)
+    return lambda: KalmanFilterRegressor(price_a, price_b).get_residual(KalmanFilterRegressorInputs())
+
+
+@benchmark("cadf", "observations", N_OBS)
+def cadf(n_obs: int):
+    _, _, resids = residual(n_obs)
+    return lambda: CointegratedAugmentedDickeyFuller.test_stationarity(resids, k_vars=2)
+
+
+@benchmark("cadf_batch", "pairs", N_PAIRS)
+def cadf_batch(n_pairs: int):
+    prices, pairs = panel(1_000, n_pairs)
+    resids = NaiveRegressor.fit_batch(prices, pairs).residuals
+    return lambda: CointegratedAugmentedDickeyFuller.test_stationarity_batch(resids, k_vars=2)
+
+
+@benchmark("ecm", "observations", N_OBS)
+def ecm(n_obs: int):
+    price_a, price_b, resids = residual(n_obs)
+    return lambda: ErrorCorrectionModel.fit(price_a, price_b, resids)
+
+
+@benchmark("ecm_batch", "pairs", N_PAIRS)
+def ecm_batch(n_pairs: int):
+    prices, pairs = panel(1_000, n_pairs)
+    resids = NaiveRegressor.fit_batch(prices, pairs).residuals
+    price_a, price_b = prices[:, :n_pairs], prices[:, n_pairs:]
+    return lambda: ErrorCorrectionModel.fit_batch(price_a, price_b, resids)
+
+
+@benchmark("ornstein_uhlenbeck", "observations", N_OBS)
+def ornstein_uhlenbeck(n_obs: int):
+    _, _, resids = residual(n_obs)
+    x = resids.to_numpy()
+    return lambda: OrnsteinUhlenbeckSDE(x).fit_to_sde()
+
+
+@benchmark("toy_strategy_backtest", "observations", N_OBS)
+def toy_strategy_backtest(n_obs: int):
+    price_a, price_b, resids = residual(n_obs)
+    beta = pd.Series(1.0, resids.index)
+    return lambda: ToyStrategy(resids, price_a, price_b, beta).backtest(ToyStrategyInputs(1, 0))
+
+
+@benchmark("rolling_window_backtest", "observations", N_OBS)
+def rolling_window_backtest(n_obs: int):
+    price_a, price_b, resids = residual(n_obs)
+    beta = pd.Series(1.0, resids.index)
+    return lambda: RollingWindow(resids, price_a, price_b, beta).backtest(RollingWindowInputs(1, 0, 252))
+
+
+@benchmark("ornstein_uhlenbeck_backtest", "observations", N_OBS)
+def ornstein_uhlenbeck_backtest(n_obs: int):
+    price_a, price_b, resids = residual(n_obs)
+    beta = pd.Series(1.0, resids.index)
+    inputs = OrnsteinUhlenbeckSDEFitInputs(1.25, 0.5, 60)
+    return lambda: OrnsteinUhlenbeckSDEFit(resids, price_a, price_b, beta).backtest(inputs)
+
+
+@benchmark("metrics_matrix", "series", N_PAIRS)
+def metrics_matrix(n_series: int):
+    rng = np.random.default_rng(SEED)
+    positions = rng.choice([-1.0, 0.0, 1.0], size=(2_500, n_series))
+    returns = positions * rng.normal(0, 0.01, positions.shape)
+    return lambda: compute_metrics(returns, positions)
+
+
+@benchmark("local_data_handler", "tickers", N_TICKERS)
+def local_data_handler(n_tickers: int):
+    n_obs = 2_500
+    sim = simulate_cointegrated(1, n_obs, n_tickers, rng=np.random.default_rng(SEED))
+    dates = pd.bdate_range(START, periods=n_obs, name="Date")
+    tickers = [f"T{i:04d}" for i in range(n_tickers)]
+
+    with tempfile.TemporaryDirectory(prefix="stat_arb_benchmark_") as directory:
+        db = str(Path(directory) / "prices.db")
+        conn = connect(db)
+        with conn:
+            for i, ticker in enumerate(tickers):
+                write_prices(conn, ticker, pd.DataFrame({"Close": sim.prices[0, :, i]}, index=dates))
+        conn.close()
+
+        def load():
+            PRICE_CACHE.clear()  # measure the database, not the shared cache
+            return LocalDataHandler(tickers, dates[0], dates[-1], db=db).get_close_prices()
+
+        yield load
@@ -13,7 +13,7 @@ def main():
 
     app = Dash(__name__, external_stylesheets=[dbc.themes.ZEPHYR])
 
-    app.layout = layout()
+    app.layout = layout  # evaluated per page load, so each browser session is issued its own session id
 
     app.run(debug=True)
     # app.run()
@@ -1,10 +1,6 @@
 import logging
 from argparse import ArgumentParser, Namespace
 
-from stat_arb.app import main as app_main
-from stat_arb.model.local_store.ticker_snapshot.ticker_snapshot import main as ticker_main
-from stat_arb.model.local_store.yfinance_cache.db_run import main as db_main
-
 logger = logging.getLogger(__name__)
 
 
@@ -13,15 +9,42 @@ def main() -> None:
 
 
 def run(args: Namespace) -> None:
+    # Each branch imports only its own entry point, the dashboard's Dash and Plotly stack is costly to load
     if args.database:
         logger.info("CLI Database flag detected...")
+        from stat_arb.model.local_store.yfinance_cache.db_run import main as db_main
+
         db_main()
+    elif args.refresh:
+        logger.info("CLI Refresh flag detected...")
+        from stat_arb.model.local_store.yfinance_cache.db_run import refresh_main
+
+        refresh_main()
+    elif args.migrate:
+        logger.info("CLI Migrate flag detected...")
+        from stat_arb.model.local_store.yfinance_cache.db_run import migrate_main
+
+        migrate_main()
     elif args.ticker:
         logger.info("CLI Ticker flag detected...")
+        from stat_arb.model.local_store.ticker_snapshot.ticker_snapshot import main as ticker_main
+
         ticker_main()
+    elif args.columnar:
+        logger.info("CLI Columnar flag detected...")
+        from stat_arb.model.local_store.columnar_store.columnar_run import main as columnar_main
+
+        columnar_main()
+    elif args.scan:
+        logger.info("CLI Scan flag detected...")
+        from stat_arb.model.pair_scanner.scan_run import main as scan_main
+
+        scan_main()
     else:
         logger.info("Running standard procedure...")
         logger.info("Start Stat Arb app...")
+        from stat_arb.app import main as app_main
+
         app_main()
 
 
@@ -31,7 +54,19 @@ def parse_args() -> None:
     )
 
     parser.add_argument("-d", "--database", action="store_true", help="Create ticker prices local database")
+    parser.add_argument(
+        "-r", "--refresh", action="store_true", help="Incrementally refresh ticker prices local database"
+    )
+    parser.add_argument(
+        "-m", "--migrate", action="store_true", help="Migrate legacy per-ticker tables of the local database"
+    )
     parser.add_argument("-t", "--ticker", action="store_true", help="Create updated S&P500 ticker list")
+    parser.add_argument(
+        "-c", "--columnar", action="store_true", help="Create columnar price store from local database"
+    )
+    parser.add_argument(
+        "-s", "--scan", action="store_true", help="Scan local database S&P500 pairs for cointegration"
+    )
     parser.set_defaults(func=run)  # set dot notation for func (attribute)
 
     namespace: Namespace = parser.parse_args()
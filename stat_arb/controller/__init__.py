@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING
+
+from stat_arb.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .figures import downsample, line_traces, signal_shapes
+    from .job_manager import JobContext, JobManager, JobStatus, job_key
+    from .session_cache import SessionModelCache
+
+__all__ = [
+    "JobManager",
+    "JobContext",
+    "JobStatus",
+    "job_key",
+    "SessionModelCache",
+    "line_traces",
+    "downsample",
+    "signal_shapes",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "downsample": ".figures",
+        "line_traces": ".figures",
+        "signal_shapes": ".figures",
+        "JobContext": ".job_manager",
+        "JobManager": ".job_manager",
+        "JobStatus": ".job_manager",
+        "job_key": ".job_manager",
+        "SessionModelCache": ".session_cache",
+    },
+)
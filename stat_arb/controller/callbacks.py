@@ -1,21 +1,84 @@
+import copy
 import logging
+import threading
+from typing import Any, Callable, Optional
 
 import plotly
-import plotly.express as px
 import plotly.subplots
-from dash import Input, Output, State, callback, exceptions, html
+from dash import Input, Output, State, callback, exceptions, html, no_update
 
+from stat_arb.controller.figures import line_traces
+from stat_arb.controller.job_manager import IN_FLIGHT, JobManager, JobStatus
+from stat_arb.controller.session_cache import SessionModelCache
 from stat_arb.model.bivariate_engle_granger import BivariateEngleGranger
+from stat_arb.model.config import PROFILE_DIR
 from stat_arb.model.data.data_handler_enum import DataHandlerEnum, get_enum_from_str
+from stat_arb.model.instrumentation import Profiler
 from stat_arb.model.local_store.ticker_snapshot.ticker_snapshot import get_tickers
 from stat_arb.view.ids import IDS
 
 logger = logging.getLogger(__name__)
 
-# In-memory store for local development
-# Use dcc.Store and serializable data (rather than wrapper class) for multi-user production
-SINGLE_USER_INSTANCE = {}
-MODEL = "model"
+# Server side models keyed by the session id held in each browser's dcc.Store
+SESSION_MODELS = SessionModelCache()
+
+
+# Background jobs never mutate a session model. Each works on a snapshot and its result is applied to the
+# session model by the polling callback. The lock is held only while snapshotting or applying, so a model is
+# never seen half updated.
+MODEL_LOCK = threading.Lock()
+
+
+def get_session_model(session_id: Optional[str]) -> BivariateEngleGranger:
+    model = SESSION_MODELS.get(session_id)
+    if model is None:  # data not yet loaded, or session expired
+        raise exceptions.PreventUpdate
+
+    return model
+
+
+def snapshot_session_model(session_id: Optional[str]) -> BivariateEngleGranger:
+    """Shallow copy of the session model for a job to update, sharing its price data."""
+    model = get_session_model(session_id)
+
+    with MODEL_LOCK:
+        return copy.copy(model)
+
+
+def apply_to_session_model(session_id: Optional[str], load_id: str, **attributes: Any) -> None:
+    """Set a finished job's results on the session model, unless the model has since been reloaded."""
+    model = SESSION_MODELS.get(session_id)
+    if model is None or model.load_id != load_id:
+        raise exceptions.PreventUpdate
+
+    with MODEL_LOCK:
+        for name, value in attributes.items():
+            setattr(model, name, value)
+
+
+# Regression, statistical tests and backtests run in the background, polled by dcc.Interval
+JOBS = JobManager()
+
+
+def poll_job(job_id: Optional[str], render: Callable[[Any], Any]) -> tuple[Any, str, bool]:
+    """Rendered result once the job is done, else its progress, and whether polling should stop."""
+    if not job_id:
+        raise exceptions.PreventUpdate
+
+    job = JOBS.status(job_id)
+    if job is None:
+        raise exceptions.PreventUpdate
+
+    if job.status in IN_FLIGHT:
+        return no_update, f"{job.message} {job.progress:.0%}", False
+
+    match job.status:
+        case JobStatus.DONE:
+            return render(JOBS.result(job_id)), "", True
+        case JobStatus.FAILED:
+            return no_update, f"Failed: {job.error}", True
+        case _:
+            return no_update, "Cancelled", True
 
 
 def get_datasource_enums():
@@ -45,28 +108,30 @@ def get_default_tickers(data_source_enum: DataHandlerEnum):
     State(component_id=IDS.STORE_INPUTS.TICKER_B, component_property="value"),
     State(component_id=IDS.STORE_INPUTS.DATA_SOURCE, component_property="value"),
     State(component_id=IDS.STORE_INPUTS.TEST_TRAIN_SPLIT, component_property="value"),
+    State(component_id=IDS.SESSION.ID, component_property="data"),
 )
-def generate_model_from_setup(load, start_date, end_date, ticker_a, ticker_b, data_source, test_train_split):
+def generate_model_from_setup(
+    load, start_date, end_date, ticker_a, ticker_b, data_source, test_train_split, session_id
+):
     if None in [start_date, end_date, ticker_a, ticker_b, data_source, test_train_split]:
         exceptions.PreventUpdate
 
     enum: DataHandlerEnum = get_enum_from_str(data_source)
 
     # TODO: fix for test train split start date
-    model = BivariateEngleGranger(ticker_a, ticker_b, start_date, end_date, start_date, enum)
+    profiler = Profiler(PROFILE_DIR) if PROFILE_DIR else None
+    model = BivariateEngleGranger(ticker_a, ticker_b, start_date, end_date, start_date, enum, profiler)
 
-    SINGLE_USER_INSTANCE[MODEL] = model
+    SESSION_MODELS.put(session_id, model)
 
     fig = plotly.subplots.make_subplots(rows=2, cols=1, subplot_titles=("Raw Prices", "Normalised Prices"))
 
-    fig1 = px.line(model.get_close_prices(normalise_prices=False), y=[ticker_a, ticker_b], title="Raw Prices")
-    fig2 = px.line(
-        model.get_close_prices(normalise_prices=True), y=[ticker_a, ticker_b], title="Normalised Prices"
-    )
+    raw = line_traces(model.get_close_prices(normalise_prices=False), [ticker_a, ticker_b])
+    normalised = line_traces(model.get_close_prices(normalise_prices=True), [ticker_a, ticker_b])
 
-    fig.add_traces(fig1.data, rows=1, cols=1)
+    fig.add_traces(raw, rows=1, cols=1)
 
-    for trace in fig2.data:
+    for trace in normalised:
         trace.showlegend = False
         fig.add_traces(trace, rows=2, cols=1)
 
@@ -75,10 +140,13 @@ def generate_model_from_setup(load, start_date, end_date, ticker_a, ticker_b, da
     return fig
 
 
-@callback(Output(IDS.STATISTICS.ADF_RESULT, "children"), Input(IDS.GRAPHS.RESIDUAL, "figure"))
-def get_adf_result(_):
-    model: BivariateEngleGranger = SINGLE_USER_INSTANCE[MODEL]
-    cadf_result: bool = model.test_cadf()
+@callback(
+    Output(IDS.STATISTICS.ADF_RESULT, "children"),
+    Input(IDS.GRAPHS.RESIDUAL, "figure"),
+    State(IDS.JOBS.REGRESSION, "data"),
+)
+def get_adf_result(_, job_id):
+    cadf_result: bool = get_regression_result(job_id)["cadf"]
 
     text = "This tests if 2 time series are cointegrated and that the resulting spread is stationary."
     result = (
@@ -88,10 +156,13 @@ def get_adf_result(_):
     return [text, html.Br(), html.Br(), result]
 
 
-@callback(Output(IDS.STATISTICS.ECM_RESULT, "children"), Input(IDS.GRAPHS.RESIDUAL, "figure"))
-def get_ecm_result(_):
-    model: BivariateEngleGranger = SINGLE_USER_INSTANCE[MODEL]
-    ecm_result: bool = model.test_ecm()
+@callback(
+    Output(IDS.STATISTICS.ECM_RESULT, "children"),
+    Input(IDS.GRAPHS.RESIDUAL, "figure"),
+    State(IDS.JOBS.REGRESSION, "data"),
+)
+def get_ecm_result(_, job_id):
+    ecm_result: bool = get_regression_result(job_id)["ecm"]
 
     return (
         "Long run mean reversion at 5% significance level"
@@ -100,6 +171,17 @@ def get_ecm_result(_):
     )
 
 
+def get_regression_result(job_id: Optional[str]) -> dict:
+    if not job_id:
+        raise exceptions.PreventUpdate
+
+    job = JOBS.status(job_id)
+    if job is None or job.status != JobStatus.DONE:
+        raise exceptions.PreventUpdate
+
+    return JOBS.result(job_id)
+
+
 @callback(Output(IDS.STORE_INPUTS.DATA_SOURCE_DESC, "children"), Input(IDS.STORE_INPUTS.DATA_SOURCE, "value"))
 def get_data_source_desc(data_source_enum: DataHandlerEnum):
     match data_source_enum:
@@ -107,7 +189,14 @@ def get_data_source_desc(data_source_enum: DataHandlerEnum):
             text = "Source pricing analytics from live Yahoo Finance API."
         case DataHandlerEnum.SIMULATED:
             text = "Simulate pricing analytics using Euler Maruyama discretisation with correlated random numbers."
+        case DataHandlerEnum.SIMULATED_COINTEGRATED:
+            text = (
+                "Simulate Stock A cointegrated with Stock B, via an Ornstein Uhlenbeck spread around a "
+                "geometric random walk."
+            )
         case DataHandlerEnum.LOCAL:
             text = "Source pricing analytics from local database."
+        case DataHandlerEnum.COLUMNAR:
+            text = "Source pricing analytics from local memory-mapped columnar store."
 
     return html.H6(text)
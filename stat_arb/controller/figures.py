@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+MAX_POINTS = 2000  # per trace sent to the browser
+
+SIGNAL_COLOURS = {1: "green", -1: "red"}
+
+
+def signal_runs(signal: np.ndarray) -> list[tuple[int, int, int]]:
+    """Runs of consecutive identical signals as (first row, last row, signal)."""
+    signal = np.asarray(signal)
+    if len(signal) == 0:
+        return []
+
+    starts = np.flatnonzero(np.diff(signal)) + 1
+    starts = np.concatenate(([0], starts))
+    ends = np.concatenate((starts[1:] - 1, [len(signal) - 1]))
+
+    return list(zip(starts.tolist(), ends.tolist(), signal[starts].tolist()))
+
+
+def signal_shapes(dates: pd.Index, signal: np.ndarray, y0: float, y1: float, yref: str = "y1") -> list[dict]:
+    """
+    One shaded rectangle per long or short run, spanning from the run's first date to the date after it ends.
+    """
+    shapes = []
+    for start, end, value in signal_runs(signal):
+        end = min(end + 1, len(dates) - 1)
+        if value not in SIGNAL_COLOURS or start == end:
+            continue
+
+        shapes.append(
+            {
+                "type": "rect",
+                "xref": "x",
+                "yref": yref,
+                "x0": dates[start],
+                "y0": y0,
+                "x1": dates[end],
+                "y1": y1,
+                "fillcolor": SIGNAL_COLOURS[value],
+                "opacity": 0.2,
+                "line_width": 0,
+            }
+        )
+
+    return shapes
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest Triangle Three Buckets downsampling, returning the indices of the retained points.
+
+    Keeps the first and last points, and from each of n_out - 2 equal buckets between them the point forming
+    the largest triangle with the previously retained point and the average of the next bucket.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        bucket = slice(edges[i], edges[i + 1])
+        following = slice(edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else slice(n - 1, n)
+
+        avg_x, avg_y = x[following].mean(), y[following].mean()
+
+        area = np.abs((x[a] - avg_x) * (y[bucket] - y[a]) - (x[a] - x[bucket]) * (avg_y - y[a]))
+
+        a = edges[i] + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
+
+
+def downsample(df: pd.DataFrame, max_points: int = MAX_POINTS) -> pd.DataFrame:
+    """Rows retained by LTTB for any column, ignoring missing values, so each trace keeps its shape."""
+    if len(df) <= max_points:
+        return df
+
+    x = np.arange(len(df), dtype=float)
+    if isinstance(df.index, pd.DatetimeIndex):
+        x = np.asarray(df.index).view(np.int64).astype(float)
+
+    rows = []
+    for column in df.columns:
+        finite = np.flatnonzero(np.isfinite(df[column].to_numpy(dtype=float)))
+        rows.append(finite[lttb(x[finite], df[column].to_numpy(dtype=float)[finite], max_points)])
+
+    return df.iloc[np.unique(np.concatenate(rows))]
+
+
+def line_traces(df: pd.DataFrame, columns: list[str], max_points: int = MAX_POINTS) -> list[go.Scattergl]:
+    """Downsampled WebGL line traces of the columns."""
+    df = downsample(df[columns], max_points)
+    return [go.Scattergl(x=df.index, y=df[column], mode="lines", name=str(column)) for column in columns]
@@ -0,0 +1,262 @@
+import hashlib
+import json
+import logging
+import pickle
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from stat_arb.model.config import JOBS_DIR
+
+logger = logging.getLogger(__name__)
+
+MAX_JOBS = 2  # heavy computations allowed to run at once
+RETENTION = 24 * 60 * 60  # seconds a finished job is kept on disk
+
+JOB_ID = re.compile("[0-9a-f]{32}")  # uuid4 hex, checked before a client supplied id becomes a path
+
+
+class JobStatus(StrEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+IN_FLIGHT = (JobStatus.PENDING, JobStatus.RUNNING)
+
+
+@dataclass
+class Job:
+    id: str
+    key: str
+    group: str
+    status: JobStatus = JobStatus.PENDING
+    progress: float = 0.0
+    message: str = ""
+    error: str = ""
+    updated: float = 0.0
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class JobContext:
+    """Handle passed to a running job to report progress and observe cancellation."""
+
+    def __init__(self, manager: "JobManager", job: Job):
+        self._manager = manager
+        self._job = job
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def report(self, progress: float, message: str = "") -> None:
+        """Record progress in [0, 1], raising JobCancelled if the job has since been cancelled."""
+        if self.cancelled:
+            raise JobCancelled(self._job.id)
+
+        self._manager._update(self._job, progress=progress, message=message)
+
+
+class JobManager:
+    """
+    Local background job runner persisting each job's state and result to disk.
+
+    Jobs run on a bounded thread pool. Submitting a job whose key matches an in-flight job returns the
+    existing job rather than running it twice, and submitting a job with a new key cancels any in-flight
+    job of the same group, e.g. a session's previous regression once its inputs change. Cancellation is
+    cooperative: pending jobs never start and running jobs stop at their next progress report.
+    """
+
+    def __init__(
+        self, directory: str | Path = JOBS_DIR, max_workers: int = MAX_JOBS, retention: float = RETENTION
+    ):
+        self.directory = Path(directory)
+        self.retention = retention
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs: dict[str, Job] = {}
+        self._contexts: dict[str, JobContext] = {}
+        self._futures: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key: str, group: str, func: Callable[..., Any], *args, **kwargs) -> str:
+        """
+        Run func(context, *args, **kwargs) in the background, returning the job id.
+
+        Parameters
+        ----------
+        key : str
+            - Identity of the computation, see job_key; identical in-flight requests share one job.
+        group : str
+            - Jobs superseding each other, at most one of which is in flight.
+        func : callable
+            - Job taking a JobContext as its first argument, its return value is persisted as the result.
+        """
+        with self._lock:
+            for job in self._jobs.values():
+                if job.group != group or job.status not in IN_FLIGHT:
+                    continue
+                if job.key == key:
+                    return job.id
+                self._cancel(job)
+
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+            job = Job(id=uuid.uuid4().hex, key=key, group=group, updated=time.time())
+            context = JobContext(self, job)
+
+            self._jobs[job.id] = job
+            self._contexts[job.id] = context
+            self._write_state(job)
+
+            self._futures[job.id] = self._executor.submit(self._run, job, context, func, args, kwargs)
+
+        self.prune()
+
+        return job.id
+
+    def status(self, job_id: str) -> Optional[Job]:
+        """
+        State of the job, or None if unknown or not a job id.
+
+        A job only found on disk in flight was interrupted by a restart, so it is marked as failed.
+        """
+        if not JOB_ID.fullmatch(job_id):
+            return None
+
+        with self._lock:
+            if job_id in self._jobs:
+                return Job(**asdict(self._jobs[job_id]))
+
+            path = self._state_path(job_id)
+            if not path.exists():
+                return None
+
+            state = json.loads(path.read_text())
+            job = Job(**{**state, "status": JobStatus(state["status"])})
+
+            if job.status in IN_FLIGHT:
+                job.status = JobStatus.FAILED
+                job.error = "Interrupted by a restart"
+                job.updated = time.time()
+                self._write_state(job)
+
+        return job
+
+    def result(self, job_id: str) -> Any:
+        job = self.status(job_id)
+        if job is None or job.status != JobStatus.DONE:
+            raise RuntimeError(f"Job has no result: {job_id}")
+
+        with open(self._result_path(job_id), "rb") as f:
+            return pickle.load(f)
+
+    def cancel(self, job_id: str) -> None:
+        with self._lock:
+            if job_id in self._jobs:
+                self._cancel(self._jobs[job_id])
+
+    def prune(self) -> None:
+        """Forget finished jobs, and their files, older than the retention period."""
+        cutoff = time.time() - self.retention
+
+        with self._lock:
+            for job_id in [
+                k for k, v in self._jobs.items() if v.status not in IN_FLIGHT and v.updated < cutoff
+            ]:
+                del self._jobs[job_id]
+                self._contexts.pop(job_id, None)
+                self._futures.pop(job_id, None)
+
+        if not self.directory.exists():
+            return
+
+        for path in self.directory.glob("*"):
+            if path.stem not in self._jobs and path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for job in self._jobs.values():
+                if job.status in IN_FLIGHT:
+                    self._cancel(job)
+
+        self._executor.shutdown(wait=True)
+
+    def _run(self, job: Job, context: JobContext, func: Callable, args: tuple, kwargs: dict) -> None:
+        if context.cancelled:
+            return
+
+        self._update(job, status=JobStatus.RUNNING)
+
+        try:
+            result = func(context, *args, **kwargs)
+        except JobCancelled:
+            self._update(job, status=JobStatus.CANCELLED)
+            return
+        except Exception as e:
+            logger.exception(f"Job failed: {job.id}")
+            self._update(job, status=JobStatus.FAILED, error=f"{type(e).__name__}: {e}")
+            return
+
+        if context.cancelled:
+            self._update(job, status=JobStatus.CANCELLED)
+            return
+
+        path = self._result_path(job.id)
+        with open(path.with_suffix(".part"), "wb") as f:
+            pickle.dump(result, f)
+        path.with_suffix(".part").replace(path)
+
+        self._update(job, status=JobStatus.DONE, progress=1.0)
+
+    def _cancel(self, job: Job) -> None:
+        """Caller holds the lock."""
+        self._contexts[job.id]._cancelled.set()
+        self._futures[job.id].cancel()
+
+        job.status = JobStatus.CANCELLED
+        job.updated = time.time()
+        self._write_state(job)
+
+        logger.info(f"Cancelled job: {job.id}")
+
+    def _update(self, job: Job, **changes) -> None:
+        with self._lock:
+            if job.status == JobStatus.CANCELLED:
+                return  # cancellation is final
+
+            for k, v in changes.items():
+                setattr(job, k, v)
+            job.updated = time.time()
+
+            self._write_state(job)
+
+    def _write_state(self, job: Job) -> None:
+        path = self._state_path(job.id)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(asdict(job)))
+        tmp.replace(path)  # atomic, so readers never see a partial file
+
+    def _state_path(self, job_id: str) -> Path:
+        return self.directory / f"{job_id}.json"
+
+    def _result_path(self, job_id: str) -> Path:
+        return self.directory / f"{job_id}.pkl"
+
+
+def job_key(*parts: Any) -> str:
+    """Stable key of a computation from its JSON serialisable inputs."""
+    return hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
@@ -1,15 +1,22 @@
 import logging
 
-import plotly.express as px
-from dash import ALL, Input, Output, callback, ctx, html
+import plotly.graph_objects as go
+from dash import ALL, Input, Output, State, callback, ctx, html
 
-from stat_arb.controller.callbacks import MODEL, SINGLE_USER_INSTANCE
+from stat_arb.controller.callbacks import JOBS, apply_to_session_model, poll_job, snapshot_session_model
+from stat_arb.controller.figures import line_traces
+from stat_arb.controller.job_manager import JobContext, job_key
 from stat_arb.model.bivariate_engle_granger import BivariateEngleGranger
 from stat_arb.model.regressor import RegressorEnum
+from stat_arb.model.regressor.kalman_filter_regressor import KalmanFilterRegressorInputs
 from stat_arb.model.regressor.naive_regressor import NaiveRegressorInputs
 from stat_arb.model.regressor.rolling_window_regressor import RollingWindowRegressorInputs
 from stat_arb.view.ids import IDS, REGRESSION_INPUT
-from stat_arb.view.regressor_layout import naive_regressor_inputs, rolling_window_regressor_inputs
+from stat_arb.view.regressor_layout import (
+    kalman_filter_regressor_inputs,
+    naive_regressor_inputs,
+    rolling_window_regressor_inputs,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -18,15 +25,71 @@ def get_regressor_options():
     return [e for e in RegressorEnum]
 
 
-@callback(Output(IDS.GRAPHS.RESIDUAL, "figure"), Input(IDS.REGRESSION.INPUTS_STORE, "data"))
-def plot_residual(regression_inputs):
-    model: BivariateEngleGranger = SINGLE_USER_INSTANCE[MODEL]
+@callback(
+    Output(IDS.JOBS.REGRESSION, "data"),
+    Output(IDS.JOBS.REGRESSION_INTERVAL, "disabled"),
+    Input(IDS.REGRESSION.INPUTS_STORE, "data"),
+    State(IDS.SESSION.ID, "data"),
+)
+def submit_regression(regression_inputs, session_id):
+    model: BivariateEngleGranger = snapshot_session_model(session_id)
 
     inputs = unpack_regression_inputs(regression_inputs)
 
-    residual = model.get_residual(regression_inputs["regression_type"], inputs)
+    job_id = JOBS.submit(
+        job_key(session_id, model.load_id, regression_inputs),
+        f"{session_id}:regression",
+        run_regression,
+        model,
+        regression_inputs["regression_type"],
+        inputs,
+    )
+
+    return job_id, False
+
+
+@callback(
+    Output(IDS.GRAPHS.RESIDUAL, "figure"),
+    Output(IDS.JOBS.REGRESSION_PROGRESS, "children"),
+    Output(IDS.JOBS.REGRESSION_INTERVAL, "disabled", allow_duplicate=True),
+    Input(IDS.JOBS.REGRESSION_INTERVAL, "n_intervals"),
+    State(IDS.JOBS.REGRESSION, "data"),
+    State(IDS.SESSION.ID, "data"),
+    prevent_initial_call=True,
+)
+def poll_regression(_, job_id, session_id):
+    def render(result: dict) -> go.Figure:
+        apply_to_session_model(
+            session_id, result["load_id"], regressor=result["regressor"], resids=result["residual"]
+        )
+        return plot_residual(result)
+
+    return poll_job(job_id, render)
 
-    return px.line(residual)
+
+def run_regression(context: JobContext, model: BivariateEngleGranger, regression_type, inputs) -> dict:
+    """Regress and test on a snapshot of the session model, see snapshot_session_model."""
+    context.report(0.0, "Running regression...")
+    residual = model.get_residual(regression_type, inputs)
+
+    context.report(0.5, "Running CADF stationarity test...")
+    cadf = model.test_cadf()
+
+    context.report(0.75, "Running ECM mean reversion test...")
+    ecm = model.test_ecm()
+
+    return {
+        "load_id": model.load_id,
+        "regressor": model.regressor,
+        "residual": residual,
+        "cadf": cadf,
+        "ecm": ecm,
+    }
+
+
+def plot_residual(result: dict) -> go.Figure:
+    df = result["residual"].to_frame()
+    return go.Figure(line_traces(df, list(df.columns)))
 
 
 @callback(Output(IDS.REGRESSION.INPUTS_DIV, "children"), Input(IDS.REGRESSION.TYPE, "value"))
@@ -39,7 +102,7 @@ def regression_inputs(regression_type):
         case RegressorEnum.ROLLING_WINDOW:
             return rolling_window_regressor_inputs()
         case RegressorEnum.KALMAN_FILTER:
-            raise NotImplementedError
+            return kalman_filter_regressor_inputs()
         case _:
             raise ValueError(f"RegressorEnum unknown: {regression}")
 
@@ -71,7 +134,12 @@ def unpack_regression_inputs(regression_inputs: dict):
                 regression_inputs[IDS.REGRESSION.ID_ROLLING_WINDOW_REGRESSION.WINDOW_LENGTH["property"]],
             )
         case RegressorEnum.KALMAN_FILTER:
-            raise NotImplementedError
+            return KalmanFilterRegressorInputs(
+                regression_inputs[IDS.REGRESSION.ID_KALMAN_FILTER_REGRESSION.DELTA["property"]],
+                regression_inputs[
+                    IDS.REGRESSION.ID_KALMAN_FILTER_REGRESSION.OBSERVATION_VARIANCE["property"]
+                ],
+            )
     raise NotImplementedError
 
 
@@ -85,6 +153,10 @@ def get_regression_desc(regression_type):
                 "Finds a dynamic beta via rolling regression of the price series, with a window of length n."
             )
         case RegressorEnum.KALMAN_FILTER:
-            raise NotImplementedError
+            text = (
+                "Finds a dynamic beta via Kalman filter of the price series, updated recursively for each "
+                "observation. The residual is the one step prediction error, without lookahead bias, and "
+                "is left blank over the filter's burn in."
+            )
 
     return html.H6(text)
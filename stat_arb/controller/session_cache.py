@@ -0,0 +1,93 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MAX_SESSIONS = 32
+TTL = 60 * 60  # seconds since last access
+MAX_BYTES = 1024**3
+
+
+class SessionModelCache:
+    """
+    Server side store of one model per browser session.
+
+    Sessions are evicted once idle for longer than ttl seconds, and least recently used sessions are evicted
+    while there are more than max_sessions or the estimated size of all models exceeds max_bytes.
+    """
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS, ttl: float = TTL, max_bytes: int = MAX_BYTES):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+        # session id -> (model, last access time)
+        self._sessions: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: Optional[str]) -> Optional[Any]:
+        with self._lock:
+            self._expire()
+
+            if session_id is None or session_id not in self._sessions:
+                return None
+
+            model, _ = self._sessions[session_id]
+            self._sessions[session_id] = (model, time.monotonic())
+            self._sessions.move_to_end(session_id)
+
+            return model
+
+    def put(self, session_id: str, model: Any) -> None:
+        with self._lock:
+            self._sessions[session_id] = (model, time.monotonic())
+            self._sessions.move_to_end(session_id)
+
+            self._expire()
+            self._evict()
+
+    def remove(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for session_id in [k for k, (_, accessed) in self._sessions.items() if now - accessed > self.ttl]:
+            logger.info(f"Expiring idle session: {session_id}")
+            del self._sessions[session_id]
+
+    def _evict(self) -> None:
+        # Always keep the most recent session, even if its model alone exceeds the memory cap
+        while len(self._sessions) > 1 and (
+            len(self._sessions) > self.max_sessions
+            or sum(estimate_bytes(model) for model, _ in self._sessions.values()) > self.max_bytes
+        ):
+            session_id, _ = self._sessions.popitem(last=False)
+            logger.info(f"Evicting least recently used session: {session_id}")
+
+
+def estimate_bytes(obj: Any, depth: int = 3) -> int:
+    """Approximate memory held by the arrays and frames reachable through an object's attributes."""
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return int(np.sum(obj.memory_usage(deep=False)))
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if depth == 0:
+        return 0
+    if isinstance(obj, dict):
+        return sum(estimate_bytes(x, depth - 1) for x in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(estimate_bytes(x, depth - 1) for x in obj)
+    if hasattr(obj, "__dict__"):
+        return estimate_bytes(vars(obj), depth)
+
+    return 0
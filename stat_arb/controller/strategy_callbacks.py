@@ -1,15 +1,32 @@
 from logging import getLogger
 
 import plotly
-import plotly.express as px
 import plotly.subplots
-from dash import ALL, Input, Output, callback, ctx, dash_table, html
-
-from stat_arb.controller.callbacks import MODEL, SINGLE_USER_INSTANCE
+from dash import ALL, Input, Output, State, callback, ctx, dash_table, exceptions, html
+
+from stat_arb.controller.callbacks import (
+    JOBS,
+    apply_to_session_model,
+    get_session_model,
+    poll_job,
+    snapshot_session_model,
+)
+from stat_arb.controller.figures import line_traces, signal_shapes
+from stat_arb.controller.job_manager import JobContext, job_key
 from stat_arb.model.bivariate_engle_granger import BivariateEngleGranger
-from stat_arb.model.trading_strategy import RollingWindowInputs, StrategyEnum, ToyStrategyInputs
+from stat_arb.model.trading_strategy import (
+    OrnsteinUhlenbeckSDEFitInputs,
+    RollingWindowInputs,
+    StrategyEnum,
+    ToyStrategyInputs,
+    TradingStrategyResults,
+)
 from stat_arb.view.ids import IDS, STRATEGY_INPUT
-from stat_arb.view.trading_strategy_layout import rolling_window_inputs, toy_strategy_inputs
+from stat_arb.view.trading_strategy_layout import (
+    ou_strategy_inputs,
+    rolling_window_inputs,
+    toy_strategy_inputs,
+)
 
 logger = getLogger(__name__)
 
@@ -27,7 +44,7 @@ def strategy_inputs(strategy_type):
     elif strategy == StrategyEnum.RollingWindow:
         return rolling_window_inputs()
     elif strategy == StrategyEnum.OrnsteinUhlenbeckSDEFit:
-        raise NotImplementedError
+        return ou_strategy_inputs()
     else:
         raise ValueError(f"StrategyEnum unknown: {strategy}")
 
@@ -46,17 +63,24 @@ def update_strategy_store(
     return {"strategy_type": strategy_type, **matched_inputs}
 
 
-@callback(Output(IDS.STRATEGY.OUTPUT_DIV, "children"), Input(IDS.STRATEGY.OUTPUT_BACKTEST_PLOT, "figure"))
-def strategy_output_div(_):
-    model: BivariateEngleGranger = SINGLE_USER_INSTANCE[MODEL]
+@callback(
+    Output(IDS.STRATEGY.OUTPUT_DIV, "children"),
+    Input(IDS.STRATEGY.OUTPUT_BACKTEST_PLOT, "figure"),
+    State(IDS.SESSION.ID, "data"),
+)
+def strategy_output_div(_, session_id):
+    model: BivariateEngleGranger = get_session_model(session_id)
 
-    results = model.backtest_results
+    metrics = model.backtest_results.metrics
     data_dict = {
-        "Sharpe Ratio": f"{results.get_sharpe_ratio():.2f}",
-        "Sortino Ratio": f"{results.get_sortino_ratio():.2f}",
-        "Annualised Return": f"{results.get_annualised_return():.2%}",
-        "Annualised Volatility": f"{results.get_annualised_vol():.2%}",
-        "Maximum Drawdown": f"{results.get_max_drawdown():.2%}",
+        "Sharpe Ratio": f"{metrics.sharpe_ratio:.2f}",
+        "Sortino Ratio": f"{metrics.sortino_ratio:.2f}",
+        "Annualised Return": f"{metrics.annualised_return:.2%}",
+        "Annualised Volatility": f"{metrics.annualised_volatility:.2%}",
+        "Maximum Drawdown": f"{metrics.max_drawdown:.2%}",
+        "Maximum Drawdown Duration": f"{metrics.max_drawdown_duration} days",
+        "Hit Rate": f"{metrics.hit_rate:.2%}",
+        "Annualised Turnover": f"{metrics.turnover:.1f}",
     }
 
     table_data = [{"Metric": k, "Value": v} for k, v in data_dict.items()]
@@ -79,54 +103,72 @@ def strategy_output_div(_):
     # )
 
 
-@callback(Output(IDS.STRATEGY.OUTPUT_BACKTEST_PLOT, "figure"), Input(IDS.STRATEGY.INPUTS_STORE, "data"))
-def plot_strategy_backtest(strategy_inputs):
-    model: BivariateEngleGranger = SINGLE_USER_INSTANCE[MODEL]
+@callback(
+    Output(IDS.JOBS.STRATEGY, "data"),
+    Output(IDS.JOBS.STRATEGY_INTERVAL, "disabled"),
+    Input(IDS.STRATEGY.INPUTS_STORE, "data"),
+    Input(IDS.GRAPHS.RESIDUAL, "figure"),
+    State(IDS.REGRESSION.INPUTS_STORE, "data"),
+    State(IDS.SESSION.ID, "data"),
+)
+def submit_backtest(strategy_inputs, _, regression_inputs, session_id):
+    model: BivariateEngleGranger = snapshot_session_model(session_id)
+    if strategy_inputs is None or getattr(model, "resids", None) is None:
+        raise exceptions.PreventUpdate  # strategy or regression still to be chosen
 
     inputs = unpack_strategy_inputs(strategy_inputs)
 
-    trading_strategy_results = model.backtest(strategy_inputs["strategy_type"], inputs, force_refresh=True)
+    job_id = JOBS.submit(
+        job_key(session_id, model.load_id, regression_inputs, strategy_inputs),
+        f"{session_id}:strategy",
+        run_backtest,
+        model,
+        strategy_inputs["strategy_type"],
+        inputs,
+    )
 
-    df = trading_strategy_results.get_backtest()
+    return job_id, False
 
-    fig = plotly.subplots.make_subplots(rows=2, cols=1, subplot_titles=("Backtest", "Cumulative Return"))
 
-    fig1 = px.line(df, y=["Residual"], title="Residual")
-
-    shapes = []
-    dates = df.index
-    for i, signal in enumerate(df["Signal"]):
-
-        if i != len(df) - 1:
-            colour = None
-            if signal == 1:
-                colour = "green"
-            elif signal == -1:
-                colour = "red"
-
-            shapes.append(
-                {
-                    "type": "rect",
-                    "xref": "x",
-                    "yref": "y1",
-                    "x0": dates[i],
-                    "y0": -abs(2 * df["Residual"].min()),
-                    "x1": dates[i + 1],
-                    "y1": abs(2 * df["Residual"].max()),
-                    "fillcolor": colour,
-                    "opacity": 0.2,
-                    "line_width": 0,
-                }
-            )
+@callback(
+    Output(IDS.STRATEGY.OUTPUT_BACKTEST_PLOT, "figure"),
+    Output(IDS.JOBS.STRATEGY_PROGRESS, "children"),
+    Output(IDS.JOBS.STRATEGY_INTERVAL, "disabled", allow_duplicate=True),
+    Input(IDS.JOBS.STRATEGY_INTERVAL, "n_intervals"),
+    State(IDS.JOBS.STRATEGY, "data"),
+    State(IDS.SESSION.ID, "data"),
+    prevent_initial_call=True,
+)
+def poll_backtest(_, job_id, session_id):
+    def render(result: dict):
+        apply_to_session_model(session_id, result["load_id"], backtest_results=result["results"])
+        return plot_strategy_backtest(result["results"])
+
+    return poll_job(job_id, render)
 
-    fig1.update_layout(title_text="Trading Strategy", height=800, shapes=shapes)
 
-    fig2 = px.line(df, y=["Cumulative_return"], title="Cumulative Return")
+def run_backtest(context: JobContext, model: BivariateEngleGranger, strategy_type, inputs) -> dict:
+    """Backtest on a snapshot of the session model, see snapshot_session_model."""
+    context.report(0.0, "Running backtest...")
 
-    for trace in fig1.data:
-        fig.add_traces(trace, rows=1, cols=1)
+    results = model.backtest(strategy_type, inputs, force_refresh=True)
 
-    for trace in fig2.data:
+    return {"load_id": model.load_id, "results": results}
+
+
+def plot_strategy_backtest(results: TradingStrategyResults):
+    fig = plotly.subplots.make_subplots(rows=2, cols=1, subplot_titles=("Backtest", "Cumulative Return"))
+
+    df = results.get_backtest()
+
+    # Bounds computed once, with one shape per position run rather than per row
+    y0 = -abs(2 * df["Residual"].min())
+    y1 = abs(2 * df["Residual"].max())
+    shapes = signal_shapes(df.index, df["Signal"].to_numpy(), y0, y1)
+
+    fig.add_traces(line_traces(df, ["Residual"]), rows=1, cols=1)
+
+    for trace in line_traces(df, ["Cumulative_return"]):
         trace.showlegend = False
         fig.add_traces(trace, rows=2, cols=1)
 
@@ -153,5 +195,9 @@ def unpack_strategy_inputs(strategy_inputs: dict):
                 strategy_inputs[IDS.STRATEGY.ID_ROLLING_WINDOW.LENGTH["property"]],
             )
         case StrategyEnum.OrnsteinUhlenbeckSDEFit:
-            raise NotImplementedError
+            return OrnsteinUhlenbeckSDEFitInputs(
+                strategy_inputs[IDS.STRATEGY.ID_OU_STRATEGY.ENTER["property"]],
+                strategy_inputs[IDS.STRATEGY.ID_OU_STRATEGY.EXIT["property"]],
+                strategy_inputs[IDS.STRATEGY.ID_OU_STRATEGY.LENGTH["property"]],
+            )
     raise NotImplementedError
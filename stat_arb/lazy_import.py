@@ -0,0 +1,35 @@
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Module __getattr__ and __dir__ (PEP 562) importing each export from its submodule on first access.
+
+    A package __init__ assigns these in place of eager imports, so importing the package, or one light
+    submodule of it, does not import every heavy dependency of its siblings.
+
+    Parameters
+    ----------
+    package : str
+        - __name__ of the package.
+    exports : dict
+        - Exported name to the relative submodule defining it, e.g. {"NaiveRegressor": ".naive_regressor"}.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(exports[name], package), name)
+        setattr(sys.modules[package], name, value)  # later lookups bypass __getattr__
+
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *exports})
+
+    return __getattr__, __dir__
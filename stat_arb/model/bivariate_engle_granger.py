@@ -1,14 +1,25 @@
 import datetime as dt
 import logging
+import uuid
+from typing import Optional
 
 import pandas as pd
 
 from stat_arb.model.data import DataHandlerEnum, DataHandlerFactory
-from stat_arb.model.regressor import NaiveRegressor, Regressor, RegressorEnum, RollingWindowRegressor
+from stat_arb.model.instrumentation import Profiler, instrumented
+from stat_arb.model.parameter_sweep import ParameterSweep
+from stat_arb.model.regressor import (
+    KalmanFilterRegressor,
+    NaiveRegressor,
+    Regressor,
+    RegressorEnum,
+    RollingWindowRegressor,
+)
 from stat_arb.model.regressor.naive_regressor import NaiveRegressorInputs
 from stat_arb.model.regressor.rolling_window_regressor import RollingWindowRegressorInputs
 from stat_arb.model.statistics import CointegratedAugmentedDickeyFuller, ErrorCorrectionModel
 from stat_arb.model.trading_strategy import (
+    OrnsteinUhlenbeckSDEFit,
     RollingWindow,
     StrategyEnum,
     ToyStrategy,
@@ -30,6 +41,7 @@ class BivariateEngleGranger:
         end_date: dt.datetime,
         live_start_date: dt.datetime,
         data_handler_enum: DataHandlerEnum,
+        profiler: Optional[Profiler] = None,
     ):
         self.ticker_a = ticker_a
         self.ticker_b = ticker_b
@@ -37,6 +49,8 @@ class BivariateEngleGranger:
         self.end_date = end_date
         self.live_start_date = live_start_date
         self.data_handler_enum = data_handler_enum
+        self.profiler = profiler  # stages are measured only when given a profiler
+        self.load_id = uuid.uuid4().hex  # tells apart models of the same inputs, e.g. resimulated prices
 
     def run(
         self, regressor_enum: RegressorEnum, regressor_inputs, strategy_enum: StrategyEnum, strategy_inputs
@@ -64,13 +78,20 @@ class BivariateEngleGranger:
 
         logger.info("Initiate Trading Strategy...")
 
-        return self.backtest(strategy_enum, strategy_inputs)
+        results = self.backtest(strategy_enum, strategy_inputs)
+
+        if self.profiler is not None:
+            logger.info(f"Stage profile:\n{self.profiler.summary().to_string()}")
 
+        return results
+
+    @instrumented
     def data_init(self) -> None:
         self.data_handler = DataHandlerFactory.create_data_handler(
             self.data_handler_enum, [self.ticker_a, self.ticker_b], self.start_date, self.end_date
         )
 
+    @instrumented
     def get_close_prices(self, normalise_prices=True) -> pd.DataFrame:
         if not getattr(self, "data_handler", None):
             self.data_init()
@@ -83,18 +104,22 @@ class BivariateEngleGranger:
         return self.close_prices
 
     def regressor_factory(self, regressor_enum: RegressorEnum) -> Regressor:
+        price_a, price_b = self.close_prices[self.ticker_a], self.close_prices[self.ticker_b]
+
+        regressor: Regressor
         match regressor_enum:
             case RegressorEnum.NAIVE:
-                regressor = NaiveRegressor
+                regressor = NaiveRegressor(price_a, price_b)
             case RegressorEnum.ROLLING_WINDOW:
-                regressor = RollingWindowRegressor
+                regressor = RollingWindowRegressor(price_a, price_b)
             case RegressorEnum.KALMAN_FILTER:
-                raise NotImplementedError
+                regressor = KalmanFilterRegressor(price_a, price_b)
 
-        self.regressor = regressor(self.close_prices[self.ticker_a], self.close_prices[self.ticker_b])
+        self.regressor = regressor
 
         return self.regressor
 
+    @instrumented
     def get_residual(self, regressor_enum: RegressorEnum, regressor_inputs):
         self.regressor_factory(regressor_enum)
 
@@ -102,6 +127,7 @@ class BivariateEngleGranger:
 
         return self.resids
 
+    @instrumented
     def test_cadf(self) -> bool:
         if self.resids.isna().any():
             logger.info("Dropping nan values for CADF stationarity test...")
@@ -109,27 +135,25 @@ class BivariateEngleGranger:
         cadf = CointegratedAugmentedDickeyFuller.test_stationarity(self.resids.dropna(), k_vars=2)
         return cadf.significant_at_five_pct()
 
+    @instrumented
     def test_ecm(self) -> bool:
-        index_start = 0
         if self.resids.isna().any():
-            logger.info("Dropping nan values for ECM mean reversion test...")
-            index_start = self.resids.isna().sum()
+            logger.info("Skipping nan values for ECM mean reversion test...")
 
         ecm = ErrorCorrectionModel.fit(
-            self.close_prices[self.ticker_a].iloc[index_start:],
-            self.close_prices[self.ticker_b].iloc[index_start:],
-            pd.Series(self.resids).iloc[index_start:],
+            self.close_prices[self.ticker_a], self.close_prices[self.ticker_b], self.resids
         )
         return ecm.is_long_run_mean_reverting()
 
     def trading_strategy_factory(self, strategy_enum: StrategyEnum) -> TradingStrategy:
+        strategy: type[TradingStrategy]
         match strategy_enum:
             case StrategyEnum.ToyStrategy:
                 strategy = ToyStrategy
             case StrategyEnum.RollingWindow:
                 strategy = RollingWindow
             case StrategyEnum.OrnsteinUhlenbeckSDEFit:
-                raise NotImplementedError
+                strategy = OrnsteinUhlenbeckSDEFit
 
         self.strategy = strategy(
             self.resids,
@@ -140,6 +164,7 @@ class BivariateEngleGranger:
 
         return self.strategy
 
+    @instrumented
     def backtest(
         self, strategy_type: StrategyEnum, strategy_inputs, force_refresh: bool = False
     ) -> TradingStrategyResults:
@@ -150,6 +175,23 @@ class BivariateEngleGranger:
 
         return self.backtest_results
 
+    def sweep(
+        self,
+        regressor_enum: RegressorEnum,
+        regressor_grid: list,
+        strategy_enum: StrategyEnum,
+        strategy_grid: list,
+        max_workers: Optional[int] = None,
+    ) -> pd.DataFrame:
+        if not hasattr(self, "close_prices"):
+            self.get_close_prices()
+
+        parameter_sweep = ParameterSweep(
+            self.close_prices[self.ticker_a], self.close_prices[self.ticker_b], max_workers
+        )
+
+        return parameter_sweep.run(regressor_enum, regressor_grid, strategy_enum, strategy_grid)
+
 
 if __name__ == "__main__":
     ticker_a = "MA"
@@ -158,7 +200,7 @@ if __name__ == "__main__":
     end = dt.datetime(2025, 1, 8)
     live = dt.datetime(2025, 1, 6)
     data_enum = DataHandlerEnum.SIMULATED
-    model = BivariateEngleGranger(ticker_a, ticker_b, start, end, live, data_enum)
+    model = BivariateEngleGranger(ticker_a, ticker_b, start, end, live, data_enum, Profiler())
 
     # strategy_type = StrategyEnum.ToyStrategy
     # strategy_inputs = ToyStrategyInputs(1, 0)
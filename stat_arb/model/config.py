@@ -1 +1,6 @@
+import os
+
 DB = "yfinance_analytics.db"
+COLUMNAR_STORE = "yfinance_columnar"
+JOBS_DIR = "stat_arb_jobs"
+PROFILE_DIR = os.environ.get("STAT_ARB_PROFILE_DIR")  # opt-in stage profiles of dashboard models
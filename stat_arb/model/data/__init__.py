@@ -1,5 +1,19 @@
-from .data_handler import BaseDataHandler
-from .data_handler_enum import DataHandlerEnum
-from .data_handler_factory import DataHandlerFactory
+from typing import TYPE_CHECKING
+
+from stat_arb.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .data_handler import BaseDataHandler
+    from .data_handler_enum import DataHandlerEnum
+    from .data_handler_factory import DataHandlerFactory
 
 __all__ = ["BaseDataHandler", "DataHandlerFactory", "DataHandlerEnum"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BaseDataHandler": ".data_handler",
+        "DataHandlerEnum": ".data_handler_enum",
+        "DataHandlerFactory": ".data_handler_factory",
+    },
+)
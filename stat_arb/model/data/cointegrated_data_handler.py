@@ -0,0 +1,54 @@
+import datetime as dt
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from stat_arb.model.data import BaseDataHandler
+from stat_arb.model.data.cointegration_simulator import (
+    CointegratedSimulation,
+    CointegrationParameters,
+    simulate_cointegrated,
+)
+
+
+class CointegratedDataHandler(BaseDataHandler):
+    """Simulated prices where every ticker but the last is cointegrated with the last."""
+
+    def __init__(
+        self,
+        tickers: list[str] | str,
+        start_date: dt.datetime | str,
+        end_date: dt.datetime | str,
+        params: Optional[CointegrationParameters] = None,
+        seed: Optional[int] = None,
+    ):
+        # Perform validation of input parameters
+        if not tickers:
+            raise ValueError("Tickers list cannot be empty.")
+        if isinstance(start_date, str):
+            start_date = dt.datetime.fromisoformat(start_date)
+        if isinstance(end_date, str):
+            end_date = dt.datetime.fromisoformat(end_date)
+        if end_date < start_date:
+            raise ValueError("End date must not be before start date")
+        if isinstance(tickers, str):
+            tickers = [tickers]
+        if len(tickers) < 2:
+            raise ValueError("At least two tickers are required to simulate a cointegrated basket")
+
+        self.tickers = tickers
+        self.start_date = start_date
+        self.end_date = end_date
+
+        self.params = params or CointegrationParameters()
+        self.rng = np.random.default_rng(seed)
+
+        self.ground_truth: Optional[CointegratedSimulation] = None
+
+    def _load_close_prices(self) -> pd.DataFrame:
+        period = pd.bdate_range(self.start_date, self.end_date)
+
+        self.ground_truth = simulate_cointegrated(1, len(period), len(self.tickers), self.params, self.rng)
+
+        return pd.DataFrame(self.ground_truth.prices[0], columns=self.tickers, index=period)
@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+from scipy.signal import lfilter
+
+
+@dataclass
+class CointegrationParameters:
+    """
+    Basket of dependent price series cointegrated with a common factor series.
+
+    Factor    : x_t = initial_price * exp(random walk with factor_drift and factor_volatility per annum)
+    Dependent : y_it = intercept_i + beta_it * x_t + s_it + noise * e_it
+    Spread    : s_it = phi * s_it-1 + spread_volatility * u_it, phi = 2^(-1 / half_life)
+    Beta      : beta_it = beta_it-1 + beta_drift * v_it, starting at beta_i
+    """
+
+    half_life: float = 20.0  # observations
+    beta: float | Sequence[float] = 1.0
+    intercept: float | Sequence[float] = 0.0
+    beta_drift: float = 0.0  # standard deviation of each beta step
+    spread_volatility: float = 1.0  # standard deviation of each spread innovation, in price units
+    noise: float = 0.0  # standard deviation of independent observation noise, in price units
+    factor_drift: float = 0.06
+    factor_volatility: float = 0.2
+    initial_price: float = 100.0
+    dt: float = 1 / 252
+
+
+@dataclass
+class CointegratedSimulation:
+    """Simulated prices with the ground truth that generated them, the last ticker being the factor."""
+
+    prices: np.ndarray  # shape (n_paths, n_period, n_ticker)
+    betas: np.ndarray  # shape (n_paths, n_period, n_ticker - 1)
+    intercepts: np.ndarray  # shape (n_ticker - 1,)
+    spreads: np.ndarray  # shape (n_paths, n_period, n_ticker - 1), excluding observation noise
+    phi: float  # AR(1) coefficient of the spreads
+    half_life: float
+
+    @property
+    def factor(self) -> np.ndarray:
+        return self.prices[..., -1]
+
+    @property
+    def mean_reversion_speed(self) -> float:
+        """Continuous time Ornstein Uhlenbeck speed per observation."""
+        return -np.log(self.phi)
+
+
+def simulate_cointegrated(
+    n_paths: int,
+    n_period: int,
+    n_ticker: int,
+    params: Optional[CointegrationParameters] = None,
+    rng: Optional[np.random.Generator] = None,
+) -> CointegratedSimulation:
+    """
+    Simulate n_paths independent baskets, each of n_ticker - 1 series cointegrated with the last ticker.
+
+    Every draw is made up front and the recursions are evaluated as cumulative sums and a linear filter
+    along the time axis, so the cost is a handful of array passes regardless of the number of paths.
+    """
+    if n_ticker < 2:
+        raise ValueError("At least two tickers are required to simulate a cointegrated basket")
+    if params is None:
+        params = CointegrationParameters()
+    if params.half_life <= 0:
+        raise ValueError("Half life must be positive")
+
+    rng = rng if rng is not None else np.random.default_rng()
+    n_dependent = n_ticker - 1
+
+    # Factor: geometric random walk
+    drift = (params.factor_drift - 0.5 * params.factor_volatility**2) * params.dt
+    volatility = params.factor_volatility * np.sqrt(params.dt)
+    log_steps = drift + volatility * rng.standard_normal((n_paths, n_period))
+    log_steps[:, 0] = 0.0
+    factor = params.initial_price * np.exp(np.cumsum(log_steps, axis=1))
+
+    # Spreads: AR(1) started from its stationary distribution
+    phi = 2 ** (-1 / params.half_life)
+    innovations = params.spread_volatility * rng.standard_normal((n_paths, n_period, n_dependent))
+    innovations[:, 0] /= np.sqrt(1 - phi**2)
+    spreads = lfilter([1.0], [1.0, -phi], innovations, axis=1)
+
+    # Betas: random walks around their starting values
+    beta_steps = params.beta_drift * rng.standard_normal((n_paths, n_period, n_dependent))
+    beta_steps[:, 0] = 0.0
+    betas = np.broadcast_to(np.asarray(params.beta, dtype=float), n_dependent) + np.cumsum(beta_steps, axis=1)
+
+    intercepts = np.broadcast_to(np.asarray(params.intercept, dtype=float), n_dependent).copy()
+
+    dependent = intercepts + betas * factor[..., None] + spreads
+    if params.noise:
+        dependent += params.noise * rng.standard_normal(dependent.shape)
+
+    prices = np.concatenate([dependent, factor[..., None]], axis=2)
+
+    return CointegratedSimulation(prices, betas, intercepts, spreads, phi, params.half_life)
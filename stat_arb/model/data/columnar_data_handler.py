@@ -0,0 +1,54 @@
+import datetime as dt
+import logging
+
+import pandas as pd
+
+from stat_arb.model.config import COLUMNAR_STORE
+from stat_arb.model.data.data_handler import BaseDataHandler
+from stat_arb.model.data.data_handler_enum import DataHandlerEnum
+from stat_arb.model.local_store.columnar_store import ColumnarStore
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnarDataHandler(BaseDataHandler):
+    def __init__(
+        self,
+        tickers: list[str] | str,
+        start_date: dt.datetime | str,
+        end_date: dt.datetime | str,
+        path: str = COLUMNAR_STORE,
+    ):
+        # Perform validation of input parameters
+        if not tickers:
+            raise ValueError("Tickers list cannot be empty.")
+        if isinstance(start_date, str):
+            start_date = dt.datetime.fromisoformat(start_date)
+        if isinstance(end_date, str):
+            end_date = dt.datetime.fromisoformat(end_date)
+        if end_date < start_date:
+            raise ValueError("End date must not be before start date")
+        if isinstance(tickers, str):
+            tickers = [tickers]
+
+        self.tickers = tickers
+        self.start_date = start_date
+        self.end_date = end_date
+        self.path = path
+
+        self.cache_source = f"{DataHandlerEnum.COLUMNAR.value}:{path}"
+
+    def _load_close_prices(self) -> pd.DataFrame:
+        store = ColumnarStore(self.path)
+        logger.info(f"Opened columnar store: {self.path}")
+
+        close = store.get_close_prices(self.tickers, self.start_date, self.end_date)
+        dates = store.get_dates(self.start_date, self.end_date)
+
+        # Ticker selection already gathered a new array, so wrap it without a second copy
+        df = pd.DataFrame(close, index=dates, columns=pd.Index(self.tickers), copy=False)
+
+        # clean gaps in timeseries with ffill
+        df.ffill(inplace=True)
+
+        return df
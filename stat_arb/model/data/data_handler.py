@@ -1,15 +1,92 @@
+import datetime as dt
 from abc import ABC, abstractmethod
+from typing import Callable, Optional
 
+import numpy as np
 import pandas as pd
 
+from stat_arb.model.data.price_cache import PRICE_CACHE, PriceCacheKey
+
 
 class BaseDataHandler(ABC):
-    """Interface to define DataHandler contract."""
+    """
+    Interface to define DataHandler contract.
+
+    Concrete handlers implement _load_close_prices. The raw close price panel is loaded once per handler and
+    the normalised, returns and log price views are derived from it lazily, until invalidated.
+
+    Handlers naming a cache_source share panels through the process wide PRICE_CACHE, so requests for the
+    same tickers over an already loaded date range are sliced from memory rather than reloaded.
+    """
+
+    tickers: list[str]
+    start_date: dt.datetime
+    end_date: dt.datetime
+
+    cache_source: Optional[str] = None
+    inclusive_end_date: bool = True
+
+    _close: Optional[pd.DataFrame] = None
+    _views: Optional[dict[str, pd.DataFrame]] = None
 
     @abstractmethod
-    def get_close_prices(self) -> pd.DataFrame:
+    def _load_close_prices(self) -> pd.DataFrame:
+        """Load the raw date x ticker close price panel from the underlying source."""
         pass
 
-    @abstractmethod
+    def get_close_prices(self) -> pd.DataFrame:
+        """Raw close price panel, shared by every caller of this handler so it must not be edited in place."""
+        if self._close is None:
+            self._close = self._load_shared_close_prices()
+            self._views = {}
+
+        return self._close
+
     def get_normalised_close_prices(self) -> pd.DataFrame:
-        pass
+        return self._view("normalised", lambda close: close.div(close.iloc[0], axis=1))
+
+    def get_returns(self) -> pd.DataFrame:
+        return self._view("returns", lambda close: close.pct_change())
+
+    def get_log_prices(self) -> pd.DataFrame:
+        return self._view("log_prices", lambda close: close.apply(np.log))
+
+    def invalidate(self) -> None:
+        """Drop the handler's panel and views so the next access reloads them, via the shared cache."""
+        self._close = None
+        self._views = None
+
+    def refresh(self) -> pd.DataFrame:
+        """Reload the raw close price panel from the source, bypassing and updating the shared cache."""
+        if self.cache_source is not None:
+            PRICE_CACHE.evict(self.cache_source, self.tickers)
+
+        self.invalidate()
+        return self.get_close_prices()
+
+    def _load_shared_close_prices(self) -> pd.DataFrame:
+        if self.cache_source is None:
+            return self._load_close_prices()
+
+        end_date = pd.Timestamp(self.end_date)
+        if not self.inclusive_end_date:
+            end_date -= pd.Timedelta(1, "ns")
+
+        key = PriceCacheKey(self.cache_source, tuple(self.tickers), pd.Timestamp(self.start_date), end_date)
+
+        close = PRICE_CACHE.get(key)
+        if close is None:
+            close = self._load_close_prices()
+            PRICE_CACHE.put(key, close)
+
+        return close
+
+    def _view(self, name: str, derive: Callable[[pd.DataFrame], pd.DataFrame]) -> pd.DataFrame:
+        close = self.get_close_prices()
+        if self._views is None:
+            raise RuntimeError("Unexpected None: views were expected to be initialised with the close prices")
+
+        if name not in self._views:
+            self._views[name] = derive(close)
+
+        return self._views[name]
@@ -4,7 +4,9 @@ from enum import StrEnum
 class DataHandlerEnum(StrEnum):
     YAHOO = "Yahoo"
     SIMULATED = "Simulated"
+    SIMULATED_COINTEGRATED = "Simulated Cointegrated"
     LOCAL = "Local"
+    COLUMNAR = "Columnar"
 
 
 def get_enum_from_str(x: str) -> DataHandlerEnum:
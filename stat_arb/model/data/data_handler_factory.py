@@ -3,15 +3,12 @@ import logging
 
 from stat_arb.model.data import BaseDataHandler
 from stat_arb.model.data.data_handler_enum import DataHandlerEnum
-from stat_arb.model.data.local_data_handler import LocalDataHandler
-from stat_arb.model.data.simulated_data_handler import SimulatedDataHandler
-from stat_arb.model.data.yahoo_finance_data_handler import YahooFinanceDataHandler
 
 logger = logging.getLogger(__name__)
 
 
 class DataHandlerFactory:
-    """Factory class to instantiate the appropriate DataHandler."""
+    """Factory class to instantiate the appropriate DataHandler, importing only the handler requested."""
 
     @staticmethod
     def create_data_handler(
@@ -19,12 +16,28 @@ class DataHandlerFactory:
     ) -> BaseDataHandler:
         if identifier == DataHandlerEnum.YAHOO:
             logger.info(f"Creating DataHandler type: {DataHandlerEnum.YAHOO.value}")
+            from stat_arb.model.data.yahoo_finance_data_handler import YahooFinanceDataHandler
+
             return YahooFinanceDataHandler(tickers, start_date, end_date)
         elif identifier == DataHandlerEnum.SIMULATED:
             logger.info(f"Creating DataHandler type: {DataHandlerEnum.SIMULATED.value}")
+            from stat_arb.model.data.simulated_data_handler import SimulatedDataHandler
+
             return SimulatedDataHandler(tickers, start_date, end_date)
+        elif identifier == DataHandlerEnum.SIMULATED_COINTEGRATED:
+            logger.info(f"Creating DataHandler type: {DataHandlerEnum.SIMULATED_COINTEGRATED.value}")
+            from stat_arb.model.data.cointegrated_data_handler import CointegratedDataHandler
+
+            return CointegratedDataHandler(tickers, start_date, end_date)
         elif identifier == DataHandlerEnum.LOCAL:
             logger.info(f"Creating DataHandler type: {DataHandlerEnum.LOCAL.value}")
+            from stat_arb.model.data.local_data_handler import LocalDataHandler
+
             return LocalDataHandler(tickers, start_date, end_date)
+        elif identifier == DataHandlerEnum.COLUMNAR:
+            logger.info(f"Creating DataHandler type: {DataHandlerEnum.COLUMNAR.value}")
+            from stat_arb.model.data.columnar_data_handler import ColumnarDataHandler
+
+            return ColumnarDataHandler(tickers, start_date, end_date)
         else:
             raise ValueError(f"Unknown data handler identifier: {identifier}")
@@ -1,17 +1,24 @@
 import datetime as dt
 import logging
-import sqlite3
 
 import pandas as pd
 
 from stat_arb.model.config import DB
 from stat_arb.model.data.data_handler import BaseDataHandler
+from stat_arb.model.data.data_handler_enum import DataHandlerEnum
+from stat_arb.model.local_store.yfinance_cache.database_util import connect, read_close_prices
 
 logger = logging.getLogger(__name__)
 
 
 class LocalDataHandler(BaseDataHandler):
-    def __init__(self, tickers: list[str] | str, start_date: dt.datetime | str, end_date: dt.datetime | str):
+    def __init__(
+        self,
+        tickers: list[str] | str,
+        start_date: dt.datetime | str,
+        end_date: dt.datetime | str,
+        db: str = DB,
+    ):
         # Perform validation of input parameters
         if not tickers:
             raise ValueError("Tickers list cannot be empty.")
@@ -27,45 +34,25 @@ class LocalDataHandler(BaseDataHandler):
         self.tickers = tickers
         self.start_date = start_date
         self.end_date = end_date
+        self.db = db
 
-    def get_close_prices(self) -> pd.DataFrame:
-        conn = sqlite3.connect(DB)
-        logger.info(f"Connected to database: {DB}")
+        self.cache_source = f"{DataHandlerEnum.LOCAL.value}:{db}"
 
-        dfs = []
-        for ticker in self.tickers:
-            df: pd.DataFrame = pd.read_sql_query(
-                f"""SELECT Date, Close FROM '{ticker}' WHERE
-                (Date >= '{self.start_date.strftime("%Y-%m-%d")}') AND
-                (Date <= '{self.end_date.strftime("%Y-%m-%d")}')
-                """,
-                conn,
-            )
+    def _load_close_prices(self) -> pd.DataFrame:
+        conn = connect(self.db)
+        logger.info(f"Connected to database: {self.db}")
 
-            logger.info(f"Queried local database for ticker: {ticker}")
-
-            df.set_index("Date", inplace=True)
-
-            dfs.append(df)
+        df = read_close_prices(conn, self.tickers, self.start_date, self.end_date)
+        logger.info(f"Queried local database for tickers: {self.tickers}")
 
         conn.close()
-        logger.info(f"Disconnected from database: {DB}")
-
-        df = pd.concat(dfs, axis=1, join="outer")
+        logger.info(f"Disconnected from database: {self.db}")
 
         # clean gaps in timeseries with ffill
         df.ffill(inplace=True)
 
-        df.index = pd.Index([pd.to_datetime(date) for date in df.index])
-
-        df.columns = pd.Index(self.tickers)
-
         return df
 
-    def get_normalised_close_prices(self) -> pd.DataFrame:
-        df = self.get_close_prices()
-        return df.div(df.iloc[0], axis=1)
-
 
 if __name__ == "__main__":
     start = "2025-01-01"
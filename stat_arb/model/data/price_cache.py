@@ -0,0 +1,111 @@
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MAX_BYTES = 256 * 1024**2
+
+
+@dataclass(frozen=True)
+class PriceCacheKey:
+    source: str
+    tickers: tuple[str, ...]
+    start_date: pd.Timestamp
+    end_date: pd.Timestamp  # inclusive
+
+    def covers(self, other: "PriceCacheKey") -> bool:
+        return (
+            self.source == other.source
+            and self.start_date <= other.start_date
+            and self.end_date >= other.end_date
+            and set(other.tickers) == set(self.tickers)
+        )
+
+
+@dataclass
+class PriceCacheStats:
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+
+
+class PriceCache:
+    """
+    Process wide LRU cache of close price panels keyed by (source, tickers, date range).
+
+    A request is answered from any cached panel of the same source and tickers spanning its date range, by
+    slicing the date range. Panels are not sliced to a subset of their tickers, as loaders align tickers on
+    the union of their dates and forward fill, so the subset would keep rows and fills of the other tickers.
+    Least recently used panels are evicted once the total size exceeds max_bytes.
+
+    Panels are copied on the way in and out, so a caller editing its frame in place cannot corrupt the panel
+    seen by every other session.
+    """
+
+    def __init__(self, max_bytes: int = MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict[PriceCacheKey, pd.DataFrame] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: PriceCacheKey) -> Optional[pd.DataFrame]:
+        with self._lock:
+            for cached_key in reversed(self._entries):
+                if cached_key.covers(key):
+                    self._entries.move_to_end(cached_key)
+                    self.hits += 1
+
+                    close = self._entries[cached_key]
+                    if cached_key == key:
+                        return close.copy()
+                    return close.loc[key.start_date : key.end_date, list(key.tickers)]  # noqa: E203
+
+            self.misses += 1
+            return None
+
+    def put(self, key: PriceCacheKey, close: pd.DataFrame) -> None:
+        with self._lock:
+            # Panels answerable from the new one are redundant
+            for cached_key in [x for x in self._entries if key.covers(x)]:
+                del self._entries[cached_key]
+
+            self._entries[key] = close.copy()
+            self._evict()
+
+    def evict(self, source: str, tickers: list[str]) -> None:
+        """Remove every panel of the source holding any of the tickers."""
+        with self._lock:
+            for cached_key in [
+                x for x in self._entries if x.source == source and set(tickers) & set(x.tickers)
+            ]:
+                del self._entries[cached_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> PriceCacheStats:
+        with self._lock:
+            return PriceCacheStats(self.hits, self.misses, len(self._entries), self._bytes())
+
+    def _bytes(self) -> int:
+        return sum(int(x.memory_usage(deep=False).sum()) for x in self._entries.values())
+
+    def _evict(self) -> None:
+        # Always keep the most recent panel, even if it alone exceeds the bound
+        while len(self._entries) > 1 and self._bytes() > self.max_bytes:
+            cached_key, _ = self._entries.popitem(last=False)
+            logger.info(f"Evicted {len(cached_key.tickers)} tickers from price cache: {cached_key.source}")
+
+
+PRICE_CACHE = PriceCache()
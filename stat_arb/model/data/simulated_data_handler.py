@@ -1,4 +1,5 @@
 import datetime as dt
+from typing import Optional
 
 import numpy as np
 import pandas as pd
@@ -13,6 +14,7 @@ class SimulatedDataHandler(BaseDataHandler):
         start_date: dt.datetime | str,
         end_date: dt.datetime | str,
         corr: float = 0.7,
+        seed: Optional[int] = None,
     ):
         # Perform validation of input parameters
         if not tickers:
@@ -35,54 +37,45 @@ class SimulatedDataHandler(BaseDataHandler):
         self.sigma = 0.2
         self.dt = 1 / 252
 
-    def get_close_prices(self) -> pd.DataFrame:
-        period: list[pd.Timestamp] = self.get_dates()
+        self.rng = np.random.default_rng(seed)
+
+    def _load_close_prices(self) -> pd.DataFrame:
+        period: pd.DatetimeIndex = self.get_dates()
 
         n_period: int = len(period)
         n_ticker: int = len(self.tickers)
 
         prices: np.ndarray = self.simulate_gbm(n_period, n_ticker)
 
-        self.prices_df: pd.DataFrame = pd.DataFrame(prices, columns=self.tickers, index=period)
-
-        return self.prices_df
-
-    def _check_prices_exist(self) -> bool:
-        return hasattr(self, "prices_df")
+        return pd.DataFrame(prices, columns=self.tickers, index=period)
 
     def simulate_gbm(self, n_period, n_ticker) -> np.ndarray:
-        rng: np.ndarray = self.get_correlated_random_numbers(n_period, n_ticker)
+        return self.simulate_paths(1, n_period, n_ticker)[0]
 
-        prices = np.ones((n_period, n_ticker)) * 100
+    def simulate_paths(self, n_paths: int, n_period: int, n_ticker: int) -> np.ndarray:
+        """
+        Correlated GBM paths of shape (n_paths, n_period, n_ticker) starting at 100.
 
-        for row in range(1, n_period):
-            dX = np.sqrt(self.dt) * rng[row, :]
-            prices[row, :] = prices[row - 1, :] * (1 + self.mu * self.dt + self.sigma * dX)
+        Each Euler Maruyama step is a gross return, so the paths are a single cumulative product over time.
+        """
+        rng: np.ndarray = self.get_correlated_random_numbers(n_period, n_ticker, n_paths)
 
-        return prices
+        gross_returns = 1 + self.mu * self.dt + self.sigma * np.sqrt(self.dt) * rng
+        gross_returns[:, 0, :] = 100
 
-    def get_correlated_random_numbers(self, rows, cols) -> np.ndarray:
-        rand: np.ndarray = np.random.normal(size=[rows, cols])
-        rand[:, 1:] = rand[:, 0].reshape((-1, 1)) * self.corr + np.sqrt(1 - self.corr**2) * rand[:, 1:]
+        return np.cumprod(gross_returns, axis=1)
 
-        return rand
+    def get_correlated_random_numbers(self, rows, cols, n_paths: Optional[int] = None) -> np.ndarray:
+        """Standard normals with every column correlated to the first, of shape ([n_paths,] rows, cols)."""
+        size = (rows, cols) if n_paths is None else (n_paths, rows, cols)
 
-    def get_dates(self) -> list[pd.Timestamp]:
-        period: pd.DatetimeIndex = pd.date_range(self.start_date, self.end_date)
-        weekdays: list[pd.Timestamp] = [date for date in period if self.is_weekday(date)]
+        rand: np.ndarray = self.rng.standard_normal(size=size)
+        rand[..., 1:] = rand[..., :1] * self.corr + np.sqrt(1 - self.corr**2) * rand[..., 1:]
 
-        return weekdays
-
-    def is_weekday(self, date: pd.Timestamp) -> bool:
-        return date.dayofweek not in [5, 6]
-
-    def get_normalised_close_prices(self) -> pd.DataFrame:
-        if self._check_prices_exist():
-            close = self.prices_df
-        else:
-            close = self.get_close_prices()
+        return rand
 
-        return close.div(close.iloc[0])
+    def get_dates(self) -> pd.DatetimeIndex:
+        return pd.bdate_range(self.start_date, self.end_date)
 
 
 if __name__ == "__main__":
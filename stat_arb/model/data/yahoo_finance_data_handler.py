@@ -6,6 +6,7 @@ import pandas as pd
 import yfinance as yf
 
 from stat_arb.model.data import BaseDataHandler
+from stat_arb.model.data.data_handler_enum import DataHandlerEnum
 
 
 def lazy_load_data(func):
@@ -21,6 +22,9 @@ def lazy_load_data(func):
 
 
 class YahooFinanceDataHandler(BaseDataHandler):
+    cache_source = DataHandlerEnum.YAHOO.value
+    inclusive_end_date = False  # yfinance end date is exclusive
+
     def __init__(self, tickers: list[str] | str, start_date: dt.datetime | str, end_date: dt.datetime | str):
         # Perform validation of input parameters
         if not tickers:
@@ -61,8 +65,8 @@ class YahooFinanceDataHandler(BaseDataHandler):
         return self._data
 
     @lazy_load_data
-    def get_close_prices(self) -> pd.DataFrame:
-        """Public getter method to access close price data."""
+    def _load_close_prices(self) -> pd.DataFrame:
+        """Close price cross section of the full data."""
         if self._data is None:
             raise RuntimeError("Unexpected None: data was expected to be loaded")
 
@@ -73,9 +77,9 @@ class YahooFinanceDataHandler(BaseDataHandler):
 
         return close
 
-    def get_normalised_close_prices(self) -> pd.DataFrame:
-        close = self.get_close_prices()
-        return close.div(close.iloc[0])
+    def invalidate(self) -> None:
+        super().invalidate()
+        self._data = None
 
 
 if __name__ == "__main__":
@@ -0,0 +1,195 @@
+import functools
+import json
+import logging
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# tracemalloc is process wide, so whether it is running and which stages are open is shared by every profiler
+_TRACING_LOCK = threading.Lock()
+_OPEN_PEAKS: list[list[int]] = []  # absolute peak seen so far by each open stage of any thread or profiler
+_tracing_stages = 0
+_started_tracing = False
+
+
+@dataclass
+class StageMeasurement:
+    name: str
+    wall_seconds: float
+    cpu_seconds: float  # CPU time of the calling thread, so time spent waiting on I/O shows as wall - cpu
+    peak_bytes: int  # peak traced allocation above the stage's starting point
+    depth: int  # nesting level, 0 for a stage called directly
+    started: float  # unix timestamp
+
+
+class Profiler:
+    """
+    Opt-in measurement of model stages: wall clock time, CPU time and peak allocation per stage.
+
+    Allocation is measured with tracemalloc, started while any profiler has a stage open when not already
+    tracing. tracemalloc traces the whole process and has a single peak, so every open stage, of any thread
+    or profiler, absorbs the current peak before a new stage resets it. Hence stages running concurrently on
+    other threads inflate each other's peak, but never lose their own. Stages nest, a stage calling another
+    includes it in its own measurement.
+
+    When given a directory the report is rewritten to <directory>/<run_id>.json after every stage, so a long
+    running process leaves a current record without being asked for one.
+    """
+
+    def __init__(self, directory: Optional[str | Path] = None, trace_memory: bool = True):
+        self.run_id = uuid.uuid4().hex
+        self.directory = Path(directory) if directory is not None else None
+        self.trace_memory = trace_memory
+
+        self.stages: list[StageMeasurement] = []
+
+        self._local = threading.local()  # stack of each thread's open stages, for their depth
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        stack: list[list[int]] = self._local.__dict__.setdefault("stack", [])
+
+        peak = self._enter_tracing()
+        stack.append(peak)
+        start_bytes = peak[0]
+
+        started = time.time()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+
+        try:
+            yield
+        finally:
+            wall_seconds = time.perf_counter() - wall_start
+            cpu_seconds = time.thread_time() - cpu_start
+
+            stack.pop()
+            peak_bytes = self._exit_tracing(peak)
+
+            measurement = StageMeasurement(
+                name, wall_seconds, cpu_seconds, max(peak_bytes - start_bytes, 0), len(stack), started
+            )
+            with self._lock:
+                self.stages.append(measurement)
+
+            logger.debug(f"Stage {name}: {wall_seconds:.4f}s wall, {cpu_seconds:.4f}s cpu")
+
+            if self.directory is not None:
+                self.export()
+
+    def report(self) -> pd.DataFrame:
+        """One row per completed stage, in order of completion."""
+        with self._lock:
+            rows = [asdict(x) for x in self.stages]
+
+        return pd.DataFrame(rows, columns=list(StageMeasurement.__dataclass_fields__))
+
+    def summary(self) -> pd.DataFrame:
+        """Totals per stage name, slowest first."""
+        return (
+            self.report()
+            .groupby("name")
+            .agg(
+                calls=("wall_seconds", "size"),
+                wall_seconds=("wall_seconds", "sum"),
+                cpu_seconds=("cpu_seconds", "sum"),
+                peak_bytes=("peak_bytes", "max"),
+            )
+            .sort_values("wall_seconds", ascending=False)
+        )
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            stages = [asdict(x) for x in self.stages]
+
+        return {"run_id": self.run_id, "stages": stages}
+
+    def export(self, path: Optional[str | Path] = None) -> Path:
+        """Write the report as JSON, by default to <directory>/<run_id>.json."""
+        if path is None:
+            if self.directory is None:
+                raise ValueError("No export path given and profiler has no directory")
+            path = self.directory / f"{self.run_id}.json"
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.to_dict(), indent=2))
+        tmp.replace(path)
+
+        return path
+
+    def _enter_tracing(self) -> list[int]:
+        """
+        Open a stage, returning its peak cell which starts at the current allocation. Peak tracking restarts
+        from here, once every open stage has absorbed the peak so far.
+        """
+        global _tracing_stages, _started_tracing
+
+        if not self.trace_memory:
+            return [0]
+
+        with _TRACING_LOCK:
+            if _tracing_stages == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _started_tracing = True
+            _tracing_stages += 1
+
+            _fold_peak()
+            tracemalloc.reset_peak()
+
+            peak = [tracemalloc.get_traced_memory()[0]]
+            _OPEN_PEAKS.append(peak)
+
+        return peak
+
+    def _exit_tracing(self, peak: list[int]) -> int:
+        """Close a stage, returning its absolute peak allocation."""
+        global _tracing_stages, _started_tracing
+
+        if not self.trace_memory:
+            return 0
+
+        with _TRACING_LOCK:
+            _fold_peak()
+            del _OPEN_PEAKS[next(i for i, x in enumerate(_OPEN_PEAKS) if x is peak)]
+
+            _tracing_stages -= 1
+            if _tracing_stages == 0 and _started_tracing:
+                tracemalloc.stop()
+                _started_tracing = False
+
+        return peak[0]
+
+
+def _fold_peak() -> None:
+    """Carry the traced peak since the last reset into every open stage. Called holding _TRACING_LOCK."""
+    traced_peak = tracemalloc.get_traced_memory()[1]
+    for peak in _OPEN_PEAKS:
+        peak[0] = max(peak[0], traced_peak)
+
+
+def instrumented(func: Callable) -> Callable:
+    """Measure a method as a stage of its instance's profiler, a plain call when the profiler is None."""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        profiler: Optional[Profiler] = getattr(self, "profiler", None)
+        if profiler is None:
+            return func(self, *args, **kwargs)
+
+        with profiler.stage(func.__name__):
+            return func(self, *args, **kwargs)
+
+    return wrapper
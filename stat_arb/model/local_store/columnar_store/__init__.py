@@ -0,0 +1,16 @@
+from typing import TYPE_CHECKING
+
+from stat_arb.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .columnar_store import ColumnarStore, write_columnar_store
+
+__all__ = ["ColumnarStore", "write_columnar_store"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ColumnarStore": ".columnar_store",
+        "write_columnar_store": ".columnar_store",
+    },
+)
@@ -0,0 +1,25 @@
+import datetime as dt
+import logging
+
+from stat_arb.model.config import DB
+from stat_arb.model.data.local_data_handler import LocalDataHandler
+from stat_arb.model.local_store.columnar_store import write_columnar_store
+from stat_arb.model.local_store.yfinance_cache.database_util import connect, list_tickers
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Convert every ticker in the local database to the columnar store."""
+    conn = connect(DB)
+    tickers = list_tickers(conn)
+    conn.close()
+
+    logger.info(f"Converting {len(tickers)} tickers from local database: {DB}")
+
+    dt_start = dt.datetime(2000, 1, 1)
+    dt_end = dt.datetime.today()
+
+    close = LocalDataHandler(tickers, dt_start, dt_end).get_close_prices()
+
+    write_columnar_store(close)
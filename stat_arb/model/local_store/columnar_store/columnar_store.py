@@ -0,0 +1,78 @@
+import datetime as dt
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from stat_arb.model.config import COLUMNAR_STORE
+
+logger = logging.getLogger(__name__)
+
+CLOSE_FILE = "close.npy"
+DATES_FILE = "dates.npy"
+TICKERS_FILE = "tickers.npy"
+
+
+def write_columnar_store(close: pd.DataFrame, path: str | Path = COLUMNAR_STORE) -> None:
+    """
+    Write a wide date x ticker close price panel as memory-mappable arrays.
+
+    Prices are stored column-major so each ticker's history is contiguous on disk, alongside the shared
+    trading calendar and ticker labels.
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    close = close.sort_index()
+
+    np.save(path / CLOSE_FILE, np.asfortranarray(close.to_numpy(dtype=np.float64)))
+    np.save(path / DATES_FILE, close.index.to_numpy(dtype="datetime64[ns]"))
+    np.save(path / TICKERS_FILE, close.columns.to_numpy(dtype=str))
+
+    logger.info(f"Written {close.shape[1]} tickers x {close.shape[0]} dates to columnar store: {path}")
+
+
+class ColumnarStore:
+    """
+    Read only view of a columnar store, memory-mapped so only the requested slices are paged in.
+
+    get_close_view slices a date range without copying. get_close_prices also selects tickers, which gathers
+    the requested columns into one new array, reading only their pages.
+    """
+
+    def __init__(self, path: str | Path = COLUMNAR_STORE):
+        path = Path(path)
+        if not (path / CLOSE_FILE).exists():
+            raise FileNotFoundError(f"Columnar store not found: {path}")
+
+        self.close = np.load(path / CLOSE_FILE, mmap_mode="r")
+        self.dates = np.load(path / DATES_FILE)
+        self.tickers = np.load(path / TICKERS_FILE)
+
+        self._columns = {ticker: i for i, ticker in enumerate(self.tickers)}
+
+    def get_close_prices(
+        self, tickers: list[str], start_date: dt.datetime, end_date: dt.datetime
+    ) -> np.ndarray:
+        """Close prices of shape (n_dates, n_tickers) between start and end date inclusive, as a new array."""
+        missing = [x for x in tickers if x not in self._columns]
+        if missing:
+            raise KeyError(f"Tickers missing from columnar store: {missing}")
+
+        rows = self._date_slice(start_date, end_date)
+        columns = [self._columns[x] for x in tickers]
+
+        return self.close[rows, columns]
+
+    def get_close_view(self, start_date: dt.datetime, end_date: dt.datetime) -> np.ndarray:
+        """Every ticker's close prices between start and end date inclusive, as a read only view."""
+        return self.close[self._date_slice(start_date, end_date)]
+
+    def get_dates(self, start_date: dt.datetime, end_date: dt.datetime) -> pd.DatetimeIndex:
+        return pd.DatetimeIndex(self.dates[self._date_slice(start_date, end_date)])
+
+    def _date_slice(self, start_date: dt.datetime, end_date: dt.datetime) -> slice:
+        start = np.searchsorted(self.dates, np.datetime64(start_date, "ns"), side="left")
+        end = np.searchsorted(self.dates, np.datetime64(end_date, "ns"), side="right")
+        return slice(start, end)
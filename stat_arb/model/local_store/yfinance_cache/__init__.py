@@ -1,3 +1,16 @@
-from .yfinance_cache import store_sp500_data
+from typing import TYPE_CHECKING
 
-__all__ = ["store_sp500_data"]
+from stat_arb.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .yfinance_cache import refresh_sp500_data, store_sp500_data
+
+__all__ = ["refresh_sp500_data", "store_sp500_data"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "refresh_sp500_data": ".yfinance_cache",
+        "store_sp500_data": ".yfinance_cache",
+    },
+)
@@ -1,18 +1,180 @@
-if __name__ == "__main__":
-    import sqlite3
+import datetime as dt
+import logging
+import sqlite3
 
-    import yfinance as yf
+import numpy as np
+import pandas as pd
 
-    from stat_arb.model.config import DB
+from stat_arb.model.config import DB
 
-    conn = sqlite3.connect(DB)
+logger = logging.getLogger(__name__)
 
-    c = conn.cursor()
+PRICES_TABLE = "prices"
+PROGRESS_TABLE = "refresh_progress"
+PRICE_COLUMNS = ["open", "high", "low", "close", "volume"]
 
-    if False:
-        data = yf.download("AMZN", "2024-01-01", "2025-01-01", multi_level_index=False)
+PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "mmap_size": 1 << 30,  # bytes
+    "cache_size": -(1 << 18),  # negative values are KiB i.e. 256 MiB
+}
 
-        data.to_sql("AMZN", conn, if_exists="replace")
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS {PRICES_TABLE} (
+    ticker TEXT NOT NULL,
+    date INTEGER NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    volume REAL,
+    PRIMARY KEY (ticker, date)
+) WITHOUT ROWID;
 
-    conn.close()
-    pass
+CREATE TABLE IF NOT EXISTS {PROGRESS_TABLE} (
+    ticker TEXT PRIMARY KEY,
+    end_date INTEGER NOT NULL
+);
+"""
+
+
+def connect(db: str = DB) -> sqlite3.Connection:
+    """
+    Connect to the local price database, creating the long format schema on first use.
+
+    Legacy per-ticker tables are left alone, migrate them once with migrate_legacy_tables.
+    """
+    conn = sqlite3.connect(db)
+
+    for pragma, value in PRAGMAS.items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+
+    conn.executescript(SCHEMA)
+
+    return conn
+
+
+def to_epoch(dates) -> np.ndarray:
+    """Seconds since the unix epoch of each date."""
+    return np.asarray(pd.DatetimeIndex(dates).as_unit("s")).view(np.int64)
+
+
+def from_epoch(epochs) -> pd.DatetimeIndex:
+    return pd.to_datetime(np.asarray(epochs, dtype=np.int64), unit="s")
+
+
+def write_prices(conn: sqlite3.Connection, ticker: str, df: pd.DataFrame, replace: bool = True) -> int:
+    """
+    Write a yfinance OHLCV frame indexed by date for one ticker, returning the number of rows written.
+
+    Existing rows of the ticker are removed first when replacing, otherwise rows are upserted by date.
+    Commits are left to the caller so a batch of tickers can be written in one transaction.
+    """
+    df = df.rename(columns=str.lower).reindex(columns=PRICE_COLUMNS)
+    df = df.astype(float).replace({np.nan: None})
+
+    rows = zip([ticker] * len(df), to_epoch(df.index).tolist(), *(df[x].tolist() for x in PRICE_COLUMNS))
+
+    if replace:
+        conn.execute(f"DELETE FROM {PRICES_TABLE} WHERE ticker = ?", (ticker,))
+
+    conn.executemany(f"INSERT OR REPLACE INTO {PRICES_TABLE} VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    return len(df)
+
+
+def read_close_prices(
+    conn: sqlite3.Connection, tickers: list[str], start_date: dt.datetime, end_date: dt.datetime
+) -> pd.DataFrame:
+    """Close prices of the tickers between start and end date inclusive as a wide date x ticker frame."""
+    placeholders = ", ".join("?" * len(tickers))
+    query = f"""
+        SELECT ticker, date, close FROM {PRICES_TABLE}
+        WHERE ticker IN ({placeholders}) AND date BETWEEN ? AND ?
+    """
+    params = [*tickers, *to_epoch([start_date, end_date]).tolist()]
+
+    rows = conn.execute(query, params).fetchall()
+    ticker, date, close = zip(*rows) if rows else ((), (), ())
+
+    # Vectorised pivot onto the union of dates, then onto the requested tickers which may repeat
+    unique_tickers = pd.Index(tickers).unique()
+    dates, row = np.unique(np.asarray(date, dtype=np.int64), return_inverse=True)
+    column = unique_tickers.get_indexer(pd.Index(list(ticker)))
+
+    values = np.full((len(dates), len(unique_tickers)), np.nan)
+    values[row, column] = np.asarray(close, dtype=float)
+
+    df = pd.DataFrame(values, index=from_epoch(dates), columns=unique_tickers)
+
+    return df if len(unique_tickers) == len(tickers) else df[list(tickers)]
+
+
+def list_tickers(conn: sqlite3.Connection) -> list[str]:
+    return [x[0] for x in conn.execute(f"SELECT DISTINCT ticker FROM {PRICES_TABLE} ORDER BY ticker")]
+
+
+def last_dates(conn: sqlite3.Connection) -> dict[str, pd.Timestamp]:
+    """Last stored date of each ticker, read off the primary key index."""
+    rows = conn.execute(f"SELECT ticker, MAX(date) FROM {PRICES_TABLE} GROUP BY ticker").fetchall()
+    return {ticker: pd.Timestamp(date, unit="s") for ticker, date in rows}
+
+
+def refreshed_tickers(conn: sqlite3.Connection, end_date: dt.datetime) -> set[str]:
+    """Tickers already refreshed up to at least the end date, so an interrupted refresh can resume."""
+    rows = conn.execute(
+        f"SELECT ticker FROM {PROGRESS_TABLE} WHERE end_date >= ?", (int(to_epoch([end_date])[0]),)
+    )
+    return {x[0] for x in rows}
+
+
+def record_progress(conn: sqlite3.Connection, ticker: str, end_date: dt.datetime) -> None:
+    conn.execute(
+        f"INSERT OR REPLACE INTO {PROGRESS_TABLE} VALUES (?, ?)", (ticker, int(to_epoch([end_date])[0]))
+    )
+
+
+def legacy_tables(conn: sqlite3.Connection) -> list[str]:
+    """Tables with the legacy one table per ticker yfinance schema, i.e. at least Date and Close columns."""
+    tables = [
+        x[0]
+        for x in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT IN (?, ?)",
+            (PRICES_TABLE, PROGRESS_TABLE),
+        )
+    ]
+
+    legacy = []
+    for table in tables:
+        columns = {x[1] for x in conn.execute(f'PRAGMA table_info("{table}")')}
+        if {"Date", "Close"} <= columns:
+            legacy.append(table)
+
+    return legacy
+
+
+def migrate_legacy_tables(conn: sqlite3.Connection) -> int:
+    """
+    Move legacy one table per ticker data into the long format prices table, dropping the originals.
+
+    A one off step, run from the command line. Other tables in the database are left untouched. Returns the
+    number of tables migrated.
+    """
+    legacy = legacy_tables(conn)
+    if not legacy:
+        logger.info("No legacy ticker tables to migrate")
+        return 0
+
+    logger.info(f"Migrating {len(legacy)} legacy ticker tables to {PRICES_TABLE} table...")
+
+    with conn:
+        for ticker in legacy:
+            df = pd.read_sql_query(f'SELECT * FROM "{ticker}"', conn, index_col="Date", parse_dates=["Date"])
+            write_prices(conn, ticker, df)
+            conn.execute(f'DROP TABLE "{ticker}"')
+
+    logger.info("Migration complete")
+
+    return len(legacy)
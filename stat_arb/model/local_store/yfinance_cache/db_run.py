@@ -1,6 +1,8 @@
 import datetime as dt
 
-from stat_arb.model.local_store.yfinance_cache import store_sp500_data
+from stat_arb.model.config import DB
+from stat_arb.model.local_store.yfinance_cache import refresh_sp500_data, store_sp500_data
+from stat_arb.model.local_store.yfinance_cache.database_util import connect, migrate_legacy_tables
 
 
 def main():
@@ -8,3 +10,16 @@ def main():
     dt_end = dt.datetime.today() - dt.timedelta(1)
 
     store_sp500_data(dt_start, dt_end)
+
+
+def refresh_main():
+    dt_start = dt.datetime(2000, 1, 1)
+    dt_end = dt.datetime.combine(dt.date.today(), dt.time())  # exclusive, so up to yesterday's close
+
+    refresh_sp500_data(dt_start, dt_end)
+
+
+def migrate_main():
+    conn = connect(DB)
+    migrate_legacy_tables(conn)
+    conn.close()
@@ -0,0 +1,180 @@
+import datetime as dt
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import pandas as pd
+import yfinance as yf
+
+from stat_arb.model.config import DB
+from stat_arb.model.local_store.yfinance_cache.database_util import connect, write_prices
+
+logger = logging.getLogger(__name__)
+
+# Fetch a batch of tickers over [start, end), returning an OHLCV frame per ticker
+Fetch = Callable[[list[str], dt.datetime, dt.datetime], dict[str, pd.DataFrame]]
+
+
+@dataclass
+class IngestionConfig:
+    batch_size: int = 50
+    max_workers: int = 4
+    requests_per_second: float = 2.0
+    max_retries: int = 3
+    backoff: float = 1.0  # seconds, doubled on each retry
+
+
+@dataclass
+class IngestionResults:
+    rows: dict[str, int] = field(default_factory=dict)  # rows written per ticker
+    failed: list[str] = field(
+        default_factory=list
+    )  # tickers not fetched, or whose batch exhausted its retries
+
+
+def yfinance_fetch(tickers: list[str], start: dt.datetime, end: dt.datetime) -> dict[str, pd.DataFrame]:
+    """Download a batch of tickers in one request, split into one frame per ticker."""
+    df = yf.download(
+        tickers=tickers, start=start, end=end, group_by="ticker", multi_level_index=True, progress=False
+    )
+    fetched = set(df.columns.get_level_values(0))
+    return {ticker: df[ticker].dropna(how="all") for ticker in tickers if ticker in fetched}
+
+
+class RateLimiter:
+    """Thread safe limiter spacing calls at least 1 / rate seconds apart."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+def ingest(
+    tickers: list[str],
+    dt_start: dt.datetime,
+    dt_end: dt.datetime,
+    db: str = DB,
+    fetch: Fetch = yfinance_fetch,
+    config: Optional[IngestionConfig] = None,
+) -> IngestionResults:
+    """
+    Concurrently fetch tickers in batches and store them in the local database.
+
+    Batches are fetched on a bounded thread pool behind a shared rate limiter, retrying with exponential
+    backoff. Fetched batches are handed to a single writer thread owning the database connection, so writes
+    stay serialised while network requests overlap. At most 2 * max_workers batches are in flight and as
+    many queued for writing, so fetching cannot run arbitrarily far ahead of writing.
+    """
+    config = config or IngestionConfig()
+    bounds = range(0, len(tickers) + config.batch_size, config.batch_size)
+    batches = [tickers[i:j] for i, j in zip(bounds, bounds[1:]) if i < len(tickers)]
+
+    results = IngestionResults()
+    limiter = RateLimiter(config.requests_per_second)
+
+    max_in_flight = 2 * config.max_workers
+    pending: queue.Queue = queue.Queue(maxsize=max_in_flight)
+    writer = _Writer(db, pending, results)
+    writer.start()
+
+    def fetch_with_retry(batch: list[str]) -> dict[str, pd.DataFrame]:
+        for attempt in range(config.max_retries):
+            limiter.acquire()
+            try:
+                return fetch(batch, dt_start, dt_end)
+            except Exception as e:
+                delay = config.backoff * 2**attempt
+                logger.warning(f"Fetch of {len(batch)} tickers failed ({e}), retrying in {delay}s...")
+                time.sleep(delay)
+
+        limiter.acquire()
+        return fetch(batch, dt_start, dt_end)  # final attempt, raising to the caller
+
+    try:
+        with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+            remaining = iter(batches)
+            futures: dict[Future, list[str]] = {}
+            completed = 0
+
+            # Submit only as completed batches are handed to the writer, which blocks while its queue is full
+            while True:
+                for batch in remaining:
+                    futures[executor.submit(fetch_with_retry, batch)] = batch
+                    if len(futures) >= max_in_flight:
+                        break
+                if not futures:
+                    break
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch = futures.pop(future)
+                    completed += 1
+                    try:
+                        frames = future.result()
+                    except Exception as e:
+                        logger.error(f"Giving up on batch starting {batch[0]}: {e}")
+                        results.failed.extend(batch)
+                        continue
+
+                    # A ticker failing within a batched download comes back empty, and writing it would
+                    # replace its stored history with nothing
+                    frames = {ticker: df for ticker, df in frames.items() if not df.empty}
+                    results.failed.extend(x for x in batch if x not in frames)
+                    pending.put(frames)
+                    logger.info(f"Fetched batch {completed} out of {len(batches)}")
+    finally:
+        pending.put(None)
+        writer.join()
+
+    if writer.error is not None:
+        raise writer.error
+
+    return results
+
+
+class _Writer(threading.Thread):
+    """Single consumer writing fetched batches through its own connection, one transaction per batch."""
+
+    def __init__(self, db: str, pending: queue.Queue, results: IngestionResults):
+        super().__init__(name="yfinance-writer", daemon=True)
+        self.db = db
+        self.pending = pending
+        self.results = results
+        self.error: Optional[BaseException] = None
+
+    def run(self) -> None:
+        conn = None
+        try:
+            conn = connect(self.db)
+            logger.info(f"Connected to database: {self.db}")
+        except Exception as e:
+            self.error = e
+
+        while (frames := self.pending.get()) is not None:
+            if self.error is not None or conn is None:
+                continue  # drain so producers never block on a full queue
+
+            try:
+                with conn:
+                    for ticker, df in frames.items():
+                        self.results.rows[ticker] = write_prices(conn, ticker, df)
+            except Exception as e:
+                self.error = e
+
+        if conn is not None:
+            conn.close()
+            logger.info(f"Disconnected from database: {self.db}")
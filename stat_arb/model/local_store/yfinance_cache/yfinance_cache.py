@@ -1,33 +1,99 @@
 import datetime as dt
 import logging
-import sqlite3
-
-import yfinance as yf
+from typing import Optional
 
 from stat_arb.model.config import DB
+from stat_arb.model.local_store.yfinance_cache.database_util import (
+    connect,
+    last_dates,
+    record_progress,
+    refreshed_tickers,
+    write_prices,
+)
+from stat_arb.model.local_store.yfinance_cache.ingestion import (
+    Fetch,
+    IngestionConfig,
+    IngestionResults,
+    ingest,
+    yfinance_fetch,
+)
 from stat_arb.model.local_store.ticker_snapshot.ticker_snapshot import get_sp500_tickers
 
 logger = logging.getLogger(__name__)
 
 
-def store_yfinance_data(tickers: list[str], dt_start: dt.datetime, dt_end: dt.datetime):
-    """Streaming response to store each ticker data individually"""
-    conn = sqlite3.connect(DB)
-    logger.info(f"Connected to database: {DB}")
-
-    n = len(tickers)
+def store_yfinance_data(
+    tickers: list[str],
+    dt_start: dt.datetime,
+    dt_end: dt.datetime,
+    db: str = DB,
+    fetch: Fetch = yfinance_fetch,
+    config: Optional[IngestionConfig] = None,
+) -> IngestionResults:
+    """Store each ticker's data, fetched concurrently in batches and written by a single writer"""
+    results = ingest(tickers, dt_start, dt_end, db=db, fetch=fetch, config=config)
 
-    for i in range(n):
-        df = yf.download(
-            tickers=tickers[i], start=dt_start, end=dt_end, multi_level_index=False, progress=False
-        )
-        df.to_sql(tickers[i], conn, if_exists="replace")
-        logger.info(f"Processing ticker {int(i+1)} out of {int(n)} : {tickers[i]}")
+    logger.info(f"Stored {len(results.rows)} out of {len(tickers)} tickers")
+    if results.failed:
+        logger.warning(f"Failed to fetch tickers: {results.failed}")
 
-    conn.close()
-    logger.info(f"Disconnected from database: {DB}")
+    return results
 
 
 def store_sp500_data(dt_start: dt.datetime, dt_end: dt.datetime) -> None:
     tickers = get_sp500_tickers()
     store_yfinance_data(tickers, dt_start, dt_end)
+
+
+def refresh_yfinance_data(
+    tickers: list[str],
+    dt_start: dt.datetime,
+    dt_end: dt.datetime,
+    db: str = DB,
+    fetch: Fetch = yfinance_fetch,
+):
+    """
+    Incremental refresh fetching only the dates after each ticker's last stored date, up to the exclusive
+    end date.
+
+    New rows and the ticker's progress are committed in one transaction, so an interrupted refresh to the
+    same end date resumes from the first ticker not yet refreshed. A ticker whose download comes back empty
+    is left pending, to be fetched again by the next refresh.
+    """
+    conn = connect(db)
+    logger.info(f"Connected to database: {db}")
+
+    stored = last_dates(conn)
+    done = refreshed_tickers(conn, dt_end)
+
+    pending = [x for x in tickers if x not in done]
+    logger.info(f"Refreshing {len(pending)} tickers, {len(tickers) - len(pending)} already up to date")
+
+    n = len(pending)
+
+    for i, ticker in enumerate(pending):
+        start = stored[ticker] + dt.timedelta(1) if ticker in stored else dt_start
+
+        rows = 0
+        df = None
+        if start < dt_end:
+            df = fetch([ticker], start, dt_end).get(ticker)
+            if df is None or df.empty:
+                logger.warning(f"No data fetched for {ticker}, leaving it to the next refresh")
+                continue
+            df = df[df.index >= start]  # yfinance may return the last stored bar again
+
+        with conn:
+            if df is not None:
+                rows = write_prices(conn, ticker, df, replace=False)
+            record_progress(conn, ticker, dt_end)
+
+        logger.info(f"Refreshed ticker {int(i+1)} out of {int(n)} : {ticker} ({rows} new rows)")
+
+    conn.close()
+    logger.info(f"Disconnected from database: {db}")
+
+
+def refresh_sp500_data(dt_start: dt.datetime, dt_end: dt.datetime) -> None:
+    tickers = get_sp500_tickers()
+    refresh_yfinance_data(tickers, dt_start, dt_end)
@@ -0,0 +1,15 @@
+from typing import TYPE_CHECKING
+
+from stat_arb.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .pair_scanner import PairScanner
+
+__all__ = ["PairScanner"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "PairScanner": ".pair_scanner",
+    },
+)
@@ -0,0 +1,165 @@
+import datetime as dt
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, islice
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from stat_arb.model.data import DataHandlerEnum, DataHandlerFactory
+from stat_arb.model.regressor import NaiveRegressor
+from stat_arb.model.statistics import (
+    CointegratedAugmentedDickeyFuller,
+    CointegratedAugmentedDickeyFuller_Results,
+    ErrorCorrectionModel,
+    ErrorCorrectionModel_Results,
+)
+from stat_arb.model.trading_strategy import OrnsteinUhlenbeckSDE
+
+logger = logging.getLogger(__name__)
+
+SCAN_COLUMNS = [
+    "ticker_a",
+    "ticker_b",
+    "intercept",
+    "beta",
+    "cadf_test_statistic",
+    "cadf_p_value",
+    "ecm_reversion_speed",
+    "ecm_p_value",
+    "half_life",
+]
+
+# Price panel shared with each worker process once on start up, rather than pickled per task
+_PRICES: Optional[pd.DataFrame] = None
+
+
+class PairScanner:
+    def __init__(
+        self,
+        tickers: list[str],
+        start_date: dt.datetime,
+        end_date: dt.datetime,
+        data_handler_enum: DataHandlerEnum = DataHandlerEnum.LOCAL,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 500,
+    ):
+        if len(tickers) < 2:
+            raise ValueError("At least two tickers are required to scan for pairs")
+
+        self.tickers = tickers
+        self.start_date = start_date
+        self.end_date = end_date
+        self.data_handler_enum = data_handler_enum
+        self.max_workers = max_workers or os.cpu_count()
+        self.chunk_size = chunk_size
+
+    def load_prices(self) -> pd.DataFrame:
+        """Load the full price panel once, keeping tickers with a complete history over the date range."""
+        data_handler = DataHandlerFactory.create_data_handler(
+            self.data_handler_enum, self.tickers, self.start_date, self.end_date
+        )
+        close = data_handler.get_close_prices()
+
+        incomplete = close.columns[close.isna().any()]
+        if len(incomplete):
+            logger.info(f"Dropping {len(incomplete)} tickers with incomplete price history...")
+        close = close.drop(columns=incomplete)
+
+        self.close_prices = close.div(close.iloc[0], axis=1)
+
+        return self.close_prices
+
+    def scan(self) -> pd.DataFrame:
+        """Test every pair of tickers for cointegration, ranked by CADF then ECM p-value."""
+        if not hasattr(self, "close_prices"):
+            self.load_prices()
+
+        tickers = self.close_prices.columns.to_list()
+        n_pairs = len(tickers) * (len(tickers) - 1) // 2
+        logger.info(f"Scanning {n_pairs} pairs across {self.max_workers} processes...")
+
+        chunks = _chunked(combinations(tickers, 2), self.chunk_size)
+
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=_init_worker, initargs=(self.close_prices,)
+        ) as executor:
+            rows = [row for chunk_rows in executor.map(_scan_pairs, chunks) for row in chunk_rows]
+
+        logger.info(f"Completed scan of {len(rows)} pairs")
+
+        self.results = (
+            pd.DataFrame(rows, columns=SCAN_COLUMNS)
+            .sort_values(["cadf_p_value", "ecm_p_value"])
+            .reset_index(drop=True)
+        )
+
+        return self.results
+
+    def to_csv(self, path: str) -> None:
+        logger.info(f"Writing pair scan results to file: {path}")
+        self.results.to_csv(path, index=False)
+
+
+def _init_worker(close_prices: pd.DataFrame) -> None:
+    global _PRICES
+    _PRICES = close_prices
+
+
+def _chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _scan_pairs(pairs: list[tuple[str, str]]) -> list[tuple]:
+    if _PRICES is None:
+        raise RuntimeError("Unexpected None: worker price panel was expected to be initialised")
+
+    regression = NaiveRegressor.fit_batch(_PRICES, pairs)
+    cadf = CointegratedAugmentedDickeyFuller.test_stationarity_batch(regression.residuals, k_vars=2)
+    ecm = ErrorCorrectionModel.fit_batch(
+        _PRICES[[a for a, _ in pairs]].to_numpy(),
+        _PRICES[[b for _, b in pairs]].to_numpy(),
+        regression.residuals,
+    )
+
+    return [
+        _scan_pair(
+            ticker_a,
+            ticker_b,
+            regression.intercepts[i],
+            regression.betas[i],
+            regression.residuals[:, i],
+            cadf[i],
+            ecm[i],
+        )
+        for i, (ticker_a, ticker_b) in enumerate(pairs)
+    ]
+
+
+def _scan_pair(
+    ticker_a: str,
+    ticker_b: str,
+    intercept: float,
+    beta: float,
+    resids: np.ndarray,
+    cadf: CointegratedAugmentedDickeyFuller_Results,
+    ecm: ErrorCorrectionModel_Results,
+) -> tuple:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        half_life = OrnsteinUhlenbeckSDE(resids).fit_to_sde().get_half_life_in_working_days()
+
+    return (
+        ticker_a,
+        ticker_b,
+        intercept,
+        beta,
+        cadf.get_test_statistic(),
+        cadf.get_p_value(),
+        ecm.get_long_run_reversion_speed(),
+        ecm.get_p_value(),
+        half_life,
+    )
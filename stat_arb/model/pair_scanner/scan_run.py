@@ -0,0 +1,15 @@
+import datetime as dt
+
+from stat_arb.model.local_store.ticker_snapshot.ticker_snapshot import get_local_sp500_tickers
+from stat_arb.model.pair_scanner import PairScanner
+
+OUTPUT = "pair_scan.csv"
+
+
+def main():
+    dt_end = dt.datetime.today() - dt.timedelta(1)
+    dt_start = dt_end - dt.timedelta(5 * 365)
+
+    scanner = PairScanner(get_local_sp500_tickers(), dt_start, dt_end)
+    scanner.scan()
+    scanner.to_csv(OUTPUT)
@@ -0,0 +1,15 @@
+from typing import TYPE_CHECKING
+
+from stat_arb.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .parameter_sweep import ParameterSweep
+
+__all__ = ["ParameterSweep"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ParameterSweep": ".parameter_sweep",
+    },
+)
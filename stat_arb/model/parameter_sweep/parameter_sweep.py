@@ -0,0 +1,159 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from itertools import product
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from stat_arb.model.regressor import (
+    KalmanFilterRegressor,
+    NaiveRegressor,
+    Regressor,
+    RegressorEnum,
+    RollingWindowRegressor,
+)
+from stat_arb.model.trading_strategy import StrategyEnum, generate_signals
+from stat_arb.model.trading_strategy.metrics import compute_metrics
+from stat_arb.model.trading_strategy.ornstein_uhlenbeck_sde_fit import s_scores
+
+logger = logging.getLogger(__name__)
+
+
+class ParameterSweep:
+    """
+    Evaluate a grid of regressor and strategy inputs for a single pair.
+
+    Each residual is regressed once per regressor input and each z-score (or s-score) computed once per
+    distinct window.
+    All enter / exit threshold combinations sharing a z-score are then backtested as one column-stacked
+    batch. Independent (regressor input, window) slices are spread across a process pool.
+    """
+
+    def __init__(self, price_x: pd.Series, price_y: pd.Series, max_workers: Optional[int] = None):
+        self.price_x = price_x
+        self.price_y = price_y
+        self.max_workers = max_workers or os.cpu_count()
+
+    def run(
+        self,
+        regressor_enum: RegressorEnum,
+        regressor_grid: Sequence,
+        strategy_enum: StrategyEnum,
+        strategy_grid: Sequence,
+    ) -> pd.DataFrame:
+        """
+        Parameters
+        ----------
+        regressor_enum : RegressorEnum
+        regressor_grid : list
+            - Regressor inputs e.g. RollingWindowRegressorInputs for each window length to sweep.
+        strategy_enum : StrategyEnum
+        strategy_grid : list
+            - Strategy inputs e.g. ToyStrategyInputs for each threshold combination to sweep.
+
+        Returns
+        -------
+        pd.DataFrame
+            - One row per (regressor input, strategy input) with the inputs and backtest metrics.
+        """
+        windows: dict[Optional[int], list] = {}
+        for strategy_inputs in strategy_grid:
+            windows.setdefault(self._z_score_window(strategy_enum, strategy_inputs), []).append(
+                strategy_inputs
+            )
+
+        returns_x = self.price_x.pct_change().to_numpy()
+        returns_y = self.price_y.pct_change().to_numpy()
+
+        slices = []
+        for regressor_inputs in regressor_grid:
+            regressor = self._regressor_factory(regressor_enum)
+            resids = regressor.get_residual(regressor_inputs).to_numpy()
+            beta = regressor.get_beta().to_numpy().ravel()
+            spread_returns = returns_x - beta * returns_y
+
+            for window, strategy_inputs in windows.items():
+                slices.append(
+                    (strategy_enum, regressor_inputs, resids, spread_returns, window, strategy_inputs)
+                )
+
+        logger.info(
+            f"Sweeping {len(regressor_grid) * len(strategy_grid)} configurations in {len(slices)} slices..."
+        )
+
+        if self.max_workers == 1 or len(slices) == 1:
+            frames = [_evaluate_slice(*x) for x in slices]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                frames = list(executor.map(_evaluate_slice, *zip(*slices)))
+
+        return pd.concat(frames, ignore_index=True)
+
+    @staticmethod
+    def grid(inputs_type: type, **values: Sequence) -> list:
+        """
+        Cartesian product of input values.
+
+        e.g. grid(ToyStrategyInputs, enter_threshold=[1, 2], exit_threshold=[0, 0.5])
+        """
+        return [inputs_type(**dict(zip(values, x))) for x in product(*values.values())]
+
+    def _regressor_factory(self, regressor_enum: RegressorEnum) -> Regressor:
+        match regressor_enum:
+            case RegressorEnum.NAIVE:
+                return NaiveRegressor(self.price_x, self.price_y)
+            case RegressorEnum.ROLLING_WINDOW:
+                return RollingWindowRegressor(self.price_x, self.price_y)
+            case RegressorEnum.KALMAN_FILTER:
+                return KalmanFilterRegressor(self.price_x, self.price_y)
+
+    @staticmethod
+    def _z_score_window(strategy_enum: StrategyEnum, strategy_inputs) -> Optional[int]:
+        match strategy_enum:
+            case StrategyEnum.ToyStrategy:
+                return None
+            case StrategyEnum.RollingWindow:
+                return strategy_inputs.window_length
+            case StrategyEnum.OrnsteinUhlenbeckSDEFit:
+                return strategy_inputs.window_length
+
+
+def _evaluate_slice(
+    strategy_enum: StrategyEnum,
+    regressor_inputs,
+    resids: np.ndarray,
+    spread_returns: np.ndarray,
+    window: Optional[int],
+    strategy_grid: list,
+) -> pd.DataFrame:
+    resids_series = pd.Series(resids)
+    if strategy_enum == StrategyEnum.OrnsteinUhlenbeckSDEFit:
+        if window is None:
+            raise ValueError("Ornstein-Uhlenbeck s-scores need a window length")
+        z_score = s_scores(resids, window)
+    elif window is None:
+        z_score = ((resids_series - resids_series.mean()) / resids_series.std()).to_numpy()
+    else:
+        rolling = resids_series.rolling(window)
+        z_score = ((resids_series - rolling.mean()) / rolling.std()).to_numpy()
+
+    enter_threshold = np.array([x.enter_threshold for x in strategy_grid], dtype=float)
+    exit_threshold = np.array([x.exit_threshold for x in strategy_grid], dtype=float)
+
+    z = z_score.reshape(-1, 1)
+    signals = generate_signals(
+        z < -enter_threshold, z > enter_threshold, z > -exit_threshold, z < exit_threshold
+    )
+
+    portfolio_returns = np.full(signals.shape, np.nan)
+    portfolio_returns[1:] = signals[:-1] * spread_returns[1:, None]
+
+    metrics = compute_metrics(portfolio_returns, signals).to_dict()
+
+    regressor_params = {f"regressor_{k}": v for k, v in asdict(regressor_inputs).items()}
+    rows = [{**regressor_params, **asdict(x)} for x in strategy_grid]
+
+    return pd.concat([pd.DataFrame(rows), pd.DataFrame(metrics)], axis=1)
@@ -1,6 +1,23 @@
-from .naive_regressor import NaiveRegressor
-from .regressor import Regressor
-from .regressor_enum import RegressorEnum
-from .rolling_window_regressor import RollingWindowRegressor
+from typing import TYPE_CHECKING
 
-__all__ = ["RegressorEnum", "Regressor", "NaiveRegressor", "RollingWindowRegressor"]
+from stat_arb.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .kalman_filter_regressor import KalmanFilterRegressor
+    from .naive_regressor import NaiveRegressor
+    from .regressor import Regressor
+    from .regressor_enum import RegressorEnum
+    from .rolling_window_regressor import RollingWindowRegressor
+
+__all__ = ["RegressorEnum", "Regressor", "NaiveRegressor", "RollingWindowRegressor", "KalmanFilterRegressor"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "KalmanFilterRegressor": ".kalman_filter_regressor",
+        "NaiveRegressor": ".naive_regressor",
+        "Regressor": ".regressor",
+        "RegressorEnum": ".regressor_enum",
+        "RollingWindowRegressor": ".rolling_window_regressor",
+    },
+)
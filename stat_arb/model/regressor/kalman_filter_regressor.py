@@ -0,0 +1,163 @@
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from stat_arb.model.regressor.regressor import Regressor
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class KalmanFilterRegressorInputs:
+    delta: float = 1e-4
+    observation_variance: float = 1e-3
+    initial_state_variance: float = 1.0
+    burn_in: int = 30  # leading residuals left nan while the state moves away from its zero prior
+
+
+class KalmanFilterState:
+    """
+    Recursive state of a random walk [intercept, beta] for one or more pairs stacked as vectors.
+
+    Observation : y_t = intercept_t + beta_t * x_t + v_t, v_t ~ N(0, observation_variance)
+    Transition  : [intercept_t, beta_t] = [intercept_t-1, beta_t-1] + w_t, w_t ~ N(0, delta / (1 - delta) I)
+
+    Each update costs O(1) per pair and holds constant memory, so a new bar never refits the history.
+    Observations with missing values propagate the prior without an update.
+
+    Reference: Algorithmic Trading: Winning Strategies and Their Rationale, Ernest P. Chan
+    """
+
+    def __init__(self, inputs: KalmanFilterRegressorInputs, n_pairs: int = 1):
+        self.transition_variance = inputs.delta / (1 - inputs.delta)
+        self.observation_variance = inputs.observation_variance
+
+        self.intercept = np.zeros(n_pairs)
+        self.beta = np.zeros(n_pairs)
+
+        # Symmetric 2x2 state covariance per pair
+        self.p00 = np.full(n_pairs, inputs.initial_state_variance)
+        self.p01 = np.zeros(n_pairs)
+        self.p11 = np.full(n_pairs, inputs.initial_state_variance)
+
+    def update(self, x: npt.ArrayLike, y: npt.ArrayLike) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Filter one observation per pair, returning the posterior intercept and beta and the innovation.
+
+        The innovation y_t - intercept_t|t-1 - beta_t|t-1 * x_t is the one step prediction error of the prior
+        state, so it carries no information from y_t itself. It is nan where the observation is missing.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        observed = ~(np.isnan(x) | np.isnan(y))
+        x = np.where(observed, x, 0.0)
+
+        # Predict
+        r00 = self.p00 + self.transition_variance
+        r01 = self.p01
+        r11 = self.p11 + self.transition_variance
+
+        # Innovation and its variance
+        error = np.where(observed, y - self.intercept - self.beta * x, 0.0)
+        q = r00 + 2 * x * r01 + x * x * r11 + self.observation_variance
+
+        # Kalman gain, zero where unobserved so the state carries the prior forward
+        k0 = np.where(observed, (r00 + x * r01) / q, 0.0)
+        k1 = np.where(observed, (r01 + x * r11) / q, 0.0)
+
+        self.intercept = self.intercept + k0 * error
+        self.beta = self.beta + k1 * error
+
+        self.p00 = r00 - k0 * k0 * q
+        self.p01 = r01 - k0 * k1 * q
+        self.p11 = r11 - k1 * k1 * q
+
+        return self.intercept, self.beta, np.where(observed, error, np.nan)
+
+
+@dataclass
+class KalmanFilterBatchResults:
+    intercepts: np.ndarray  # shape (n_obs, n_pairs)
+    betas: np.ndarray  # shape (n_obs, n_pairs)
+    residuals: np.ndarray  # innovations, shape (n_obs, n_pairs), nan over the burn in
+    state: KalmanFilterState  # filtered state after the last observation, for further updates
+
+
+class KalmanFilterRegressor(Regressor):
+    def __init__(self, dependent_variable, independent_variable):
+        self.b = dependent_variable
+        self.A = independent_variable
+
+    def get_residual(self, inputs: KalmanFilterRegressorInputs):
+        logger.info("Running Kalman filter regression of timeseries...")
+
+        results = self.filter_batch(self.b, self.A, inputs)
+        self.state = results.state
+
+        name = getattr(self.A, "name", "x1")
+        self.params = pd.DataFrame({"const": results.intercepts[:, 0], name: results.betas[:, 0]})
+        self.resids = pd.Series(results.residuals[:, 0], name="Residuals")
+
+        if isinstance(self.b, pd.Series):
+            self.params.index = self.b.index
+            self.resids.index = self.b.index
+
+        return self.resids
+
+    def get_beta(self) -> pd.DataFrame:
+        param_headers = [x for x in self.params.columns if x != "const"]
+
+        beta_series = self.params[param_headers]
+
+        return beta_series
+
+    def update(self, x: float, y: float) -> float:
+        """Filter a new observation onto a fitted regressor, returning its residual i.e. innovation."""
+        if not hasattr(self, "state"):
+            raise RuntimeError("Regressor must be fitted with get_residual before updating")
+
+        _, _, innovation = self.state.update(x, y)
+        return float(innovation[0])
+
+    @staticmethod
+    def filter_batch(
+        dependent_variable: npt.ArrayLike,
+        independent_variable: npt.ArrayLike,
+        inputs: KalmanFilterRegressorInputs,
+    ) -> KalmanFilterBatchResults:
+        """
+        Filter many pairs at once with stacked state vectors.
+
+        Residuals are the innovations of the prior state, left nan for the first inputs.burn_in observations.
+
+        Parameters
+        ----------
+        dependent_variable : array-like
+            - Shape (n_obs,) or (n_obs, n_pairs).
+        independent_variable : array-like
+            - Same shape as the dependent variable.
+        inputs : KalmanFilterRegressorInputs
+            - Filter parameters shared by every pair.
+        """
+        y = np.asarray(dependent_variable, dtype=float)
+        x = np.asarray(independent_variable, dtype=float)
+        if y.shape != x.shape:
+            raise ValueError("Dependent and independent variables must have the same shape")
+        if y.ndim == 1:
+            y, x = y.reshape(-1, 1), x.reshape(-1, 1)
+
+        state = KalmanFilterState(inputs, n_pairs=y.shape[1])
+
+        intercepts = np.empty(y.shape)
+        betas = np.empty(y.shape)
+        residuals = np.empty(y.shape)
+
+        for t in range(y.shape[0]):
+            intercepts[t], betas[t], residuals[t] = state.update(x[t], y[t])
+
+        residuals[: inputs.burn_in] = np.nan
+
+        return KalmanFilterBatchResults(intercepts, betas, residuals, state)
@@ -1,10 +1,9 @@
 import logging
 from dataclasses import dataclass
-from typing import Union
+from typing import Hashable, Sequence, Union
 
 import numpy as np
 import pandas as pd
-import statsmodels.api as sm
 
 from stat_arb.model.regressor.regressor import Regressor
 
@@ -16,6 +15,14 @@ class NaiveRegressorInputs:
     pass
 
 
+@dataclass
+class NaiveRegressorBatchResults:
+    pairs: list[tuple[Hashable, Hashable]]
+    intercepts: np.ndarray  # shape (n_pairs,)
+    betas: np.ndarray  # shape (n_pairs,)
+    residuals: np.ndarray  # shape (n_obs, n_pairs)
+
+
 # Naive regression of timeseries with lookahead bias
 class NaiveRegressor(Regressor):
     def __init__(
@@ -29,27 +36,72 @@ class NaiveRegressor(Regressor):
     def get_residual(self, inputs: NaiveRegressorInputs):
         logger.info("Running naive regression of timeseries...")
 
-        # if inputs.with_constant:
-        self.A = sm.add_constant(self.A)
+        b = np.asarray(self.b, dtype=float).reshape(-1, 1)
+        A = np.asarray(self.A, dtype=float).reshape(-1, 1)
 
-        ols = sm.OLS(self.b, self.A).fit()
+        results = self.fit_batch(np.hstack([b, A]), [(0, 1)])
 
-        betas = np.ones(shape=self.A.shape) * ols.params.values
+        name: Hashable
+        if isinstance(self.A, pd.DataFrame):
+            name = self.A.columns[0]
+        elif isinstance(self.A, pd.Series):
+            name = self.A.name
+        else:
+            name = "x1"
 
-        self.params = pd.DataFrame(betas)
+        # Constant over the sample, so held as scalars and broadcast by consumers
+        self.params = pd.Series([results.intercepts[0], results.betas[0]], index=["const", name])
+        self.resids = pd.Series(results.residuals[:, 0], name="Residuals")
 
-        if isinstance(self.A, (pd.DataFrame, pd.Series)):
-            self.params.index = self.A.index
-            self.params.columns = self.A.columns
-
-        self.resids = ols.resid
-        self.resids.name = "Residuals"
+        if isinstance(self.b, (pd.DataFrame, pd.Series)):
+            self.resids.index = self.b.index
 
         return self.resids
 
     def get_beta(self) -> pd.Series:
-        param_headers = [x for x in self.params.columns if x != "const"]
-
-        beta_series = self.params[param_headers]
-
-        return beta_series
+        """Single beta keyed by the independent variable's name."""
+        return self.params.drop("const")
+
+    @staticmethod
+    def fit_batch(
+        prices: Union[np.ndarray, pd.DataFrame], pairs: Sequence[tuple[Hashable, Hashable]]
+    ) -> NaiveRegressorBatchResults:
+        """
+        Closed form OLS regression with a constant for many pairs in a single pass.
+
+        Parameters
+        ----------
+        prices : np.ndarray | pd.DataFrame
+            - Price matrix of shape (n_obs, n_tickers) without missing values.
+        pairs : list of tuple
+            - (dependent, independent) column pairs, as column labels for a DataFrame else positions.
+        """
+        if isinstance(prices, pd.DataFrame):
+            y_idx = prices.columns.get_indexer(pd.Index([y for y, _ in pairs]))
+            x_idx = prices.columns.get_indexer(pd.Index([x for _, x in pairs]))
+            if (y_idx < 0).any() or (x_idx < 0).any():
+                raise KeyError("Pairs contain columns missing from the price matrix")
+            values = prices.to_numpy(dtype=float)
+        else:
+            y_idx = np.array([y for y, _ in pairs], dtype=int)
+            x_idx = np.array([x for _, x in pairs], dtype=int)
+            values = np.asarray(prices, dtype=float)
+
+        if np.isnan(values).any():
+            raise ValueError("Price matrix must not contain missing values")
+
+        # Sufficient statistics on centred prices, shared across pairs
+        means = values.mean(axis=0)
+        centred = values - means
+
+        x = centred[:, x_idx]
+        y = centred[:, y_idx]
+
+        sxy = np.einsum("ij,ij->j", x, y)
+        sxx = np.einsum("ij,ij->j", x, x)
+
+        betas = sxy / sxx
+        intercepts = means[y_idx] - betas * means[x_idx]
+        residuals = y - x * betas
+
+        return NaiveRegressorBatchResults(list(pairs), intercepts, betas, residuals)
@@ -1,12 +1,12 @@
 import logging
 from abc import ABC, abstractmethod
+from typing import Union
 
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
 
-# TODO: Add Kalman filter and make an ABC for regressor type?
 class Regressor(ABC):
 
     @abstractmethod
@@ -14,5 +14,6 @@ class Regressor(ABC):
         pass
 
     @abstractmethod
-    def get_beta(self) -> pd.Series:
+    def get_beta(self) -> Union[pd.Series, pd.DataFrame]:
+        """A constant beta keyed by name, or a frame of betas per observation."""
         pass
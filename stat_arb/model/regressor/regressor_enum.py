@@ -4,7 +4,7 @@ from enum import StrEnum
 class RegressorEnum(StrEnum):
     NAIVE = "Naive"
     ROLLING_WINDOW = "Rolling Window"
-    KALMAN_FILTER = "Kalman Filter"  # TODO: Implement
+    KALMAN_FILTER = "Kalman Filter"
 
     @classmethod
     def enum_from_str(cls, x):
@@ -1,10 +1,10 @@
 import logging
 from dataclasses import dataclass
+from typing import Optional
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
-import statsmodels.api as sm
-from statsmodels.regression.rolling import RollingOLS
 
 from stat_arb.model.regressor import Regressor
 
@@ -14,6 +14,14 @@ logger = logging.getLogger(__name__)
 @dataclass
 class RollingWindowRegressorInputs:
     window_length: int
+    expanding: bool = False
+
+
+@dataclass
+class RollingLeastSquaresResults:
+    intercept: np.ndarray
+    beta: np.ndarray
+    residual: np.ndarray
 
 
 class RollingWindowRegressor(Regressor):
@@ -24,35 +32,119 @@ class RollingWindowRegressor(Regressor):
     def get_residual(self, inputs: RollingWindowRegressorInputs):
         logger.info("Running rolling regression of timeseries...")
 
-        # if inputs.with_constant:
-        self.A = sm.add_constant(self.A)  # make a copy?
-
-        ols = RollingOLS(self.b, self.A, window=inputs.window_length, expanding=False).fit()
+        ols = rolling_least_squares(self.b, self.A, inputs.window_length, expanding=inputs.expanding)
 
-        self.params = ols.params
+        name = getattr(self.A, "name", "x1")
+        self.params = pd.DataFrame({"const": ols.intercept, name: ols.beta})
 
-        df = self.params.copy()
-        df.columns = [f"{x}_params" for x in df.columns]
-        df[self.A.columns] = self.A
+        residual = ols.residual
+        if not inputs.expanding:
+            residual[: inputs.window_length] = np.nan  # lost data due to rolling window
 
-        n = df.shape[1] // 2  # find column-wise midpoint of dataframe
-        result = df.iloc[:, :n].values * df.iloc[:, n:].values
-        regressed_columns = [f"{x}_regressed" for x in self.A.columns]
-        df[regressed_columns] = result
+        self.resids = pd.Series(residual, name="Residuals")
 
-        df["Fitted_Values"] = df[regressed_columns].sum(axis=1)
-        df.loc[df[regressed_columns[0]].isna(), "Fitted_Values"] = np.nan  # lost data due to rolling window
-        df.loc[: df.index[inputs.window_length - 1], "Fitted_Values"] = np.nan
-        df[self.b.name] = self.b
-        df["Residuals"] = df[self.b.name] - df["Fitted_Values"]
-
-        self.resids = df["Residuals"]
+        if isinstance(self.b, pd.Series):
+            self.params.index = self.b.index
+            self.resids.index = self.b.index
 
         return self.resids
 
-    def get_beta(self) -> pd.Series:
+    def get_beta(self) -> pd.DataFrame:
         param_headers = [x for x in self.params.columns if x != "const"]
 
         beta_series = self.params[param_headers]
 
         return beta_series
+
+
+def rolling_least_squares(
+    y: npt.ArrayLike,
+    x: npt.ArrayLike,
+    window: int,
+    expanding: bool = False,
+    min_nobs: Optional[int] = None,
+) -> RollingLeastSquaresResults:
+    """
+    Rolling regression of y onto x with a constant in a single O(n) pass over running sums.
+
+    Missing observations are dropped from each window, consistent with statsmodels RollingOLS.
+
+    Parameters
+    ----------
+    y : array-like
+        - Dependent variable.
+    x : array-like
+        - Independent variable.
+    window : int
+        - Number of observations in each regression window.
+    expanding : bool, optional
+        - Fill the first window - 1 observations with an expanding window from min_nobs observations.
+    min_nobs : int, optional
+        - Minimum number of non-missing observations to estimate a window, defaults to 2.
+    """
+    y = np.asarray(y, dtype=float).ravel()
+    x = np.asarray(x, dtype=float).ravel()
+
+    if y.shape != x.shape:
+        raise ValueError("Dependent and independent variables must have the same length")
+    if window < 2:
+        raise ValueError("Window must be strictly larger than the number of regressors")
+
+    min_nobs = 2 if min_nobs is None else min_nobs
+
+    valid = ~(np.isnan(x) | np.isnan(y))
+
+    # Shift by the first valid observation to limit cancellation in the running sums
+    first = np.argmax(valid)
+    x_shift, y_shift = (x[first], y[first]) if valid.any() else (0.0, 0.0)
+    xc = np.where(valid, x - x_shift, 0.0)
+    yc = np.where(valid, y - y_shift, 0.0)
+
+    n = _window_sum(valid.astype(float), window)
+    sx = _window_sum(xc, window)
+    sy = _window_sum(yc, window)
+    sxx = _window_sum(xc * xc, window)
+    sxy = _window_sum(xc * yc, window)
+
+    estimable = n >= min_nobs
+    if not expanding:
+        estimable[: window - 1] = False
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        beta = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+        intercept_shifted = (sy - beta * sx) / n
+
+    beta[~estimable] = np.nan
+    intercept_shifted[~estimable] = np.nan
+
+    intercept = intercept_shifted + y_shift - beta * x_shift
+    residual = (y - y_shift) - intercept_shifted - beta * (x - x_shift)
+
+    return RollingLeastSquaresResults(intercept, beta, residual)
+
+
+def _window_sum(v: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing window sums (expanding for the first window - 1 observations).
+
+    Cumulative sums restart every window length block so each sum is the difference of at most a window's
+    worth of terms, avoiding the precision loss of differencing a single cumulative sum over long series.
+    """
+    n = len(v)
+    n_blocks = -(-n // window)
+
+    blocks = np.zeros(n_blocks * window)
+    blocks[:n] = v
+    cumulative = np.cumsum(blocks.reshape(n_blocks, window), axis=1)
+
+    t = np.arange(n)
+    block, offset = np.divmod(t, window)
+
+    sums = cumulative[block, offset]
+
+    # Add the tail of the previous block still inside the window
+    spill = (block > 0) & (offset < window - 1)
+    previous = block[spill] - 1
+    sums[spill] += cumulative[previous, -1] - cumulative[previous, offset[spill]]
+
+    return sums
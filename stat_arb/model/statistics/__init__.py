@@ -1,9 +1,32 @@
-from .cadf import CointegratedAugmentedDickeyFuller, CointegratedAugmentedDickeyFuller_Results
-from .ecm import ErrorCorrectionModel, ErrorCorrectionModel_Results
+from typing import TYPE_CHECKING
+
+from stat_arb.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .cadf import (
+        CointegratedAugmentedDickeyFuller,
+        CointegratedAugmentedDickeyFuller_BatchResults,
+        CointegratedAugmentedDickeyFuller_Results,
+    )
+    from .ecm import ErrorCorrectionModel, ErrorCorrectionModel_BatchResults, ErrorCorrectionModel_Results
 
 __all__ = [
     "CointegratedAugmentedDickeyFuller",
     "CointegratedAugmentedDickeyFuller_Results",
+    "CointegratedAugmentedDickeyFuller_BatchResults",
     "ErrorCorrectionModel",
     "ErrorCorrectionModel_Results",
+    "ErrorCorrectionModel_BatchResults",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CointegratedAugmentedDickeyFuller": ".cadf",
+        "CointegratedAugmentedDickeyFuller_BatchResults": ".cadf",
+        "CointegratedAugmentedDickeyFuller_Results": ".cadf",
+        "ErrorCorrectionModel": ".ecm",
+        "ErrorCorrectionModel_Results": ".ecm",
+        "ErrorCorrectionModel_BatchResults": ".ecm",
+    },
+)
@@ -1,6 +1,13 @@
+import logging
+from functools import lru_cache
+
+import numpy as np
+import numpy.typing as npt
 from statsmodels.tsa.adfvalues import mackinnoncrit, mackinnonp
 from statsmodels.tsa.stattools import adfuller
 
+logger = logging.getLogger(__name__)
+
 
 class CointegratedAugmentedDickeyFuller_Results:
     def __init__(self, test_statistic: float, p_value: float, criticial_values: list[float]):
@@ -34,6 +41,47 @@ class CointegratedAugmentedDickeyFuller_Results:
         }
 
 
+class CointegratedAugmentedDickeyFuller_BatchResults:
+    def __init__(
+        self,
+        test_statistics: np.ndarray,
+        p_values: np.ndarray,
+        critical_values: list[float],
+        used_lags: np.ndarray,
+    ):
+        self.t_stats = test_statistics
+        self.p_vals = p_values
+        self.c_vals = critical_values
+        self.used_lags = used_lags
+
+    def __len__(self) -> int:
+        return len(self.t_stats)
+
+    def __getitem__(self, i: int) -> CointegratedAugmentedDickeyFuller_Results:
+        return CointegratedAugmentedDickeyFuller_Results(self.t_stats[i], self.p_vals[i], self.c_vals)
+
+    def get_test_statistics(self) -> np.ndarray:
+        return self.t_stats
+
+    def get_p_values(self) -> np.ndarray:
+        return self.p_vals
+
+    def get_critical_values(self) -> list[float]:
+        return self.c_vals
+
+    def get_used_lags(self) -> np.ndarray:
+        return self.used_lags
+
+    def significant_at_one_pct(self) -> np.ndarray:
+        return self.p_vals < 0.01
+
+    def significant_at_five_pct(self) -> np.ndarray:
+        return self.p_vals < 0.05
+
+    def significant_at_ten_pct(self) -> np.ndarray:
+        return self.p_vals < 0.1
+
+
 class CointegratedAugmentedDickeyFuller:
     @staticmethod
     def test_stationarity(x, k_vars=1) -> CointegratedAugmentedDickeyFuller_Results:
@@ -51,9 +99,145 @@ class CointegratedAugmentedDickeyFuller:
 
         t_stat: float = adfuller(x)[0]
 
-        c_vals: list[float] = mackinnoncrit(N=k_vars, nobs=n_obs - 1)
+        c_vals: list[float] = critical_values(k_vars, n_obs - 1)
 
         # TODO: flexibility to relax regression="c" HARDCODE
         p_val: float = mackinnonp(teststat=t_stat, regression="c", N=k_vars)
 
         return CointegratedAugmentedDickeyFuller_Results(t_stat, p_val, c_vals)
+
+    @staticmethod
+    def test_stationarity_batch(
+        x: npt.ArrayLike, k_vars: int = 1, batch_size: int = 256
+    ) -> CointegratedAugmentedDickeyFuller_BatchResults:
+        """
+        Cointegrated Augmented Dickey Fuller stationarity test of many timeseries at once.
+
+        Matches adfuller with a constant and AIC lag selection, but shares the lagged difference design
+        across columns and reads the information criterion of every nested lag length off one Cholesky
+        factorisation rather than fitting an OLS per lag.
+
+        Parameters
+        ----------
+        x : array-like
+            - Timeseries of shape (n_obs, n_series) without missing values.
+        k_vars : int, optional
+            - Number of I(1) timeseries used to construct each cointegrated residual.
+        batch_size : int, optional
+            - Number of timeseries held in a design matrix at once, bounding memory.
+        """
+        x = np.asarray(x, dtype=float)
+        if x.ndim == 1:
+            x = x.reshape(-1, 1)
+        if np.isnan(x).any():
+            raise ValueError("Timeseries must not contain missing values")
+
+        n_obs, n_series = x.shape
+
+        t_stats = np.empty(n_series)
+        used_lags = np.empty(n_series, dtype=int)
+
+        for start in range(0, n_series, batch_size):
+            batch = slice(start, start + batch_size)
+            try:
+                t_stats[batch], used_lags[batch] = _adf_statistics(x[:, batch])
+            except np.linalg.LinAlgError:  # singular designs e.g. deterministic series
+                logger.warning(
+                    f"Singular ADF design in series {start} to {min(start + batch_size, n_series) - 1}, "
+                    "falling back to adfuller per series..."
+                )
+                for i in range(start, min(start + batch_size, n_series)):
+                    t_stats[i], _, used_lags[i] = adfuller(x[:, i])[:3]
+
+        p_vals = mackinnonp_vectorised(t_stats, N=k_vars)
+        c_vals = critical_values(k_vars, n_obs - 1)
+
+        return CointegratedAugmentedDickeyFuller_BatchResults(t_stats, p_vals, c_vals, used_lags)
+
+
+@lru_cache(maxsize=None)
+def _critical_values(k_vars: int, n_obs: int) -> tuple[float, ...]:
+    return tuple(mackinnoncrit(N=k_vars, regression="c", nobs=n_obs))
+
+
+def critical_values(k_vars: int, n_obs: int) -> list[float]:
+    """MacKinnon 1%, 5% and 10% critical values with a constant, cached per (k_vars, n_obs)."""
+    return list(_critical_values(k_vars, n_obs))
+
+
+def mackinnonp_vectorised(t_stats: np.ndarray, N: int = 1, regression: str = "c") -> np.ndarray:
+    """MacKinnon approximate p-values for an array of test statistics, via statsmodels mackinnonp."""
+    t_stats = np.asarray(t_stats, dtype=float)
+
+    p_vals = [mackinnonp(teststat=x, regression=regression, N=N) for x in t_stats.ravel()]
+
+    return np.array(p_vals, dtype=float).reshape(t_stats.shape)
+
+
+def _adf_statistics(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """ADF test statistics and AIC selected lags with a constant for each column of x."""
+    n_obs, n_series = x.shape
+
+    max_lag = int(np.ceil(12.0 * np.power(n_obs / 100.0, 1 / 4.0)))
+    max_lag = min(n_obs // 2 - 2, max_lag)
+    if max_lag < 0:
+        raise ValueError("sample size is too short to use selected regression component")
+
+    x_diff = np.diff(x, axis=0)
+
+    # Lag selection on a common sample: columns [const, level, Δx(t-1), ..., Δx(t-max_lag)]
+    design, target = _adf_design(x, x_diff, max_lag, constant_first=True)
+    n_sample, n_cols = design.shape[1:]
+
+    gram = design.transpose(0, 2, 1) @ design
+    moment = (design.transpose(0, 2, 1) @ target[..., None])[..., 0]
+    total = np.einsum("pt,pt->p", target, target)
+
+    # Leading blocks of the Cholesky factor are the factors of the nested designs, hence the residual sum of
+    # squares of every lag length follows from one triangular solve
+    chol = np.linalg.cholesky(gram)
+    projection = np.linalg.solve(chol, moment[..., None])[..., 0]
+    ssr = total[:, None] - np.cumsum(projection**2, axis=1)
+
+    n_params = np.arange(1, n_cols + 1)
+    aic = n_sample * np.log(ssr[:, 1:]) + 2 * n_params[1:]
+    best_lags = np.argmin(aic, axis=1)
+
+    # Rerun each selected lag on its full sample
+    t_stats = np.empty(n_series)
+    for lag in np.unique(best_lags):
+        columns = best_lags == lag
+        t_stats[columns] = _adf_t_statistic(x[:, columns], x_diff[:, columns], lag)
+
+    return t_stats, best_lags
+
+
+def _adf_t_statistic(x: np.ndarray, x_diff: np.ndarray, lag: int) -> np.ndarray:
+    design, target = _adf_design(x, x_diff, lag, constant_first=False)
+    n_sample, n_cols = design.shape[1:]
+
+    gram = design.transpose(0, 2, 1) @ design
+    moment = (design.transpose(0, 2, 1) @ target[..., None])[..., 0]
+
+    params = np.linalg.solve(gram, moment[..., None])[..., 0]
+    resid = target - (design @ params[..., None])[..., 0]
+    sigma2 = np.einsum("pt,pt->p", resid, resid) / (n_sample - n_cols)
+
+    unit = np.zeros((len(params), n_cols, 1))
+    unit[:, 0] = 1.0
+    level_variance = sigma2 * np.linalg.solve(gram, unit)[:, 0, 0]
+
+    return params[:, 0] / np.sqrt(level_variance)
+
+
+def _adf_design(x: np.ndarray, x_diff: np.ndarray, lag: int, constant_first: bool):
+    """Stacked ADF designs of shape (n_series, n_sample, lag + 2) and targets (n_series, n_sample)."""
+    lagged_diffs = [x_diff[lag - j : x_diff.shape[0] - j] for j in range(1, lag + 1)]  # noqa: E203
+    columns = [x[lag:-1]] + lagged_diffs
+    constant = np.ones_like(columns[0])
+    columns = [constant] + columns if constant_first else columns + [constant]
+
+    design = np.stack(columns, axis=-1).transpose(1, 0, 2)
+    target = x_diff[lag:].T
+
+    return design, target
@@ -1,16 +1,16 @@
 from typing import Union
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
-import statsmodels.api as sm
-from statsmodels.regression.linear_model import RegressionResultsWrapper
-
-RESIDUAL_STR = "(Lag 1, Residuals)"
+from scipy.stats import t as student_t
 
 
 class ErrorCorrectionModel_Results:
-    def __init__(self, ols_results: RegressionResultsWrapper):
-        self._ols = ols_results
+    def __init__(self, reversion_speed: float, standard_error: float, p_value: float):
+        self.reversion_speed = reversion_speed
+        self.standard_error = standard_error
+        self.p_value = p_value
 
     def is_long_run_mean_reverting(self, alpha: float = 0.05) -> bool:
         """
@@ -22,10 +22,43 @@ class ErrorCorrectionModel_Results:
             - Default is 0.05.
             - Significance level to test statistical significance of regressed residuals term.
         """
-        return bool(self._ols.pvalues[RESIDUAL_STR] < alpha)
+        return bool(self.p_value < alpha)
 
     def get_long_run_reversion_speed(self) -> float:
-        return self._ols.params[RESIDUAL_STR]
+        return self.reversion_speed
+
+    def get_standard_error(self) -> float:
+        return self.standard_error
+
+    def get_p_value(self) -> float:
+        return self.p_value
+
+
+class ErrorCorrectionModel_BatchResults:
+    def __init__(self, reversion_speeds: np.ndarray, standard_errors: np.ndarray, p_values: np.ndarray):
+        self.reversion_speeds = reversion_speeds
+        self.standard_errors = standard_errors
+        self.p_values = p_values
+
+    def __len__(self) -> int:
+        return len(self.reversion_speeds)
+
+    def __getitem__(self, i: int) -> ErrorCorrectionModel_Results:
+        return ErrorCorrectionModel_Results(
+            self.reversion_speeds[i], self.standard_errors[i], self.p_values[i]
+        )
+
+    def get_long_run_reversion_speeds(self) -> np.ndarray:
+        return self.reversion_speeds
+
+    def get_standard_errors(self) -> np.ndarray:
+        return self.standard_errors
+
+    def get_p_values(self) -> np.ndarray:
+        return self.p_values
+
+    def is_long_run_mean_reverting(self, alpha: float = 0.05) -> np.ndarray:
+        return self.p_values < alpha
 
 
 class ErrorCorrectionModel:
@@ -37,7 +70,10 @@ class ErrorCorrectionModel:
         reverse_regression: bool = False,
     ) -> ErrorCorrectionModel_Results:
         """
-        Fit the Error Correction Model.
+        Fit the Error Correction Model ΔX(t) = γ ΔY(t) + α residual(t-1) + ε(t) without a constant.
+
+        Observations with a missing price or lagged residual, e.g. a rolling regression's burn in, are
+        skipped.
 
         Parameters
         ----------
@@ -50,28 +86,58 @@ class ErrorCorrectionModel:
         reverse_regression : bool
             - Regress security Y on security X i.e. plugging in the "wrong way" residuals.
         """
-        ticker_x: str = getattr(price_x, "name", "X")
-        ticker_y: str = getattr(price_y, "name", "Y")
+        return ErrorCorrectionModel.fit_batch(price_x, price_y, residual, reverse_regression)[0]
+
+    @staticmethod
+    def fit_batch(
+        price_x: npt.ArrayLike,
+        price_y: npt.ArrayLike,
+        residuals: npt.ArrayLike,
+        reverse_regression: Union[bool, npt.ArrayLike] = False,
+    ) -> ErrorCorrectionModel_BatchResults:
+        """
+        Fit the Error Correction Model for many pairs at once from the 2x2 normal equations of each pair.
+
+        Parameters
+        ----------
+        price_x, price_y, residuals : array-like
+            - Timeseries of shape (n_obs, n_pairs), or (n_obs,) for a single pair, aligned by position.
+        reverse_regression : bool or array-like of bool
+            - Regress Y rather than X, for every pair or per pair. Passing each pair twice with
+              [False, True] tests both directions in one call.
+        """
+        x, y, resid = (np.asarray(a, dtype=float) for a in (price_x, price_y, residuals))
+        x, y, resid = (a.reshape(len(a), -1) for a in (x, y, resid))
+        x, y, resid = np.broadcast_arrays(x, y, resid)
+
+        reverse = np.broadcast_to(np.asarray(reverse_regression, dtype=bool), x.shape[1])
+
+        dx = np.diff(x, axis=0)
+        dy = np.diff(y, axis=0)
+        target = np.where(reverse, dy, dx)
+        other = np.where(reverse, dx, dy)
+        lagged = resid[:-1]
 
-        # Concatenate series then difference / lag as required
-        rhs = pd.concat([price_x, price_y, pd.Series(residual)], axis=1)
-        rhs.columns = pd.Index([ticker_x, ticker_y, "Residuals"])
+        valid = ~(np.isnan(target) | np.isnan(other) | np.isnan(lagged))
+        target, other, lagged = (np.where(valid, a, 0.0) for a in (target, other, lagged))
 
-        rhs[f"Δ{ticker_x}"] = rhs[ticker_x].diff()
-        rhs[f"Δ{ticker_y}"] = rhs[ticker_y].diff()
-        rhs[RESIDUAL_STR] = rhs["Residuals"].shift(1)
+        # Normal equations of target = gamma * other + alpha * lagged
+        s_oo = np.einsum("ij,ij->j", other, other)
+        s_ll = np.einsum("ij,ij->j", lagged, lagged)
+        s_ol = np.einsum("ij,ij->j", other, lagged)
+        s_ot = np.einsum("ij,ij->j", other, target)
+        s_lt = np.einsum("ij,ij->j", lagged, target)
 
-        rhs.dropna(inplace=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            det = s_oo * s_ll - s_ol**2
+            gamma = (s_ll * s_ot - s_ol * s_lt) / det
+            alpha = (s_oo * s_lt - s_ol * s_ot) / det
 
-        # Construct LHS (dependent) and RHS (independent) for regression
-        if not reverse_regression:
-            lhs = rhs[f"Δ{ticker_x}"]
-            rhs.drop(columns=[ticker_x, ticker_y, "Residuals", f"Δ{ticker_x}"], inplace=True)
-        else:  # reverse regression is True
-            lhs = rhs[f"Δ{ticker_y}"]
-            rhs.drop(columns=[ticker_x, ticker_y, "Residuals", f"Δ{ticker_y}"], inplace=True)
+            errors = target - gamma * other - alpha * lagged
+            df_resid = valid.sum(axis=0) - 2
+            sigma2 = np.einsum("ij,ij->j", errors, errors) / df_resid
 
-        # Regress
-        ols = sm.OLS(lhs, rhs).fit()
+            standard_errors = np.sqrt(sigma2 * s_oo / det)
+            p_values = 2 * student_t.sf(np.abs(alpha / standard_errors), df_resid)
 
-        return ErrorCorrectionModel_Results(ols)
+        return ErrorCorrectionModel_BatchResults(alpha, standard_errors, p_values)
@@ -1,8 +1,20 @@
-from .ornstein_uhlenbeck import OrnsteinUhlenbeckSDE, OrnsteinUhlenbeckSDE_Results
-from .rolling_window import RollingWindow, RollingWindowInputs
-from .strategy import TradingStrategy, TradingStrategyResults
-from .strategy_enum import StrategyEnum
-from .toy_strategy import ToyStrategy, ToyStrategyInputs
+from typing import TYPE_CHECKING
+
+from stat_arb.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .metrics import PerformanceMetrics, compute_metrics
+    from .ornstein_uhlenbeck import (
+        OrnsteinUhlenbeckSDE,
+        OrnsteinUhlenbeckSDE_Results,
+        OrnsteinUhlenbeckSDE_RollingResults,
+    )
+    from .ornstein_uhlenbeck_sde_fit import OrnsteinUhlenbeckSDEFit, OrnsteinUhlenbeckSDEFitInputs
+    from .rolling_window import RollingWindow, RollingWindowInputs
+    from .signal_state_machine import generate_signals
+    from .strategy import TradingStrategy, TradingStrategyResults
+    from .strategy_enum import StrategyEnum
+    from .toy_strategy import ToyStrategy, ToyStrategyInputs
 
 __all__ = [
     "TradingStrategy",
@@ -10,8 +22,35 @@ __all__ = [
     "StrategyEnum",
     "OrnsteinUhlenbeckSDE",
     "OrnsteinUhlenbeckSDE_Results",
+    "OrnsteinUhlenbeckSDE_RollingResults",
+    "OrnsteinUhlenbeckSDEFit",
+    "OrnsteinUhlenbeckSDEFitInputs",
     "ToyStrategy",
     "ToyStrategyInputs",
     "RollingWindow",
     "RollingWindowInputs",
+    "generate_signals",
+    "PerformanceMetrics",
+    "compute_metrics",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "PerformanceMetrics": ".metrics",
+        "compute_metrics": ".metrics",
+        "OrnsteinUhlenbeckSDE": ".ornstein_uhlenbeck",
+        "OrnsteinUhlenbeckSDE_Results": ".ornstein_uhlenbeck",
+        "OrnsteinUhlenbeckSDE_RollingResults": ".ornstein_uhlenbeck",
+        "OrnsteinUhlenbeckSDEFit": ".ornstein_uhlenbeck_sde_fit",
+        "OrnsteinUhlenbeckSDEFitInputs": ".ornstein_uhlenbeck_sde_fit",
+        "RollingWindow": ".rolling_window",
+        "RollingWindowInputs": ".rolling_window",
+        "generate_signals": ".signal_state_machine",
+        "TradingStrategy": ".strategy",
+        "TradingStrategyResults": ".strategy",
+        "StrategyEnum": ".strategy_enum",
+        "ToyStrategy": ".toy_strategy",
+        "ToyStrategyInputs": ".toy_strategy",
+    },
+)
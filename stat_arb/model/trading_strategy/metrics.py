@@ -0,0 +1,135 @@
+import warnings
+from dataclasses import dataclass, fields
+from typing import Optional
+
+import numpy as np
+
+TRADING_DAYS = 252
+ROLLING_WINDOW = 63  # observations in each rolling Sharpe ratio, roughly a quarter
+
+
+@dataclass(frozen=True)
+class PerformanceMetrics:
+    """
+    Backtest statistics, floats for a single returns series or arrays with one entry per column of a returns
+    matrix. The risk free rate is taken as 0 - common in practice.
+    """
+
+    cumulative_return: float | np.ndarray
+    sharpe_ratio: float | np.ndarray
+    sortino_ratio: float | np.ndarray
+    annualised_return: float | np.ndarray
+    annualised_volatility: float | np.ndarray
+    max_drawdown: float | np.ndarray
+    max_drawdown_duration: int | np.ndarray  # longest stretch of observations below a previous peak
+    hit_rate: float | np.ndarray  # share of invested observations with a positive return
+    turnover: float | np.ndarray  # annualised sum of absolute position changes, nan without positions
+    rolling_sharpe: np.ndarray  # annualised Sharpe ratio of each trailing window, same shape as the returns
+
+    def to_dict(self) -> dict:
+        """Summary statistics, excluding the rolling Sharpe ratio series."""
+        return {x.name: getattr(self, x.name) for x in fields(self) if x.name != "rolling_sharpe"}
+
+
+def compute_metrics(
+    returns: np.ndarray, positions: Optional[np.ndarray] = None, rolling_window: int = ROLLING_WINDOW
+) -> PerformanceMetrics:
+    """
+    Every metric of a returns series, or of each column of a (n_obs, n_series) returns matrix, at once.
+
+    Missing returns, e.g. before the first position, are skipped as pandas would.
+
+    Parameters
+    ----------
+    returns : np.ndarray
+        - Period returns, shape (n_obs,) or (n_obs, n_series).
+    positions : np.ndarray, optional
+        - Position held at each observation, same shape as returns, for the turnover.
+    rolling_window : int
+        - Observations in each rolling Sharpe ratio.
+    """
+    returns = np.asarray(returns, dtype=float)
+    squeeze = returns.ndim == 1
+    if squeeze:
+        returns = returns[:, None]
+
+    n_obs = returns.shape[0]
+    valid = ~np.isnan(returns)
+    filled = np.where(valid, returns, 0.0)
+
+    with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # columns without trades or downside returns
+
+        count = valid.sum(axis=0)
+        mean = filled.sum(axis=0) / count
+        vol = np.sqrt(np.sum(np.where(valid, returns - mean, 0.0) ** 2, axis=0) / (count - 1))
+
+        downside = returns < 0
+        downside_count = downside.sum(axis=0)
+        downside_mean = np.where(downside, returns, 0.0).sum(axis=0) / downside_count
+        downside_vol = np.sqrt(
+            np.sum(np.where(downside, returns - downside_mean, 0.0) ** 2, axis=0) / (downside_count - 1)
+        )
+
+        cumulative = np.cumprod(1 + filled, axis=0)
+        cum_return = cumulative[-1]
+
+        peak = np.maximum.accumulate(cumulative, axis=0)
+        drawdown = cumulative / peak - 1
+
+        index = np.arange(n_obs)[:, None]
+        last_peak = np.maximum.accumulate(np.where(drawdown < 0, 0, index), axis=0)  # first row is a peak
+        drawdown_duration = np.max(index - last_peak, axis=0)
+
+        invested = valid & (returns != 0)
+        hit_rate = np.sum(returns > 0, axis=0) / invested.sum(axis=0)
+
+        if positions is None:
+            turnover = np.full(returns.shape[1], np.nan)
+        else:
+            positions = np.asarray(positions, dtype=float).reshape(returns.shape)
+            changes = np.abs(np.diff(np.nan_to_num(positions), axis=0)).sum(axis=0)
+            turnover = changes / max(n_obs - 1, 1) * TRADING_DAYS
+
+        rolling_sharpe = _rolling_sharpe(filled, valid, rolling_window)
+
+        metrics = PerformanceMetrics(
+            cumulative_return=cum_return,
+            sharpe_ratio=mean / vol * np.sqrt(TRADING_DAYS),
+            sortino_ratio=mean / downside_vol * np.sqrt(TRADING_DAYS),
+            annualised_return=cum_return ** (TRADING_DAYS / count) - 1,
+            annualised_volatility=vol * np.sqrt(TRADING_DAYS),
+            max_drawdown=np.min(drawdown, axis=0),
+            max_drawdown_duration=drawdown_duration,
+            hit_rate=hit_rate,
+            turnover=turnover,
+            rolling_sharpe=rolling_sharpe,
+        )
+
+    if not squeeze:
+        return metrics
+
+    return PerformanceMetrics(
+        **{k: v[0].item() for k, v in metrics.to_dict().items()}, rolling_sharpe=rolling_sharpe[:, 0]
+    )
+
+
+def _rolling_sharpe(filled: np.ndarray, valid: np.ndarray, window: int) -> np.ndarray:
+    """Annualised Sharpe ratio of each trailing window from running sums, nan where a return is missing."""
+    rolling_sharpe = np.full(filled.shape, np.nan)
+    if window < 2 or filled.shape[0] < window:
+        return rolling_sharpe
+
+    def window_sum(x: np.ndarray) -> np.ndarray:
+        total = np.cumsum(x, axis=0)
+        total[window:] = total[window:] - total[:-window]
+        return total[window - 1 :]  # noqa: E203
+
+    count = window_sum(valid.astype(float))
+    mean = window_sum(filled) / window
+    var = (window_sum(filled**2) - window * mean**2) / (window - 1)
+
+    sharpe = mean / np.sqrt(np.maximum(var, 0)) * np.sqrt(TRADING_DAYS)
+    rolling_sharpe[window - 1 :] = np.where(count == window, sharpe, np.nan)  # noqa: E203
+
+    return rolling_sharpe
@@ -2,7 +2,8 @@ from typing import Union
 
 import numpy as np
 import pandas as pd
-from statsmodels.tsa.ar_model import AutoReg, AutoRegResultsWrapper
+
+TAU = 1 / 252  # 252 for daily returns (effectively a HARDCODE)
 
 
 class OrnsteinUhlenbeckSDE_Results:
@@ -22,6 +23,31 @@ class OrnsteinUhlenbeckSDE_Results:
         return self.__half_life_working_days
 
 
+class OrnsteinUhlenbeckSDE_RollingResults:
+    def __init__(self, mu: np.ndarray, sigma: np.ndarray, half_life: np.ndarray, window_length: int):
+        """Parameters fitted on the window ending at each observation, nan before the first full window."""
+        self.mu = mu
+        self.sigma = sigma
+        self.half_life = half_life
+        self.window_length = window_length
+
+    def __getitem__(self, i: int) -> OrnsteinUhlenbeckSDE_Results:
+        return OrnsteinUhlenbeckSDE_Results(self.mu[i], self.sigma[i], self.half_life[i])
+
+    def get_mu(self) -> np.ndarray:
+        return self.mu
+
+    def get_sigma(self) -> np.ndarray:
+        return self.sigma
+
+    def get_half_life_in_working_days(self) -> np.ndarray:
+        return self.half_life
+
+    def s_score(self, x: Union[np.ndarray, pd.Series]) -> np.ndarray:
+        """Distance of x from equilibrium in equilibrium standard deviations, as per Avellaneda and Lee."""
+        return (np.asarray(x, dtype=float) - self.mu) / self.sigma
+
+
 class OrnsteinUhlenbeckSDE:
     def __init__(self, x: Union[np.ndarray, pd.Series]):
         self.x = x
@@ -30,29 +56,94 @@ class OrnsteinUhlenbeckSDE:
         """
         Fit stationary process to Ornstein-Uhlenbeck SDE.
 
+        The AR(1) regression x(t) = a + b x(t-1) + e(t) is solved in closed form, the Ornstein-Uhlenbeck
+        parameters then follow from a, b and the variance of e.
+
+        Pairs with a missing observation are skipped, rather than joining the observations either side of a
+        gap as if they were consecutive.
+
         Referece: Statistical Arbitrage in the U.S. Equities Market, Marco Avellaneda and Jeong-Hyun Lee
         """
-        ar: AutoRegResultsWrapper = self._fit_autoregressive_model()
+        x = np.asarray(self.x, dtype=float)
+
+        shift = np.nanmean(x)
+        terms = _pair_terms(x - shift)
+
+        valid = ~np.isnan(terms[0] + terms[1])
+        sums = [np.sum(t[valid]) for t in terms]
+        a, b, resid_var = _autoregression(np.count_nonzero(valid), *sums, shift=shift)
+
+        return OrnsteinUhlenbeckSDE_Results(*_sde_parameters(a, b, resid_var))
+
+    def rolling_fit(self, window_length: int) -> OrnsteinUhlenbeckSDE_RollingResults:
+        """
+        Fit the Ornstein-Uhlenbeck SDE on every trailing window of window_length observations.
+
+        Each window's AR(1) regression is read off running sums of x(t-1), x(t) and their products, so the
+        cost is O(n) regardless of the window length. Windows with a missing observation are nan.
+        """
+        if window_length < 3:
+            raise ValueError("Window length must be at least 3 observations")
+
+        x = np.asarray(self.x, dtype=float)
+        n_obs = len(x)
+        n_pairs = window_length - 1
+
+        mu, sigma, half_life = (np.full(n_obs, np.nan) for _ in range(3))
+        if n_obs < window_length:
+            return OrnsteinUhlenbeckSDE_RollingResults(mu, sigma, half_life, window_length)
+
+        shift = np.nanmean(x)  # centring keeps the running sums well conditioned
+        terms = _pair_terms(x - shift)
+
+        valid = ~np.isnan(terms[0] + terms[1])
+        count = _window_sum(valid.astype(float), n_pairs)
+        sums = [_window_sum(np.where(valid, t, 0.0), n_pairs) for t in terms]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            a, b, resid_var = _autoregression(n_pairs, *sums, shift=shift)
+            parameters = _sde_parameters(a, b, resid_var)
+
+        for out, values in zip((mu, sigma, half_life), parameters):
+            out[window_length - 1 :] = np.where(count == n_pairs, values, np.nan)  # noqa: E203
+
+        return OrnsteinUhlenbeckSDE_RollingResults(mu, sigma, half_life, window_length)
+
+
+def _pair_terms(x: np.ndarray) -> list[np.ndarray]:
+    """x(t-1), x(t) and their products, the sufficient statistics of an AR(1) regression."""
+    lag, lead = x[:-1], x[1:]
+    return [lag, lead, lag * lag, lag * lead, lead * lead]
+
+
+def _window_sum(x: np.ndarray, window: int) -> np.ndarray:
+    total = np.cumsum(x)
+    total[window:] = total[window:] - total[:-window]
+    return total[window - 1 :]  # noqa: E203
+
 
-        param_dict = dict(zip(ar.model.exog_names, ar.params))
+def _autoregression(n, s_lag, s_lead, s_lag_lag, s_lag_lead, s_lead_lead, *, shift=0.0):
+    """AR(1) intercept, slope and residual variance from sums over n pairs of x - shift."""
+    var_lag = s_lag_lag - s_lag**2 / n
+    cov = s_lag_lead - s_lag * s_lead / n
+    var_lead = s_lead_lead - s_lead**2 / n
 
-        a = param_dict["const"]
-        b = param_dict["y.L1"]
-        ar_resid_var = ar.resid.var()
+    b = cov / var_lag
+    a = (s_lead - b * s_lag) / n + shift * (1 - b)
+    resid_var = (var_lead - b * cov) / n
 
-        tau = 1 / 252  # 252 for daily returns (effectively a HARDCODE)
+    return a, b, resid_var
 
-        mu_e = a / (1 - b)  # equilibrium level of residual
-        k = -np.log(b) / tau  # speed of mean reversion
-        half_life_working_days = np.log(2) / k / tau
-        sigma = np.sqrt((ar_resid_var * 2 * k) / (1 - b**2))
-        sigma_eq = sigma / np.sqrt(2 * k)
 
-        return OrnsteinUhlenbeckSDE_Results(mu_e, sigma_eq, half_life_working_days)
+def _sde_parameters(a, b, resid_var):
+    """Equilibrium level, equilibrium standard deviation and half life in observations."""
+    mu_e = a / (1 - b)  # equilibrium level of residual
+    k = -np.log(b) / TAU  # speed of mean reversion
+    half_life_working_days = np.log(2) / k / TAU
+    sigma = np.sqrt((resid_var * 2 * k) / (1 - b**2))
+    sigma_eq = sigma / np.sqrt(2 * k)
 
-    def _fit_autoregressive_model(self) -> AutoRegResultsWrapper:
-        ar = AutoReg(self.x, lags=1, trend="c")
-        return ar.fit()
+    return mu_e, sigma_eq, half_life_working_days
 
 
 if __name__ == "__main__":
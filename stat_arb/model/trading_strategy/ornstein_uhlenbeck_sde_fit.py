@@ -0,0 +1,44 @@
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from stat_arb.model.trading_strategy.ornstein_uhlenbeck import OrnsteinUhlenbeckSDE
+from stat_arb.model.trading_strategy.strategy import TradingStrategy, TradingStrategyResults
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OrnsteinUhlenbeckSDEFitInputs:
+    enter_threshold: float
+    exit_threshold: float
+    window_length: int
+
+
+class OrnsteinUhlenbeckSDEFit(TradingStrategy):
+    """
+    Avellaneda and Lee s-score strategy: trade the residual's distance from the equilibrium of an
+    Ornstein-Uhlenbeck process refitted on each trailing window.
+
+    Windows whose AR(1) fit is not mean reverting score 0, closing any open position.
+    """
+
+    def backtest(self, inputs: Optional[OrnsteinUhlenbeckSDEFitInputs] = None) -> TradingStrategyResults:
+        if inputs is None:
+            inputs = OrnsteinUhlenbeckSDEFitInputs(enter_threshold=1.25, exit_threshold=0.5, window_length=60)
+
+        s_score = s_scores(self.resids, inputs.window_length)
+
+        return self._backtest(s_score, inputs.enter_threshold, inputs.exit_threshold)
+
+
+def s_scores(resids: np.ndarray, window_length: int) -> np.ndarray:
+    """s-score of each observation against the OU fit of the window ending there, 0 where there is no fit."""
+    fit = OrnsteinUhlenbeckSDE(resids).rolling_fit(window_length)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        s_score = fit.s_score(resids)
+
+    return np.where(np.isfinite(s_score), s_score, 0.0)
@@ -0,0 +1,115 @@
+import numpy as np
+import numpy.typing as npt
+
+LONG = 1
+FLAT = 0
+SHORT = -1
+
+
+def generate_signals(
+    long_entry: npt.ArrayLike,
+    short_entry: npt.ArrayLike,
+    long_exit: npt.ArrayLike,
+    short_exit: npt.ArrayLike,
+) -> np.ndarray:
+    """
+    Convert entry / exit signal flags into positions with an array based state machine.
+
+    Transitions from the current position, evaluated for each observation:
+        - Flat  : long entry -> long, else short entry -> short, else flat.
+        - Long  : short entry -> short, else long exit -> flat, else long.
+        - Short : long entry -> long, else short exit -> flat, else short.
+
+    Parameters
+    ----------
+    long_entry, short_entry, long_exit, short_exit : array-like of bool
+        - Signal flags of shape (n,) or (n, k) i.e. k independent strategies stacked column-wise.
+
+    Returns
+    -------
+    np.ndarray
+        - Positions in {-1, 0, 1} as int8 with the same shape as the inputs.
+    """
+    le, se, lx, sx = (np.asarray(x, dtype=bool) for x in (long_entry, short_entry, long_exit, short_exit))
+
+    if not (le.shape == se.shape == lx.shape == sx.shape):
+        raise ValueError("Signal arrays must share the same shape")
+
+    is_vector = le.ndim == 1
+    if is_vector:
+        le, se, lx, sx = (x.reshape(-1, 1) for x in (le, se, lx, sx))
+
+    # Transitions which depend on the current position in more than a "hold or exit" manner only occur for
+    # degenerate thresholds (e.g. exit beyond enter) and fall back to a prefix scan.
+    state_dependent = (le & se) | (le & lx) | (se & sx)
+
+    scan_columns = state_dependent.any(axis=0)
+
+    signals = np.empty(le.shape, dtype=np.int8)
+    for columns, engine in (
+        (~scan_columns, _generate_signals_vectorised),
+        (scan_columns, _generate_signals_scan),
+    ):
+        if columns.any():
+            signals[:, columns] = engine(le[:, columns], se[:, columns], lx[:, columns], sx[:, columns])
+
+    return signals.ravel() if is_vector else signals
+
+
+def _generate_signals_vectorised(
+    le: np.ndarray, se: np.ndarray, lx: np.ndarray, sx: np.ndarray
+) -> np.ndarray:
+    """
+    Forward fill positions from observations which set the position regardless of the current position.
+
+    Assumes no state dependent transitions i.e. each observation either sets the position, holds it, or
+    exits a long (short) position only when one is held.
+    """
+    n = le.shape[0]
+    idx = np.arange(n).reshape(-1, 1)
+
+    set_long = le
+    set_short = se
+    set_flat = lx & sx
+    set_mask = set_long | set_short | set_flat
+
+    set_value = np.zeros(le.shape, dtype=np.int8)
+    set_value[set_long] = LONG
+    set_value[set_short] = SHORT
+
+    # Position established by the most recent setting observation, flat before any
+    last_set = np.maximum.accumulate(np.where(set_mask, idx, -1), axis=0)
+    base = np.take_along_axis(set_value, np.maximum(last_set, 0), axis=0)
+    base[last_set < 0] = FLAT
+
+    # An exit only bites when the matching position is held, after which the position stays flat until
+    # the next setting observation
+    exit_hit = ((base == LONG) & lx) | ((base == SHORT) & sx)
+    last_exit = np.maximum.accumulate(np.where(exit_hit, idx, -1), axis=0)
+
+    return np.where(last_exit > last_set, FLAT, base)
+
+
+def _generate_signals_scan(le: np.ndarray, se: np.ndarray, lx: np.ndarray, sx: np.ndarray) -> np.ndarray:
+    """
+    Apply the full transition table with a parallel prefix scan over transition functions.
+
+    Each observation maps the current position to the next, encoded as a lookup over the three positions.
+    Composition of such maps is associative, so the positions follow from log2(n) vectorised compositions
+    rather than stepping through time.
+    """
+    # Lookup index is position + 1 i.e. [short, flat, long]
+    from_short = np.where(le, LONG, np.where(sx, FLAT, SHORT))
+    from_flat = np.where(le, LONG, np.where(se, SHORT, FLAT))
+    from_long = np.where(se, SHORT, np.where(lx, FLAT, LONG))
+
+    transitions = np.stack([from_short, from_flat, from_long], axis=-1).astype(np.int8) + 1
+
+    # Inclusive scan: transitions[i] becomes the composition of every transition up to and including i
+    offset = 1
+    while offset < len(transitions):
+        composed = np.take_along_axis(transitions[offset:], transitions[:-offset], axis=-1)
+        transitions = np.concatenate([transitions[:offset], composed])
+        offset *= 2
+
+    return transitions[..., FLAT + 1] - 1
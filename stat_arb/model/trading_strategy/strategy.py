@@ -1,76 +1,190 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Union
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
+from stat_arb.model.trading_strategy.metrics import PerformanceMetrics, compute_metrics
+from stat_arb.model.trading_strategy.signal_state_machine import generate_signals
 
-class TradingStrategyResults:
-    REQUIRED_COLUMNS = ["Residual", "Cumulative_return", "Portfolio_return"]
-
-    def __init__(self, backtest: pd.DataFrame):
-        self._validate(backtest)
-        self._backtest = backtest
 
-    def _validate(self, df):
-        missing = set(self.REQUIRED_COLUMNS) - set(df.columns)
-        if missing:
-            raise ValueError(f"Missing fields: {missing}")
+@dataclass(eq=False)
+class TradingStrategyResults:
+    """
+    Compact backtest record: int8 positions and one float array per series, all on a shared index.
+
+    Entry / exit signals, leg returns and the wide DataFrame of get_backtest are derived on request rather
+    than stored, so many results can be held at once e.g. during a sweep.
+    """
+
+    index: pd.Index
+    name_x: str
+    name_y: str
+    price_x: np.ndarray
+    price_y: np.ndarray
+    resids: np.ndarray
+    beta: float | np.ndarray  # scalar for a constant hedge ratio
+    z_score: np.ndarray
+    positions: np.ndarray  # int8 in {-1, 0, 1}
+    enter_threshold: float
+    exit_threshold: float
+    portfolio_return: np.ndarray
+
+    def signals(self) -> pd.DataFrame:
+        z = self.z_score
+        return pd.DataFrame(
+            {
+                "LongEntrySignal": z < -self.enter_threshold,
+                "ShortEntrySignal": z > self.enter_threshold,
+                "LongExitSignal": z > -self.exit_threshold,
+                "ShortExitSignal": z < self.exit_threshold,
+            },
+            index=self.index,
+        )
+
+    def get_backtest(self) -> pd.DataFrame:
+        """Wide view of every series, built on each call."""
+        df = pd.DataFrame(
+            {
+                f"{self.name_x}_close": self.price_x,
+                f"{self.name_y}_close": self.price_y,
+                "Residual": self.resids,
+                "Beta": np.broadcast_to(self.beta, self.resids.shape),
+                "Z-Score": self.z_score,
+            },
+            index=self.index,
+        )
+        df = pd.concat([df, self.signals()], axis=1)
+
+        df["Signal"] = self.positions
+        df[f"{self.name_x}_returns"] = _pct_change(self.price_x)
+        df[f"{self.name_y}_returns"] = _pct_change(self.price_y)
+        df["Portfolio_return"] = self.portfolio_return
+        df["Cumulative_return"] = self.cumulative_return
+
+        return df
 
-    def get_backtest(self):
-        return self._backtest
+    @property
+    def nbytes(self) -> int:
+        arrays = [self.price_x, self.price_y, self.resids, self.beta, self.z_score, self.positions]
+        return sum(np.asarray(x).nbytes for x in arrays + [self.portfolio_return])
 
     @property
     def period_return(self) -> pd.Series:
-        return self._backtest["Portfolio_return"]
+        return pd.Series(self.portfolio_return, index=self.index, name="Portfolio_return")
 
     @property
     def cumulative_return(self) -> pd.Series:
-        return self._backtest["Cumulative_return"]
+        return (1 + self.period_return).cumprod().rename("Cumulative_return")
 
     def get_cum_return(self) -> float:
         return self.cumulative_return.iloc[-1]
 
-    def get_sharpe_ratio(self) -> float:
-        """Set risk free rate to 0 - common in practice"""
-        rfr = 0
-        excess_return = self.period_return - rfr
-
-        daily_sharpe = excess_return.mean() / excess_return.std()
+    @cached_property
+    def metrics(self) -> PerformanceMetrics:
+        """Every performance metric, computed together on first access."""
+        return compute_metrics(self.portfolio_return, self.positions)
 
-        annualised_sharpe = daily_sharpe * np.sqrt(252)
-
-        return annualised_sharpe
+    def get_sharpe_ratio(self) -> float:
+        return float(self.metrics.sharpe_ratio)
 
     def get_sortino_ratio(self) -> float:
-        """Set risk free rate to 0 - common in practice"""
-        rfr = 0
-        excess_return = self.period_return - rfr
-        downside_excess_return = excess_return[excess_return < 0]
-
-        daily_sortino = excess_return.mean() / downside_excess_return.std()
-
-        annualised_sortino = daily_sortino * np.sqrt(252)
-
-        return annualised_sortino
+        return float(self.metrics.sortino_ratio)
 
     def get_max_drawdown(self) -> float:
-        rolling_max = self.cumulative_return.cummax()
-
-        daily_drawdown = (self.cumulative_return / rolling_max) - 1
-
-        return daily_drawdown.min()
+        return float(self.metrics.max_drawdown)
 
     def get_annualised_return(self) -> float:
-        trading_days = self.period_return.notna().sum()
-        trading_years = trading_days / 252
-
-        return (self.get_cum_return() ** (1 / trading_years)) - 1
+        return float(self.metrics.annualised_return)
 
     def get_annualised_vol(self) -> float:
-        return self.period_return.std() * np.sqrt(252)
+        return float(self.metrics.annualised_volatility)
 
 
 class TradingStrategy(ABC):
+    """
+    Trade the spread price_x - beta * price_y on a z-score of the residual.
+
+    Inputs are aligned by position on the index of price_x. Pass dtype=np.float32 to halve the memory of
+    each backtest at the cost of precision.
+    """
+
+    def __init__(
+        self,
+        resids: Union[pd.Series, np.ndarray],
+        price_x: pd.Series,
+        price_y: pd.Series,
+        beta: Union[pd.Series, pd.DataFrame, np.ndarray, float],
+        dtype: npt.DTypeLike = np.float64,
+    ) -> None:
+        self.index = price_x.index
+        self.name_x = str(price_x.name)
+        self.name_y = str(price_y.name)
+        self.dtype = np.dtype(dtype)
+
+        self.price_x = self._as_array(price_x)
+        self.price_y = self._as_array(price_y)
+        self.resids = self._as_array(resids)
+        self.beta = self._as_beta(beta)
+
     @abstractmethod
     def backtest(self, inputs) -> TradingStrategyResults:
         pass
+
+    def _backtest(
+        self, z_score: np.ndarray, enter_threshold: float, exit_threshold: float
+    ) -> TradingStrategyResults:
+        """Positions from z-score thresholds, held from the following observation."""
+        z_score = np.asarray(z_score, dtype=self.dtype)
+
+        positions = generate_signals(
+            z_score < -enter_threshold,
+            z_score > enter_threshold,
+            z_score > -exit_threshold,
+            z_score < exit_threshold,
+        )
+
+        beta = self.beta if isinstance(self.beta, float) else self.beta[1:]
+        spread_returns = _pct_change(self.price_x)[1:] - beta * _pct_change(self.price_y)[1:]
+
+        portfolio_return = np.full(len(positions), np.nan, dtype=self.dtype)
+        portfolio_return[1:] = positions[:-1] * spread_returns
+
+        return TradingStrategyResults(
+            self.index,
+            self.name_x,
+            self.name_y,
+            self.price_x,
+            self.price_y,
+            self.resids,
+            self.beta,
+            z_score,
+            positions,
+            enter_threshold,
+            exit_threshold,
+            portfolio_return,
+        )
+
+    def _as_array(self, x: Union[pd.Series, np.ndarray]) -> np.ndarray:
+        values = np.asarray(x, dtype=self.dtype).reshape(-1)
+        if len(values) != len(self.index):
+            raise ValueError(f"Expected {len(self.index)} observations, got {len(values)}")
+
+        return values
+
+    def _as_beta(self, beta: Union[pd.Series, pd.DataFrame, np.ndarray, float]) -> float | np.ndarray:
+        """A scalar for a single hedge ratio, else one per observation."""
+        values = np.asarray(beta, dtype=self.dtype)
+        if values.size == 1:
+            return values.item()
+
+        return self._as_array(values)
+
+
+def _pct_change(x: np.ndarray) -> np.ndarray:
+    change = np.full(x.shape, np.nan, dtype=x.dtype)
+    change[1:] = x[1:] / x[:-1] - 1
+    return change
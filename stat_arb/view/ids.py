@@ -3,6 +3,18 @@ REGRESSION_INPUT = "regression-input"
 
 
 class IDS:
+    class SESSION:
+        ID = "session-id"
+
+    class JOBS:
+        POLL_INTERVAL = 500  # milliseconds
+        REGRESSION = "regression-job"
+        REGRESSION_INTERVAL = "regression-job-interval"
+        REGRESSION_PROGRESS = "regression-job-progress"
+        STRATEGY = "strategy-job"
+        STRATEGY_INTERVAL = "strategy-job-interval"
+        STRATEGY_PROGRESS = "strategy-job-progress"
+
     class STORE_INPUTS:
         DATE_RANGE = "date-range"
         TICKER_A = "ticker-a"
@@ -26,6 +38,14 @@ class IDS:
         class ID_ROLLING_WINDOW_REGRESSION:
             WINDOW_LENGTH = {"id_type": REGRESSION_INPUT, "name": "rolling-window", "property": "length"}
 
+        class ID_KALMAN_FILTER_REGRESSION:
+            DELTA = {"id_type": REGRESSION_INPUT, "name": "kalman-filter", "property": "delta"}
+            OBSERVATION_VARIANCE = {
+                "id_type": REGRESSION_INPUT,
+                "name": "kalman-filter",
+                "property": "observation-variance",
+            }
+
     class STATISTICS:
         ADF_RESULT = "adf-result"
         ECM_RESULT = "ecm-result"
@@ -50,3 +70,8 @@ class IDS:
             ENTER = {"id_type": STRATEGY_INPUT, "name": "rolling-window", "property": "enter"}
             EXIT = {"id_type": STRATEGY_INPUT, "name": "rolling-window-exit", "property": "exit"}
             LENGTH = {"id_type": STRATEGY_INPUT, "name": "rolling-window", "property": "length"}
+
+        class ID_OU_STRATEGY:
+            ENTER = {"id_type": STRATEGY_INPUT, "name": "ou-strategy", "property": "enter"}
+            EXIT = {"id_type": STRATEGY_INPUT, "name": "ou-strategy", "property": "exit"}
+            LENGTH = {"id_type": STRATEGY_INPUT, "name": "ou-strategy", "property": "length"}
@@ -1,4 +1,5 @@
 import datetime as dt
+import uuid
 
 import dash_bootstrap_components as dbc
 from dash import dcc, html
@@ -12,6 +13,7 @@ def layout():
     return html.Div(
         [
             html.H1("Pairs Trading Dashboard", style={"marginTop": "20px"}),
+            dcc.Store(id=IDS.SESSION.ID, data=str(uuid.uuid4())),
             html.Div(
                 [
                     html.H3("Step 1: Select Data Source", style={"marginTop": "20px"}),
@@ -86,6 +88,11 @@ def layout():
                     dcc.RadioItems(regression_callbacks.get_regressor_options(), id=IDS.REGRESSION.TYPE),
                     html.Div(id=IDS.REGRESSION.TYPE_DESC, style={"marginTop": "10px"}),
                     html.Div(id=IDS.REGRESSION.INPUTS_DIV),
+                    dcc.Store(id=IDS.JOBS.REGRESSION),
+                    dcc.Interval(
+                        id=IDS.JOBS.REGRESSION_INTERVAL, interval=IDS.JOBS.POLL_INTERVAL, disabled=True
+                    ),
+                    html.Div(id=IDS.JOBS.REGRESSION_PROGRESS, style={"marginTop": "10px"}),
                     dcc.Graph(id=IDS.GRAPHS.RESIDUAL),
                 ]
             ),
@@ -122,6 +129,11 @@ def layout():
                     html.H3("Step 5: Select Trading Strategy", style={"marginTop": "20px"}),
                     dcc.RadioItems(strategy_callbacks.get_strategy_options(), id=IDS.STRATEGY.TYPE),
                     html.Div(id=IDS.STRATEGY.INPUTS_DIV),
+                    dcc.Store(id=IDS.JOBS.STRATEGY),
+                    dcc.Interval(
+                        id=IDS.JOBS.STRATEGY_INTERVAL, interval=IDS.JOBS.POLL_INTERVAL, disabled=True
+                    ),
+                    html.Div(id=IDS.JOBS.STRATEGY_PROGRESS, style={"marginTop": "10px"}),
                     dcc.Graph(id=IDS.STRATEGY.OUTPUT_BACKTEST_PLOT),
                     html.Div(id=IDS.STRATEGY.OUTPUT_DIV, style={"marginTop": "20px"}),
                 ]
@@ -29,3 +29,44 @@ def rolling_window_regressor_inputs():
             dcc.Store(id=IDS.REGRESSION.INPUTS_STORE),
         ]
     )
+
+
+def kalman_filter_regressor_inputs():
+    return html.Div(
+        [
+            html.Div(
+                [
+                    html.P("Choose State Transition Delta"),
+                    html.Div(
+                        dcc.Input(
+                            type="number",
+                            min=0,
+                            max=1,
+                            step=1e-5,
+                            value=1e-4,
+                            id=IDS.REGRESSION.ID_KALMAN_FILTER_REGRESSION.DELTA,
+                        ),
+                        style={"width": "400px"},
+                    ),
+                ],
+                style={"display": "flex", "width": "50%", "marginTop": "20px"},
+            ),
+            html.Div(
+                [
+                    html.P("Choose Observation Variance"),
+                    html.Div(
+                        dcc.Input(
+                            type="number",
+                            min=0,
+                            step=1e-4,
+                            value=1e-3,
+                            id=IDS.REGRESSION.ID_KALMAN_FILTER_REGRESSION.OBSERVATION_VARIANCE,
+                        ),
+                        style={"width": "400px"},
+                    ),
+                ],
+                style={"display": "flex", "width": "50%", "marginTop": "10px"},
+            ),
+            dcc.Store(id=IDS.REGRESSION.INPUTS_STORE),
+        ]
+    )
@@ -54,3 +54,32 @@ def rolling_window_inputs():
             dcc.Store(id=IDS.STRATEGY.INPUTS_STORE),
         ]
     )
+
+
+def ou_strategy_inputs():
+    return html.Div(
+        [
+            html.Div(
+                [
+                    html.Label("Enter s-score: "),
+                    dcc.Input(type="number", value=1.25, step=0.01, id=IDS.STRATEGY.ID_OU_STRATEGY.ENTER),
+                ],
+                style={"marginTop": "20px"},
+            ),
+            html.Div(
+                [
+                    html.Label("Exit s-score: "),
+                    dcc.Input(type="number", value=0.5, step=0.05, id=IDS.STRATEGY.ID_OU_STRATEGY.EXIT),
+                ],
+                style={"marginTop": "10px"},
+            ),
+            html.Div(
+                [
+                    html.Label("Estimation Window: "),
+                    dcc.Input(type="number", min=3, step=1, value=60, id=IDS.STRATEGY.ID_OU_STRATEGY.LENGTH),
+                ],
+                style={"marginTop": "10px"},
+            ),
+            dcc.Store(id=IDS.STRATEGY.INPUTS_STORE),
+        ]
+    )
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def random_pair():
+    """Factory of a seeded pair of price series, the dependent cointegrated with the independent."""
+
+    def make(
+        n_obs: int = 750,
+        beta: float = 0.8,
+        intercept: float = 0.0,
+        scale: float = 1.0,
+        noise: float = 0.01,
+        stationary: bool = False,
+        seed: int = 0,
+        names: tuple[str, str] = ("Y", "X"),
+    ) -> tuple[pd.Series, pd.Series]:
+        """
+        Dependent and independent series on a business day calendar.
+
+        The independent series is a geometric random walk from scale, the dependent is intercept + beta times
+        it plus normal noise, accumulated into a random walk of the spread unless stationary.
+        """
+        rng = np.random.default_rng(seed)
+        index = pd.bdate_range("2020-01-01", periods=n_obs)
+
+        x = pd.Series(scale * np.exp(np.cumsum(rng.normal(0, 0.01, n_obs))), index=index, name=names[1])
+        e = rng.normal(0, noise, n_obs)
+        y = pd.Series(intercept + beta * x + (e if stationary else np.cumsum(e)), index=index, name=names[0])
+
+        return y, x
+
+    return make
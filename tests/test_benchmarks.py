@@ -0,0 +1,63 @@
+import sys
+
+import pytest
+
+from benchmarks import registry
+from benchmarks.__main__ import main
+from benchmarks.registry import Benchmark
+from benchmarks.runner import BenchmarkResult, compare, record, run_benchmarks
+
+
+def result(run_id: str, name: str, seconds: float) -> BenchmarkResult:
+    return BenchmarkResult(run_id, name, "observations", 1000, 5, seconds, seconds, "abc", "machine", "now")
+
+
+def test_compare_flags_regressions_against_previous_run(tmp_path):
+    history = tmp_path / "history.jsonl"
+    record([result("a", "fast", 1.0), result("a", "slow", 1.0)], history)
+    record([result("b", "fast", 1.05), result("b", "slow", 1.5), result("b", "new", 1.0)], history)
+
+    comparisons = {x.name: x for x in compare(history)}
+
+    assert set(comparisons) == {"fast", "slow"}
+    assert not comparisons["fast"].is_regression(0.1)
+    assert comparisons["slow"].is_regression(0.1)
+
+
+def test_compare_against_baseline_history(tmp_path):
+    baseline = tmp_path / "baseline" / "history.jsonl"
+    history = tmp_path / "history.jsonl"
+    record([result("main-1", "fast", 2.0)], baseline)
+    record([result("main-2", "fast", 1.0)], baseline)
+    record([result("branch", "fast", 1.5)], history)
+
+    (comparison,) = compare(history, baseline_history=baseline)
+
+    assert comparison.baseline_seconds == 1.0
+    assert comparison.is_regression(0.1)
+
+
+def test_generator_setup_is_torn_down_after_timing(monkeypatch):
+    calls = []
+
+    def setup(size):
+        calls.append("setup")
+        yield lambda: calls.append("timed")
+        calls.append("teardown")
+
+    monkeypatch.setitem(registry.BENCHMARKS, "_teardown", Benchmark("_teardown", "items", [1], setup))
+
+    (result,) = run_benchmarks("_teardown", repeat=2)
+
+    assert result.repeat == 2
+    assert calls == ["setup", "timed", "timed", "timed", "teardown"]
+
+
+def test_compare_without_two_runs_exits_with_usage(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["benchmarks", "compare", str(tmp_path / "history.jsonl")])
+
+    with pytest.raises(SystemExit) as exited:
+        main()
+
+    assert exited.value.code == 2
+    assert "needs two runs" in capsys.readouterr().err
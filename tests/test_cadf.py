@@ -17,3 +17,44 @@ def test_stationarity_for_cosine():
     cos_x = np.cos(x)
     result = CointegratedAugmentedDickeyFuller.test_stationarity(cos_x, k_vars=1)
     assert result.significant_at_one_pct()
+
+
+def ar1_paths(n_obs=600, n_series=20, seed=0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    phi = rng.uniform(0.8, 1.0, n_series)
+    noise = rng.normal(size=(n_obs, n_series))
+    x = np.empty_like(noise)
+    x[0] = noise[0]
+    for t in range(1, n_obs):
+        x[t] = phi * x[t - 1] + noise[t]
+    return x
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_batch_matches_adfuller():
+    x = ar1_paths()
+    result = CointegratedAugmentedDickeyFuller.test_stationarity_batch(x, k_vars=2)
+
+    for i in range(x.shape[1]):
+        single = CointegratedAugmentedDickeyFuller.test_stationarity(x[:, i], k_vars=2)
+        assert np.isclose(result.get_test_statistics()[i], single.get_test_statistic())
+        assert np.isclose(result.get_p_values()[i], single.get_p_value())
+        assert result.get_critical_values() == single.get_critical_values()
+
+
+def test_batch_for_cosine():
+    x = np.arange(100) * np.pi / 4
+    result = CointegratedAugmentedDickeyFuller.test_stationarity_batch(np.cos(x), k_vars=1)
+    assert result[0].significant_at_one_pct()
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_batch_falls_back_to_adfuller_for_singular_design(caplog):
+    x = np.column_stack([ar1_paths(n_series=1)[:, 0], np.arange(600.0)])
+
+    with caplog.at_level("WARNING"):
+        result = CointegratedAugmentedDickeyFuller.test_stationarity_batch(x, k_vars=2)
+
+    assert "falling back to adfuller" in caplog.text
+    single = CointegratedAugmentedDickeyFuller.test_stationarity(x[:, 0], k_vars=2)
+    assert np.isclose(result.get_test_statistics()[0], single.get_test_statistic())
@@ -0,0 +1,65 @@
+import datetime as dt
+import time
+
+import pytest
+from dash import exceptions
+
+from stat_arb.controller import callbacks
+from stat_arb.controller.job_manager import IN_FLIGHT, JobManager
+from stat_arb.controller.regression_callbacks import run_regression
+from stat_arb.model.bivariate_engle_granger import BivariateEngleGranger
+from stat_arb.model.data import DataHandlerEnum
+from stat_arb.model.regressor import RegressorEnum
+from stat_arb.model.regressor.naive_regressor import NaiveRegressorInputs
+
+
+@pytest.fixture
+def session(monkeypatch):
+    monkeypatch.setattr(callbacks, "SESSION_MODELS", callbacks.SessionModelCache())
+
+    model = BivariateEngleGranger(
+        "A",
+        "B",
+        dt.datetime(2020, 1, 1),
+        dt.datetime(2021, 1, 1),
+        dt.datetime(2020, 1, 1),
+        DataHandlerEnum.SIMULATED_COINTEGRATED,
+    )
+    model.get_close_prices()
+    callbacks.SESSION_MODELS.put("session", model)
+
+    return model
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_jobs_leave_session_model_untouched_until_applied(session, tmp_path):
+    manager = JobManager(tmp_path)
+    snapshot = callbacks.snapshot_session_model("session")
+    job_id = manager.submit(
+        "key", "group", run_regression, snapshot, RegressorEnum.NAIVE, NaiveRegressorInputs()
+    )
+
+    while (job := manager.status(job_id)) is not None and job.status in IN_FLIGHT:
+        time.sleep(0.01)
+    manager.shutdown()
+
+    result = manager.result(job_id)
+    assert not hasattr(session, "resids")
+
+    callbacks.apply_to_session_model(
+        "session", result["load_id"], regressor=result["regressor"], resids=result["residual"]
+    )
+
+    assert session.resids.equals(result["residual"])
+    assert session.regressor is result["regressor"]
+
+
+def test_results_of_a_reloaded_model_are_not_applied(session):
+    stale = callbacks.snapshot_session_model("session")
+
+    reloaded = callbacks.snapshot_session_model("session")
+    reloaded.load_id = "reloaded"
+    callbacks.SESSION_MODELS.put("session", reloaded)
+
+    with pytest.raises(exceptions.PreventUpdate):
+        callbacks.apply_to_session_model("session", stale.load_id, resids=None)
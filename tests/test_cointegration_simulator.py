@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from stat_arb.model.data.cointegrated_data_handler import CointegratedDataHandler
+from stat_arb.model.data.cointegration_simulator import CointegrationParameters, simulate_cointegrated
+from stat_arb.model.regressor import NaiveRegressor
+from stat_arb.model.statistics import CointegratedAugmentedDickeyFuller
+
+
+def test_shapes_and_ground_truth():
+    params = CointegrationParameters(beta=[0.5, 2.0], intercept=[1.0, -1.0])
+    sim = simulate_cointegrated(8, 300, 3, params, np.random.default_rng(0))
+
+    assert sim.prices.shape == (8, 300, 3)
+    assert sim.betas.shape == sim.spreads.shape == (8, 300, 2)
+    np.testing.assert_allclose(sim.betas, np.broadcast_to([0.5, 2.0], (8, 300, 2)))
+    np.testing.assert_allclose(
+        sim.prices[..., :2], sim.intercepts + sim.betas * sim.factor[..., None] + sim.spreads
+    )
+    assert sim.phi == pytest.approx(2 ** (-1 / 20))
+
+
+def test_spread_half_life_is_recovered():
+    sim = simulate_cointegrated(200, 1000, 2, CointegrationParameters(half_life=10), np.random.default_rng(1))
+
+    spreads = sim.spreads[..., 0]
+    phi = np.sum(spreads[:, 1:] * spreads[:, :-1]) / np.sum(spreads[:, :-1] ** 2)
+
+    assert np.log(2) / -np.log(phi) == pytest.approx(10, rel=0.05)
+
+
+def test_regression_recovers_beta_and_residual_is_stationary():
+    params = CointegrationParameters(beta=1.5, intercept=3.0, noise=0.1)
+    sim = simulate_cointegrated(64, 1000, 2, params, np.random.default_rng(2))
+
+    y, x = sim.prices[..., 0].T, sim.prices[..., 1].T
+    prices = np.concatenate([y, x], axis=1)
+    pairs = [(i, 64 + i) for i in range(64)]
+
+    regression = NaiveRegressor.fit_batch(prices, pairs)
+    cadf = CointegratedAugmentedDickeyFuller.test_stationarity_batch(regression.residuals, k_vars=2)
+
+    np.testing.assert_allclose(np.median(regression.betas), 1.5, rtol=0.02)
+    assert cadf.significant_at_five_pct().mean() > 0.9
+
+
+def test_beta_drift():
+    sim = simulate_cointegrated(4, 500, 2, CointegrationParameters(beta_drift=0.01), np.random.default_rng(3))
+
+    assert np.all(sim.betas[:, 0] == 1.0)
+    assert np.std(np.diff(sim.betas, axis=1)) == pytest.approx(0.01, rel=0.1)
+
+
+def test_data_handler_is_seeded_and_exposes_ground_truth():
+    close = CointegratedDataHandler(["A", "B"], "2020-01-01", "2020-12-31", seed=5).get_close_prices()
+    handler = CointegratedDataHandler(["A", "B"], "2020-01-01", "2020-12-31", seed=5)
+
+    assert handler.get_close_prices().equals(close)
+    assert handler.ground_truth is not None
+    np.testing.assert_allclose(handler.ground_truth.prices[0], close.to_numpy())
+
+    with pytest.raises(ValueError):
+        CointegratedDataHandler(["A"], "2020-01-01", "2020-12-31")
@@ -0,0 +1,56 @@
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stat_arb.model.data.columnar_data_handler import ColumnarDataHandler
+from stat_arb.model.local_store.columnar_store import ColumnarStore, write_columnar_store
+
+
+@pytest.fixture
+def close():
+    dates = pd.bdate_range("2020-01-01", periods=50)
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.uniform(10, 20, (50, 3)), index=dates, columns=["AAA", "BBB", "CCC"])
+
+
+def test_columnar_store_round_trip(tmp_path, close):
+    write_columnar_store(close, tmp_path)
+    store = ColumnarStore(tmp_path)
+
+    start, end = close.index[5], close.index[20]
+    prices = store.get_close_prices(["CCC", "AAA"], start, end)
+
+    np.testing.assert_array_equal(prices, close.loc[start:end, ["CCC", "AAA"]].to_numpy())
+    np.testing.assert_array_equal(store.get_dates(start, end), close.loc[start:end].index)
+
+
+def test_columnar_store_view_does_not_copy(tmp_path, close):
+    write_columnar_store(close, tmp_path)
+    store = ColumnarStore(tmp_path)
+
+    start, end = close.index[5], close.index[20]
+    view = store.get_close_view(start, end)
+
+    assert np.shares_memory(view, store.close)
+    assert not view.flags.writeable
+    np.testing.assert_array_equal(view, close.loc[start:end].to_numpy())
+
+
+def test_columnar_store_missing_ticker(tmp_path, close):
+    write_columnar_store(close, tmp_path)
+
+    with pytest.raises(KeyError):
+        ColumnarStore(tmp_path).get_close_prices(["ZZZ"], close.index[0], close.index[-1])
+
+
+def test_columnar_data_handler(tmp_path, close):
+    write_columnar_store(close, tmp_path)
+
+    handler = ColumnarDataHandler(["AAA", "BBB"], dt.datetime(2020, 1, 1), dt.datetime(2020, 2, 1), tmp_path)
+    df = handler.get_normalised_close_prices()
+
+    assert list(df.columns) == ["AAA", "BBB"]
+    assert df.index[-1] <= pd.Timestamp("2020-02-01")
+    np.testing.assert_allclose(df.iloc[0], 1.0)
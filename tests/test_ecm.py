@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+import statsmodels.api as sm
+
+from stat_arb.model.regressor import NaiveRegressor, RollingWindowRegressor
+from stat_arb.model.regressor.naive_regressor import NaiveRegressorInputs
+from stat_arb.model.regressor.rolling_window_regressor import RollingWindowRegressorInputs
+from stat_arb.model.statistics import ErrorCorrectionModel
+
+PAIR = dict(n_obs=500, beta=0.8, intercept=5.0, scale=100.0, noise=0.2, names=("X", "Y"))
+
+
+def statsmodels_ecm(x: pd.Series, y: pd.Series, resids: pd.Series, reverse: bool):
+    df = pd.DataFrame({"dx": x.diff(), "dy": y.diff(), "lag": resids.shift(1)}).dropna()
+    lhs, other = ("dy", "dx") if reverse else ("dx", "dy")
+    ols = sm.OLS(df[lhs], df[[other, "lag"]]).fit()
+    return ols.params["lag"], ols.bse["lag"], ols.pvalues["lag"]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("rolling", [False, True])
+def test_matches_statsmodels(reverse, rolling, random_pair):
+    x, y = random_pair(**PAIR)
+    if rolling:
+        resids = RollingWindowRegressor(x, y).get_residual(RollingWindowRegressorInputs(60))
+    else:
+        resids = NaiveRegressor(x, y).get_residual(NaiveRegressorInputs())
+
+    ecm = ErrorCorrectionModel.fit(x, y, resids, reverse_regression=reverse)
+
+    expected = statsmodels_ecm(x, y, resids, reverse)
+    actual = ecm.get_long_run_reversion_speed(), ecm.get_standard_error(), ecm.get_p_value()
+    np.testing.assert_allclose(actual, expected, rtol=1e-8)
+
+
+def test_batch_fits_both_directions(random_pair):
+    pairs = [random_pair(seed=i, **PAIR) for i in range(3)]
+    x = np.column_stack([x for x, _ in pairs] * 2)
+    y = np.column_stack([y for _, y in pairs] * 2)
+    resids = np.column_stack(
+        [NaiveRegressor(x, y).get_residual(NaiveRegressorInputs()) for x, y in pairs] * 2
+    )
+    reverse = [False] * 3 + [True] * 3
+
+    batch = ErrorCorrectionModel.fit_batch(x, y, resids, reverse_regression=reverse)
+
+    assert len(batch) == 6
+    for i in range(6):
+        expected = statsmodels_ecm(
+            pd.Series(x[:, i]), pd.Series(y[:, i]), pd.Series(resids[:, i]), reverse[i]
+        )
+        np.testing.assert_allclose(batch.get_long_run_reversion_speeds()[i], expected[0], rtol=1e-8)
+        np.testing.assert_allclose(batch.get_p_values()[i], expected[2], rtol=1e-8)
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+from stat_arb.controller.figures import downsample, line_traces, lttb, signal_runs, signal_shapes
+
+
+def test_signal_runs():
+    assert signal_runs(np.array([0, 1, 1, -1, -1, -1, 0])) == [(0, 0, 0), (1, 2, 1), (3, 5, -1), (6, 6, 0)]
+    assert signal_runs(np.array([])) == []
+
+
+def test_signal_shapes_span_runs():
+    dates = pd.bdate_range("2025-01-01", periods=7)
+    shapes = signal_shapes(dates, np.array([0, 1, 1, -1, -1, -1, 0]), -1.0, 1.0)
+
+    assert [(x["x0"], x["x1"], x["fillcolor"]) for x in shapes] == [
+        (dates[1], dates[3], "green"),
+        (dates[3], dates[6], "red"),
+    ]
+
+
+def test_signal_shapes_one_per_run():
+    signal = np.repeat([1, 0, -1, 1], 1000)
+    dates = pd.bdate_range("2000-01-01", periods=len(signal))
+
+    assert len(signal_shapes(dates, signal, -1.0, 1.0)) == 3
+
+
+def test_lttb_keeps_endpoints_and_spikes():
+    x = np.arange(10_000, dtype=float)
+    y = np.sin(x / 500)
+    y[5_000] = 10.0
+
+    selected = lttb(x, y, 200)
+
+    assert len(selected) == 200
+    assert selected[0] == 0 and selected[-1] == len(x) - 1
+    assert np.all(np.diff(selected) > 0)
+    assert 5_000 in selected
+
+
+def test_downsample_bounds_payload_and_skips_missing():
+    dates = pd.bdate_range("2000-01-01", periods=20_000)
+    df = pd.DataFrame({"a": np.random.default_rng(0).normal(size=len(dates)).cumsum(), "b": 1.0}, index=dates)
+    df.iloc[:100, 0] = np.nan
+
+    sampled = downsample(df, 500)
+
+    assert len(sampled) <= 2 * 500
+    assert sampled.index.is_monotonic_increasing
+    assert sampled.index[0] == dates[0] and sampled.index[-1] == dates[-1]
+
+    traces = line_traces(df, ["a", "b"], 500)
+    assert [x.type for x in traces] == ["scattergl", "scattergl"]
+
+
+def test_downsample_short_series_unchanged():
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0]})
+
+    assert downsample(df, 500) is df
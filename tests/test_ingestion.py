@@ -0,0 +1,128 @@
+import datetime as dt
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from stat_arb.model.data.local_data_handler import LocalDataHandler
+from stat_arb.model.local_store.yfinance_cache.database_util import connect, list_tickers
+from stat_arb.model.local_store.yfinance_cache import ingestion
+from stat_arb.model.local_store.yfinance_cache.ingestion import IngestionConfig, RateLimiter, ingest
+
+START = dt.datetime(2025, 1, 1)
+END = dt.datetime(2025, 2, 1)
+
+FAST = IngestionConfig(batch_size=2, max_workers=3, requests_per_second=0, max_retries=2, backoff=0.0)
+
+
+class FakeYahoo:
+    """Local stand-in for Yahoo returning a deterministic price series per ticker."""
+
+    def __init__(self, failures: dict[str, int] | None = None, empty: tuple[str, ...] = ()):
+        self.failures = dict(failures or {})
+        self.empty = empty
+        self.batches: list[list[str]] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, tickers, start, end):
+        with self.lock:
+            self.batches.append(list(tickers))
+            for ticker in tickers:
+                if self.failures.get(ticker, 0) > 0:
+                    self.failures[ticker] -= 1
+                    raise ConnectionError(ticker)
+
+        dates = pd.bdate_range(start, end, inclusive="left", name="Date")
+        frames = {
+            ticker: pd.DataFrame({"Close": np.arange(len(dates)) + i + 1.0, "Volume": 1.0}, index=dates)
+            for i, ticker in enumerate(tickers)
+        }
+        return {ticker: df.iloc[:0] if ticker in self.empty else df for ticker, df in frames.items()}
+
+
+def test_ingest_batches_and_stores(tmp_path):
+    db = str(tmp_path / "prices.db")
+    tickers = ["AAA", "BBB", "CCC", "DDD", "EEE"]
+    fake = FakeYahoo()
+
+    results = ingest(tickers, START, END, db=db, fetch=fake, config=FAST)
+
+    assert sorted(len(x) for x in fake.batches) == [1, 2, 2]
+    assert results.failed == []
+    assert results.rows == {x: 23 for x in tickers}
+
+    df = LocalDataHandler(tickers, START, END, db=db).get_close_prices()
+    assert df.shape == (23, 5)
+
+
+def test_ingest_retries_transient_failures(tmp_path):
+    db = str(tmp_path / "prices.db")
+    fake = FakeYahoo(failures={"BBB": 2})
+
+    results = ingest(["AAA", "BBB"], START, END, db=db, fetch=fake, config=FAST)
+
+    assert len(fake.batches) == 3
+    assert results.failed == []
+
+
+def test_ingest_reports_exhausted_batches(tmp_path):
+    db = str(tmp_path / "prices.db")
+    fake = FakeYahoo(failures={"CCC": 10})
+
+    results = ingest(["AAA", "BBB", "CCC", "DDD"], START, END, db=db, fetch=fake, config=FAST)
+
+    assert sorted(results.failed) == ["CCC", "DDD"]
+
+    conn = connect(db)
+    assert list_tickers(conn) == ["AAA", "BBB"]
+    conn.close()
+
+
+def test_ingest_keeps_history_of_tickers_fetched_empty(tmp_path):
+    db = str(tmp_path / "prices.db")
+    ingest(["AAA", "BBB"], START, END, db=db, fetch=FakeYahoo(), config=FAST)
+
+    results = ingest(["AAA", "BBB"], START, END, db=db, fetch=FakeYahoo(empty=("BBB",)), config=FAST)
+
+    assert results.failed == ["BBB"]
+    assert results.rows == {"AAA": 23}
+
+    df = LocalDataHandler(["BBB"], START, END, db=db).get_close_prices()
+    assert len(df) == 23
+
+
+def test_ingest_fetches_boundedly_ahead_of_writing(tmp_path, monkeypatch):
+    db = str(tmp_path / "prices.db")
+    tickers = [f"T{i:02d}" for i in range(30)]
+    fake = FakeYahoo()
+    config = IngestionConfig(batch_size=1, max_workers=1, requests_per_second=0)
+
+    write_prices = ingestion.write_prices
+    release = threading.Event()
+    fetched_while_blocked = []
+
+    def blocked_write(*args, **kwargs):
+        if not release.is_set():
+            time.sleep(0.2)  # let fetching run as far ahead as it can
+            fetched_while_blocked.append(len(fake.batches))
+            release.set()
+        return write_prices(*args, **kwargs)
+
+    monkeypatch.setattr(ingestion, "write_prices", blocked_write)
+
+    results = ingest(tickers, START, END, db=db, fetch=fake, config=config)
+
+    # One batch being written, 2 queued, 1 waiting on the queue and 2 in flight
+    assert fetched_while_blocked[0] <= 6
+    assert len(results.rows) == 30
+
+
+def test_rate_limiter_spaces_calls():
+    limiter = RateLimiter(100.0)
+
+    start = dt.datetime.now()
+    for _ in range(6):
+        limiter.acquire()
+
+    assert dt.datetime.now() - start >= dt.timedelta(seconds=0.05)
@@ -0,0 +1,70 @@
+import datetime as dt
+import json
+import threading
+import time
+
+import numpy as np
+
+from stat_arb.model.bivariate_engle_granger import BivariateEngleGranger
+from stat_arb.model.data import DataHandlerEnum
+from stat_arb.model.instrumentation import Profiler
+from stat_arb.model.regressor import RegressorEnum
+from stat_arb.model.regressor.naive_regressor import NaiveRegressorInputs
+from stat_arb.model.trading_strategy import StrategyEnum, ToyStrategyInputs
+
+STAGES = ["data_init", "get_close_prices", "get_residual", "test_cadf", "test_ecm", "backtest"]
+
+
+def test_stage_measures_time_and_allocation():
+    profiler = Profiler()
+
+    with profiler.stage("outer"):
+        with profiler.stage("inner"):
+            x = np.ones(1_000_000)  # 8MB
+            time.sleep(0.01)
+        del x
+
+    inner, outer = profiler.stages
+
+    assert (inner.name, inner.depth, outer.name, outer.depth) == ("inner", 1, "outer", 0)
+    assert inner.wall_seconds >= 0.01
+    assert inner.cpu_seconds < inner.wall_seconds  # sleeping is not CPU time
+    assert inner.peak_bytes >= 8_000_000
+    assert outer.peak_bytes >= inner.peak_bytes  # nested peak carries to the enclosing stage
+
+
+def test_overlapping_profilers_keep_their_peaks():
+    first, second = Profiler(), Profiler()
+
+    with second.stage("second"):
+        with first.stage("first"):
+            pass  # closing first's only stage must not stop tracing under second's
+        x = np.ones(1_000_000)
+        del x
+
+        def other_thread():
+            with first.stage("other thread"):  # resets the peak, but not what second has seen so far
+                pass
+
+        thread = threading.Thread(target=other_thread)
+        thread.start()
+        thread.join()
+
+    assert second.stages[0].peak_bytes >= 8_000_000
+
+
+def test_model_stages_are_opt_in(tmp_path):
+    args = ("A", "B", dt.datetime(2020, 1, 1), dt.datetime(2022, 1, 1), dt.datetime(2021, 1, 1))
+    inputs = (RegressorEnum.NAIVE, NaiveRegressorInputs(), StrategyEnum.ToyStrategy, ToyStrategyInputs(1, 0))
+
+    model = BivariateEngleGranger(*args, DataHandlerEnum.SIMULATED)
+    model.run(*inputs)
+    assert model.profiler is None
+
+    profiler = Profiler(tmp_path)
+    BivariateEngleGranger(*args, DataHandlerEnum.SIMULATED, profiler).run(*inputs)
+
+    assert set(profiler.report()["name"]) == set(STAGES)
+
+    exported = json.loads((tmp_path / f"{profiler.run_id}.json").read_text())
+    assert [x["name"] for x in exported["stages"]] == list(profiler.report()["name"])
@@ -0,0 +1,121 @@
+import threading
+import time
+
+import pytest
+
+from stat_arb.controller.job_manager import JobManager, JobStatus, job_key
+
+
+def wait(manager, job_id, timeout=5.0):
+    end = time.monotonic() + timeout
+    while manager.status(job_id).status in (JobStatus.PENDING, JobStatus.RUNNING):
+        assert time.monotonic() < end, "job did not finish"
+        time.sleep(0.01)
+    return manager.status(job_id)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = JobManager(tmp_path, max_workers=2)
+    yield manager
+    manager.shutdown()
+
+
+def square(context, x):
+    context.report(0.5, "Squaring...")
+    return x * x
+
+
+def test_result_and_progress(manager):
+    job_id = manager.submit(job_key("square", 3), "group", square, 3)
+
+    job = wait(manager, job_id)
+
+    assert job.status == JobStatus.DONE
+    assert job.progress == 1.0
+    assert manager.result(job_id) == 9
+
+
+def test_identical_in_flight_requests_are_deduplicated(manager):
+    release = threading.Event()
+    calls = []
+
+    def blocking(context):
+        calls.append(1)
+        release.wait(5)
+        return len(calls)
+
+    first = manager.submit("key", "group", blocking)
+    second = manager.submit("key", "group", blocking)
+    release.set()
+
+    assert first == second
+    assert manager.result(wait(manager, first).id) == 1
+
+
+def test_new_inputs_cancel_in_flight_job(manager):
+    started = threading.Event()
+    release = threading.Event()
+
+    def cooperative(context):
+        started.set()
+        release.wait(5)
+        context.report(0.5)
+        return "stale"
+
+    stale = manager.submit("old", "group", cooperative)
+    started.wait(5)
+    fresh = manager.submit("new", "group", square, 2)
+    release.set()
+
+    assert wait(manager, stale).status == JobStatus.CANCELLED
+    assert manager.result(wait(manager, fresh).id) == 4
+    with pytest.raises(RuntimeError):
+        manager.result(stale)
+
+
+def test_failure_is_reported(manager):
+    def failing(context):
+        raise ValueError("bad input")
+
+    job = wait(manager, manager.submit("key", "group", failing))
+
+    assert job.status == JobStatus.FAILED
+    assert "bad input" in job.error
+
+
+def test_state_and_result_persist_to_disk(manager, tmp_path):
+    job_id = manager.submit("key", "group", square, 5)
+    wait(manager, job_id)
+
+    reopened = JobManager(tmp_path)
+
+    job = reopened.status(job_id)
+    assert job is not None and job.status == JobStatus.DONE
+    assert reopened.result(job_id) == 25
+    assert reopened.status("missing") is None
+
+
+def test_ids_other_than_job_ids_are_unknown(manager, tmp_path):
+    (tmp_path / "outside.json").write_text("{}")
+
+    assert manager.status("../outside") is None
+    with pytest.raises(RuntimeError):
+        manager.result("../outside")
+
+
+def test_jobs_in_flight_at_restart_are_failed(manager, tmp_path):
+    release = threading.Event()
+    job_id = manager.submit("key", "group", lambda context: release.wait())
+    while manager.status(job_id).status != JobStatus.RUNNING:
+        time.sleep(0.01)
+
+    job = JobManager(tmp_path).status(job_id)
+    release.set()
+
+    assert job is not None and job.status == JobStatus.FAILED
+
+
+def test_job_key_is_stable():
+    assert job_key("a", {"x": 1, "y": 2}) == job_key("a", {"y": 2, "x": 1})
+    assert job_key("a", 1) != job_key("a", 2)
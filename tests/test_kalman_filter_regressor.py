@@ -0,0 +1,55 @@
+import numpy as np
+
+from stat_arb.model.regressor.kalman_filter_regressor import (
+    KalmanFilterRegressor,
+    KalmanFilterRegressorInputs,
+)
+
+PAIR = dict(n_obs=2000, beta=0.5, intercept=0.2, stationary=True)
+
+
+def test_converges_to_static_beta(random_pair):
+    y, x = random_pair(**PAIR)
+    regressor = KalmanFilterRegressor(y, x)
+    regressor.get_residual(KalmanFilterRegressorInputs(delta=1e-6))
+
+    assert abs(regressor.get_beta()["X"].iloc[-1] - 0.5) < 0.05
+
+
+def test_update_matches_full_history(random_pair):
+    y, x = random_pair(**PAIR)
+    inputs = KalmanFilterRegressorInputs()
+
+    full = KalmanFilterRegressor(y, x)
+    resids = full.get_residual(inputs)
+
+    incremental = KalmanFilterRegressor(y.iloc[:-1], x.iloc[:-1])
+    incremental.get_residual(inputs)
+
+    assert np.isclose(incremental.update(x.iloc[-1], y.iloc[-1]), resids.iloc[-1])
+
+
+def test_batch_matches_single_pairs(random_pair):
+    pairs = [random_pair(seed=i, **PAIR) for i in range(3)]
+    inputs = KalmanFilterRegressorInputs()
+
+    y = np.column_stack([y for y, _ in pairs])
+    x = np.column_stack([x for _, x in pairs])
+    batch = KalmanFilterRegressor.filter_batch(y, x, inputs)
+
+    for i, (y_i, x_i) in enumerate(pairs):
+        resids = KalmanFilterRegressor(y_i, x_i).get_residual(inputs)
+        np.testing.assert_allclose(batch.residuals[:, i], resids)
+
+
+def test_residual_is_prior_prediction_error(random_pair):
+    y, x = random_pair(**PAIR)
+    inputs = KalmanFilterRegressorInputs(burn_in=10)
+
+    regressor = KalmanFilterRegressor(y, x)
+    resids = regressor.get_residual(inputs)
+    intercept = regressor.params["const"].shift(1)
+    beta = regressor.get_beta()["X"].shift(1)
+
+    assert resids.iloc[:10].isna().all()
+    np.testing.assert_allclose(resids.iloc[10:], (y - intercept - beta * x).iloc[10:])
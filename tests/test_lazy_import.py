@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY = ["dash", "plotly", "statsmodels", "yfinance", "scipy"]
+
+
+def imported_heavy_modules(module: str) -> set[str]:
+    code = f"import sys, {module}; print(' '.join(k for k in sys.modules if k.split('.')[0] in {HEAVY!r}))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return {x.split(".")[0] for x in output.split()}
+
+
+@pytest.mark.parametrize(
+    "module, allowed",
+    [
+        ("stat_arb.cli", set()),
+        ("stat_arb.model.local_store.ticker_snapshot.ticker_snapshot", set()),
+        ("stat_arb.model.local_store.columnar_store.columnar_run", set()),
+        ("stat_arb.model.local_store.yfinance_cache.db_run", {"yfinance"}),
+    ],
+)
+def test_entry_points_import_only_what_they_need(module, allowed):
+    assert imported_heavy_modules(module) <= allowed
+
+
+def test_lazy_exports_resolve_on_access():
+    from stat_arb.model import regressor
+
+    assert "NaiveRegressor" in dir(regressor)
+    assert regressor.NaiveRegressor.__module__ == "stat_arb.model.regressor.naive_regressor"
+
+    with pytest.raises(AttributeError):
+        regressor.Missing
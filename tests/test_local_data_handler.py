@@ -0,0 +1,148 @@
+import datetime as dt
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stat_arb.model.data import local_data_handler
+from stat_arb.model.data.local_data_handler import LocalDataHandler
+from stat_arb.model.local_store.yfinance_cache.database_util import (
+    connect,
+    list_tickers,
+    migrate_legacy_tables,
+    write_prices,
+)
+from stat_arb.model.local_store.yfinance_cache.database_util import read_close_prices as read
+
+
+def ohlcv(dates, close):
+    return pd.DataFrame(
+        {"Close": close, "High": close, "Low": close, "Open": close, "Volume": 1e6},
+        index=pd.DatetimeIndex(dates, name="Date"),
+    )
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / "prices.db")
+    conn = connect(path)
+    with conn:
+        write_prices(conn, "AAA", ohlcv(["2025-01-02", "2025-01-03", "2025-01-06"], [1.0, 2.0, 3.0]))
+        write_prices(conn, "BBB", ohlcv(["2025-01-02", "2025-01-06", "2025-01-07"], [10.0, 20.0, 30.0]))
+    conn.close()
+    return path
+
+
+def test_close_prices(db):
+    df = LocalDataHandler(["BBB", "AAA"], "2025-01-01", "2025-01-06", db=db).get_close_prices()
+
+    expected = pd.DataFrame(
+        {"BBB": [10.0, 10.0, 20.0], "AAA": [1.0, 2.0, 3.0]},
+        index=pd.to_datetime(["2025-01-02", "2025-01-03", "2025-01-06"]),
+    )
+    pd.testing.assert_frame_equal(df, expected, check_index_type=False)
+
+
+def test_cached_panel_does_not_serve_ticker_subsets(db):
+    conn = connect(db)
+    with conn:
+        write_prices(conn, "CCC", ohlcv(["2025-01-02", "2025-01-06"], [1.0, 2.0]))
+        write_prices(conn, "DDD", ohlcv(["2025-01-03", "2025-01-07"], [10.0, 20.0]))
+    conn.close()
+
+    LocalDataHandler(["CCC", "DDD"], "2025-01-01", "2025-01-31", db=db).get_close_prices()
+    df = LocalDataHandler(["DDD"], "2025-01-01", "2025-01-31", db=db).get_normalised_close_prices()
+
+    expected = pd.DataFrame({"DDD": [1.0, 2.0]}, index=pd.to_datetime(["2025-01-03", "2025-01-07"]))
+    pd.testing.assert_frame_equal(df, expected, check_index_type=False)
+
+
+def test_normalised_close_prices(db):
+    df = LocalDataHandler(["AAA", "BBB"], "2025-01-01", "2025-01-31", db=db).get_normalised_close_prices()
+
+    np.testing.assert_allclose(df.iloc[-1], [3.0, 3.0])
+
+
+def test_write_prices_replaces_ticker(db):
+    conn = connect(db)
+    with conn:
+        write_prices(conn, "AAA", ohlcv(["2025-01-02"], [5.0]))
+    conn.close()
+
+    df = LocalDataHandler("AAA", "2025-01-01", "2025-01-31", db=db).get_close_prices()
+    assert df["AAA"].tolist() == [5.0]
+
+
+def test_migrate_legacy_tables(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    with sqlite3.connect(path) as conn:
+        ohlcv(["2025-01-02", "2025-01-03"], [1.0, 2.0]).to_sql("AAA", conn)
+        pd.DataFrame({"note": ["keep"]}).to_sql("notes", conn, index=False)
+
+    conn = connect(path)
+    assert list_tickers(conn) == []  # connecting alone does not migrate
+
+    assert migrate_legacy_tables(conn) == 1
+    assert list_tickers(conn) == ["AAA"]
+    assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'AAA'").fetchone() is None
+    assert conn.execute("SELECT note FROM notes").fetchall() == [("keep",)]
+
+    assert migrate_legacy_tables(conn) == 0
+    conn.close()
+
+    df = LocalDataHandler("AAA", "2025-01-01", "2025-01-31", db=path).get_close_prices()
+    assert df["AAA"].tolist() == [1.0, 2.0]
+
+
+def test_read_close_prices_with_repeated_ticker(db):
+    conn = connect(db)
+    df = read(conn, ["AAA", "AAA"], dt.datetime(2025, 1, 1), dt.datetime(2025, 1, 6))
+    conn.close()
+
+    assert list(df.columns) == ["AAA", "AAA"]
+    assert df.iloc[:, 0].tolist() == df.iloc[:, 1].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_close_prices_loaded_once(db, monkeypatch):
+    queries = []
+
+    def counting_read(*args):
+        queries.append(args)
+        return read(*args)
+
+    monkeypatch.setattr(local_data_handler, "read_close_prices", counting_read)
+
+    handler = LocalDataHandler(["AAA", "BBB"], "2025-01-01", "2025-01-31", db=db)
+    close = handler.get_close_prices()
+    normalised = handler.get_normalised_close_prices()
+    handler.get_returns()
+    handler.get_log_prices()
+
+    assert len(queries) == 1
+    assert handler.get_close_prices() is close
+    assert handler.get_normalised_close_prices() is normalised
+
+    handler.invalidate()
+    handler.get_normalised_close_prices()
+    assert len(queries) == 1  # served by the shared price cache
+
+    handler.refresh()
+    assert len(queries) == 2
+
+
+def test_shared_cache_answers_date_subranges(db, monkeypatch):
+    queries = []
+
+    def counting_read(*args):
+        queries.append(args)
+        return read(*args)
+
+    monkeypatch.setattr(local_data_handler, "read_close_prices", counting_read)
+
+    full = LocalDataHandler(["AAA", "BBB"], "2025-01-01", "2025-01-31", db=db).get_close_prices()
+    subset = LocalDataHandler(["BBB", "AAA"], "2025-01-03", "2025-01-06", db=db).get_close_prices()
+    LocalDataHandler(["AAA"], "2025-01-01", "2025-01-31", db=db).get_close_prices()
+
+    assert len(queries) == 2
+    pd.testing.assert_frame_equal(subset, full.loc["2025-01-03":"2025-01-06", ["BBB", "AAA"]])
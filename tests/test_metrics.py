@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from stat_arb.model.trading_strategy.metrics import TRADING_DAYS, compute_metrics
+
+
+def strategy_returns(n_obs=500, n_series=3, seed=0) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    positions = rng.choice([-1, 0, 1], size=(n_obs, n_series), p=[0.3, 0.4, 0.3]).astype(float)
+    returns = np.full((n_obs, n_series), np.nan)
+    returns[1:] = positions[:-1] * rng.normal(0.0005, 0.01, (n_obs - 1, n_series))
+    return returns, positions
+
+
+def pandas_metrics(returns: pd.Series) -> dict:
+    cumulative = (1 + returns).cumprod()
+    return {
+        "sharpe_ratio": returns.mean() / returns.std() * np.sqrt(TRADING_DAYS),
+        "sortino_ratio": returns.mean() / returns[returns < 0].std() * np.sqrt(TRADING_DAYS),
+        "max_drawdown": (cumulative / cumulative.cummax() - 1).min(),
+        "annualised_return": cumulative.iloc[-1] ** (TRADING_DAYS / returns.notna().sum()) - 1,
+        "annualised_volatility": returns.std() * np.sqrt(TRADING_DAYS),
+        "rolling_sharpe": (returns.rolling(63).mean() / returns.rolling(63).std() * np.sqrt(TRADING_DAYS)),
+    }
+
+
+def test_matrix_matches_pandas_per_column():
+    returns, positions = strategy_returns()
+    metrics = compute_metrics(returns, positions)
+
+    for i in range(returns.shape[1]):
+        expected = pandas_metrics(pd.Series(returns[:, i]))
+        for name, value in expected.items():
+            np.testing.assert_allclose(getattr(metrics, name)[..., i], value, err_msg=name)
+
+
+def test_series_returns_scalars():
+    returns, positions = strategy_returns(n_series=1)
+    metrics = compute_metrics(returns[:, 0], positions[:, 0])
+
+    assert isinstance(metrics.sharpe_ratio, float)
+    assert isinstance(metrics.max_drawdown_duration, int)
+    assert metrics.rolling_sharpe.shape == (len(returns),)
+    assert metrics.sharpe_ratio == pytest.approx(
+        np.asarray(compute_metrics(returns, positions).sharpe_ratio)[0]
+    )
+
+
+def test_drawdown_duration_hit_rate_and_turnover():
+    returns = np.array([np.nan, 0.1, -0.1, 0.0, 0.05, 0.2, -0.01])
+    positions = np.array([1, 1, 1, 0, 1, 1, -1])
+
+    metrics = compute_metrics(returns, positions)
+
+    assert metrics.max_drawdown_duration == 3  # below the peak at index 1 until the new peak at index 5
+    assert metrics.hit_rate == pytest.approx(3 / 5)
+    assert metrics.turnover == pytest.approx(4 / 6 * TRADING_DAYS)
+    assert np.isnan(compute_metrics(returns).turnover)
@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import statsmodels.api as sm
+
+from stat_arb.model.regressor.naive_regressor import NaiveRegressor, NaiveRegressorInputs
+
+
+def random_prices(n_obs=500, n_tickers=4, seed=0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, size=(n_obs, n_tickers)), axis=0))
+    return pd.DataFrame(prices, columns=[f"T{i}" for i in range(n_tickers)])
+
+
+def test_residual_matches_statsmodels():
+    prices = random_prices()
+    ols = sm.OLS(prices["T0"], sm.add_constant(prices["T1"])).fit()
+
+    regressor = NaiveRegressor(prices["T0"], prices["T1"])
+    resids = regressor.get_residual(NaiveRegressorInputs())
+
+    np.testing.assert_allclose(resids, ols.resid, atol=1e-10)
+    np.testing.assert_allclose(regressor.get_beta()["T1"], ols.params["T1"])
+
+
+def test_batch_matches_statsmodels():
+    prices = random_prices()
+    pairs = [("T0", "T1"), ("T1", "T0"), ("T2", "T3"), ("T3", "T1")]
+
+    results = NaiveRegressor.fit_batch(prices, pairs)
+
+    for i, (y, x) in enumerate(pairs):
+        ols = sm.OLS(prices[y], sm.add_constant(prices[x])).fit()
+        np.testing.assert_allclose(results.intercepts[i], ols.params["const"])
+        np.testing.assert_allclose(results.betas[i], ols.params[x])
+        np.testing.assert_allclose(results.residuals[:, i], ols.resid, atol=1e-10)
+
+
+def test_batch_with_positional_pairs():
+    prices = random_prices()
+    by_label = NaiveRegressor.fit_batch(prices, [("T0", "T2")])
+    by_position = NaiveRegressor.fit_batch(prices.to_numpy(), [(0, 2)])
+
+    np.testing.assert_allclose(by_label.betas, by_position.betas)
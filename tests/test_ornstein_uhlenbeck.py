@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+import pytest
+from statsmodels.tsa.ar_model import AutoReg
+
+from stat_arb.model.trading_strategy import OrnsteinUhlenbeckSDE, OrnsteinUhlenbeckSDEFit
+from stat_arb.model.trading_strategy.ornstein_uhlenbeck import TAU
+
+
+def ou_path(n_obs=500, b=0.9, mu=0.5, seed=0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    x = np.empty(n_obs)
+    x[0] = mu
+    for t in range(1, n_obs):
+        x[t] = mu * (1 - b) + b * x[t - 1] + rng.normal(0, 0.1)
+    return x
+
+
+def test_fit_matches_autoreg():
+    x = ou_path()
+    fitted = AutoReg(x, lags=1).fit()
+    a, b = fitted.params
+    k = -np.log(b) / TAU
+
+    results = OrnsteinUhlenbeckSDE(pd.Series(x)).fit_to_sde()
+
+    assert np.isclose(results.get_mu(), a / (1 - b))
+    assert np.isclose(results.get_sigma(), np.sqrt(fitted.resid.var() / (1 - b**2)))
+    assert np.isclose(results.get_half_life_in_working_days(), np.log(2) / k / TAU)
+
+
+def test_fit_skips_missing_observations():
+    x = ou_path()
+    with_nan = np.concatenate([[np.nan] * 10, x])
+
+    expected = OrnsteinUhlenbeckSDE(x).fit_to_sde()
+    results = OrnsteinUhlenbeckSDE(with_nan).fit_to_sde()
+
+    assert np.isclose(results.get_mu(), expected.get_mu())
+    assert np.isclose(results.get_sigma(), expected.get_sigma())
+
+
+def test_fit_does_not_join_observations_across_a_gap():
+    x = ou_path()
+    x[200:250] = np.nan
+
+    lag, lead = x[:-1], x[1:]
+    valid = ~np.isnan(lag) & ~np.isnan(lead)
+    b, a = np.polyfit(lag[valid], lead[valid], 1)
+
+    results = OrnsteinUhlenbeckSDE(x).fit_to_sde()
+
+    assert np.isclose(results.get_mu(), a / (1 - b))
+    assert np.isclose(results.get_half_life_in_working_days(), -np.log(2) / np.log(b))
+
+
+def test_rolling_fit_matches_each_window():
+    x = ou_path(300)
+    window_length = 60
+
+    rolling = OrnsteinUhlenbeckSDE(x).rolling_fit(window_length)
+
+    assert np.isnan(rolling.get_mu()[: window_length - 1]).all()
+    for end in [window_length - 1, 150, len(x) - 1]:
+        expected = OrnsteinUhlenbeckSDE(x[end - window_length + 1 : end + 1]).fit_to_sde()  # noqa: E203
+        assert np.isclose(rolling[end].get_mu(), expected.get_mu())
+        assert np.isclose(rolling[end].get_sigma(), expected.get_sigma())
+        assert np.isclose(
+            rolling[end].get_half_life_in_working_days(), expected.get_half_life_in_working_days()
+        )
+
+
+def test_rolling_fit_is_nan_for_windows_with_missing_observations():
+    x = ou_path(200)
+    x[100] = np.nan
+
+    mu = OrnsteinUhlenbeckSDE(x).rolling_fit(30).get_mu()
+
+    assert np.isnan(mu[100:130]).all()
+    assert np.isfinite(mu[130:]).all()
+
+
+def test_rolling_fit_rejects_short_window():
+    with pytest.raises(ValueError):
+        OrnsteinUhlenbeckSDE(ou_path()).rolling_fit(2)
+
+
+def test_strategy_trades_on_s_score():
+    index = pd.bdate_range("2020-01-01", periods=500)
+    resids = ou_path()
+    price_y = pd.Series(np.linspace(10, 12, 500), index=index, name="Y")
+    price_x = pd.Series(price_y + resids, index=index, name="X")
+
+    results = OrnsteinUhlenbeckSDEFit(resids, price_x, price_y, 1.0).backtest()
+    rolling = OrnsteinUhlenbeckSDE(resids).rolling_fit(60)
+
+    assert (results.z_score[:59] == 0).all()
+    assert np.allclose(results.z_score[59:], rolling.s_score(resids)[59:])
+    assert (results.positions[:59] == 0).all()
+    assert np.abs(results.positions).sum() > 0
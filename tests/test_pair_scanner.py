@@ -0,0 +1,82 @@
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from stat_arb.model.bivariate_engle_granger import BivariateEngleGranger
+from stat_arb.model.data import DataHandlerEnum
+from stat_arb.model.data.cointegrated_data_handler import CointegratedDataHandler
+from stat_arb.model.pair_scanner import PairScanner, pair_scanner
+from stat_arb.model.pair_scanner.pair_scanner import SCAN_COLUMNS, _init_worker, _scan_pairs
+from stat_arb.model.regressor import RegressorEnum
+from stat_arb.model.regressor.naive_regressor import NaiveRegressorInputs
+from stat_arb.model.statistics import CointegratedAugmentedDickeyFuller, ErrorCorrectionModel
+from stat_arb.model.trading_strategy import OrnsteinUhlenbeckSDE
+
+TICKERS = ["A", "B", "C", "D"]
+START = dt.datetime(2020, 1, 1)
+END = dt.datetime(2022, 12, 31)
+
+
+@pytest.fixture
+def handler() -> CointegratedDataHandler:
+    return CointegratedDataHandler(TICKERS, START, END, seed=0)
+
+
+def single_pair(handler: CointegratedDataHandler, ticker_a: str, ticker_b: str) -> dict:
+    model = BivariateEngleGranger(
+        ticker_a, ticker_b, START, END, START, DataHandlerEnum.SIMULATED_COINTEGRATED
+    )
+    model.data_handler = handler
+    model.get_close_prices()
+    resids = model.get_residual(RegressorEnum.NAIVE, NaiveRegressorInputs())
+
+    cadf = CointegratedAugmentedDickeyFuller.test_stationarity(resids, k_vars=2)
+    ecm = ErrorCorrectionModel.fit(model.close_prices[ticker_a], model.close_prices[ticker_b], resids)
+
+    return {
+        "beta": np.asarray(model.regressor.get_beta()).item(),
+        "cadf_test_statistic": cadf.get_test_statistic(),
+        "cadf_p_value": cadf.get_p_value(),
+        "ecm_p_value": ecm.get_p_value(),
+        "half_life": OrnsteinUhlenbeckSDE(resids).fit_to_sde().get_half_life_in_working_days(),
+        "cadf_significant": model.test_cadf(),
+    }
+
+
+def test_scan_matches_single_pair_model(handler):
+    scanner = PairScanner(TICKERS, START, END, DataHandlerEnum.SIMULATED_COINTEGRATED, max_workers=1)
+    scanner.close_prices = handler.get_normalised_close_prices()
+
+    results = scanner.scan()
+
+    assert list(results.columns) == SCAN_COLUMNS
+    assert len(results) == 6
+    assert results["cadf_p_value"].is_monotonic_increasing
+
+    for _, row in results.iterrows():
+        expected = single_pair(handler, row["ticker_a"], row["ticker_b"])
+
+        assert np.isclose(row["beta"], expected["beta"])
+        assert np.isclose(row["cadf_test_statistic"], expected["cadf_test_statistic"])
+        assert np.isclose(row["cadf_p_value"], expected["cadf_p_value"])
+        assert np.isclose(row["ecm_p_value"], expected["ecm_p_value"])
+        assert np.isclose(row["half_life"], expected["half_life"], equal_nan=True)
+        assert (row["cadf_p_value"] < 0.05) == expected["cadf_significant"]
+
+
+def test_scan_pairs_requires_initialised_worker(handler, monkeypatch):
+    monkeypatch.setattr(pair_scanner, "_PRICES", None)
+    with pytest.raises(RuntimeError):
+        _scan_pairs([("A", "D")])
+
+    _init_worker(handler.get_normalised_close_prices())
+    (row,) = _scan_pairs([("A", "D")])
+
+    assert row[:2] == ("A", "D")
+    assert row[SCAN_COLUMNS.index("cadf_p_value")] < 0.05  # A is simulated cointegrated with D
+
+
+def test_rejects_single_ticker():
+    with pytest.raises(ValueError):
+        PairScanner(["A"], START, END)
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from stat_arb.model.parameter_sweep import ParameterSweep
+from stat_arb.model.regressor import RegressorEnum, RollingWindowRegressor
+from stat_arb.model.regressor.naive_regressor import NaiveRegressorInputs
+from stat_arb.model.regressor.rolling_window_regressor import RollingWindowRegressorInputs
+from stat_arb.model.trading_strategy import (
+    OrnsteinUhlenbeckSDEFit,
+    OrnsteinUhlenbeckSDEFitInputs,
+    RollingWindow,
+    RollingWindowInputs,
+    StrategyEnum,
+    ToyStrategyInputs,
+)
+
+PAIR = dict(n_obs=750, beta=0.8, intercept=0.2, noise=0.005, names=("X", "Y"))
+
+
+def test_grid():
+    grid = ParameterSweep.grid(ToyStrategyInputs, enter_threshold=[1, 2], exit_threshold=[0, 0.5, 1])
+    assert len(grid) == 6
+    assert ToyStrategyInputs(2, 0.5) in grid
+
+
+def test_toy_strategy_sweep_shape(random_pair):
+    x, y = random_pair(**PAIR)
+    grid = ParameterSweep.grid(ToyStrategyInputs, enter_threshold=[1, 1.5], exit_threshold=[0, 0.5])
+
+    results = ParameterSweep(x, y, max_workers=1).run(
+        RegressorEnum.NAIVE, [NaiveRegressorInputs()], StrategyEnum.ToyStrategy, grid
+    )
+
+    assert len(results) == 4
+    assert {"enter_threshold", "exit_threshold", "sharpe_ratio", "max_drawdown"} <= set(results.columns)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_matches_single_backtests(max_workers, random_pair):
+    x, y = random_pair(**PAIR)
+    regressor_grid = ParameterSweep.grid(RollingWindowRegressorInputs, window_length=[60, 120])
+    strategy_grid = ParameterSweep.grid(
+        RollingWindowInputs, enter_threshold=[1, 2], exit_threshold=[0, 0.5], window_length=[20, 40]
+    )
+
+    results = ParameterSweep(x, y, max_workers=max_workers).run(
+        RegressorEnum.ROLLING_WINDOW, regressor_grid, StrategyEnum.RollingWindow, strategy_grid
+    )
+
+    assert len(results) == len(regressor_grid) * len(strategy_grid)
+
+    for _, row in results.iterrows():
+        regressor = RollingWindowRegressor(x, y)
+        resids = regressor.get_residual(RollingWindowRegressorInputs(row["regressor_window_length"]))
+        strategy = RollingWindow(resids, x, y, regressor.get_beta())
+        expected = strategy.backtest(
+            RollingWindowInputs(row["enter_threshold"], row["exit_threshold"], row["window_length"])
+        )
+
+        assert np.isclose(row["sharpe_ratio"], expected.get_sharpe_ratio(), equal_nan=True)
+        assert np.isclose(row["sortino_ratio"], expected.get_sortino_ratio(), equal_nan=True)
+        assert np.isclose(row["max_drawdown"], expected.get_max_drawdown(), equal_nan=True)
+        assert np.isclose(row["annualised_return"], expected.get_annualised_return(), equal_nan=True)
+        assert np.isclose(row["annualised_volatility"], expected.get_annualised_vol(), equal_nan=True)
+
+
+def test_ornstein_uhlenbeck_sweep_matches_single_backtests(random_pair):
+    x, y = random_pair(**PAIR)
+    strategy_grid = ParameterSweep.grid(
+        OrnsteinUhlenbeckSDEFitInputs, enter_threshold=[1.25, 2], exit_threshold=[0.5], window_length=[30, 60]
+    )
+
+    results = ParameterSweep(x, y, max_workers=1).run(
+        RegressorEnum.ROLLING_WINDOW,
+        [RollingWindowRegressorInputs(60)],
+        StrategyEnum.OrnsteinUhlenbeckSDEFit,
+        strategy_grid,
+    )
+
+    regressor = RollingWindowRegressor(x, y)
+    resids = regressor.get_residual(RollingWindowRegressorInputs(60))
+    strategy = OrnsteinUhlenbeckSDEFit(resids, x, y, regressor.get_beta())
+
+    for _, row in results.iterrows():
+        expected = strategy.backtest(
+            OrnsteinUhlenbeckSDEFitInputs(row["enter_threshold"], row["exit_threshold"], row["window_length"])
+        )
+
+        assert np.isclose(row["sharpe_ratio"], expected.get_sharpe_ratio(), equal_nan=True)
+        assert np.isclose(row["max_drawdown"], expected.get_max_drawdown(), equal_nan=True)
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+from stat_arb.model.data.price_cache import PriceCache, PriceCacheKey
+
+
+def panel(tickers, start="2025-01-01", periods=10):
+    dates = pd.bdate_range(start, periods=periods)
+    return pd.DataFrame(
+        np.arange(len(dates) * len(tickers), dtype=float).reshape(len(dates), -1), dates, tickers
+    )
+
+
+def key(tickers, start="2025-01-01", end="2025-01-14", source="test"):
+    return PriceCacheKey(source, tuple(tickers), pd.Timestamp(start), pd.Timestamp(end))
+
+
+def test_superset_slicing_and_stats():
+    cache = PriceCache()
+    close = panel(["A", "B", "C"])
+    cache.put(key(["A", "B", "C"]), close)
+
+    exact = cache.get(key(["A", "B", "C"]))
+    subset = cache.get(key(["C", "A", "B"], "2025-01-03", "2025-01-08"))
+    assert exact is not None and subset is not None
+
+    pd.testing.assert_frame_equal(exact, close)
+    pd.testing.assert_frame_equal(subset, close.loc["2025-01-03":"2025-01-08", ["C", "A", "B"]])
+
+    assert cache.get(key(["C", "A"])) is None
+    assert cache.get(key(["A", "D"])) is None
+    assert cache.get(key(["A"], end="2025-02-01")) is None
+    assert cache.get(key(["A"], source="other")) is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (2, 4, 1)
+
+
+def test_cached_panel_is_isolated_from_callers():
+    cache = PriceCache()
+    close = panel(["A", "B"])
+    cache.put(key(["A", "B"]), close)
+
+    close.iloc[0, 0] = -1.0
+    hit = cache.get(key(["A", "B"]))
+    assert hit is not None and hit.iloc[0, 0] == 0.0
+
+    hit.iloc[0, 0] = -1.0
+    hit = cache.get(key(["A", "B"]))
+    assert hit is not None and hit.iloc[0, 0] == 0.0
+
+
+def test_put_drops_subsumed_panels():
+    cache = PriceCache()
+    cache.put(key(["A"], end="2025-01-07"), panel(["A"], periods=5))
+    cache.put(key(["A"]), panel(["A"]))
+    cache.put(key(["A", "B"]), panel(["A", "B"]))
+
+    assert cache.stats().entries == 2
+
+
+def test_lru_eviction_by_size():
+    small = panel(["A"])
+    cache = PriceCache(max_bytes=2 * int(small.memory_usage().sum()))
+
+    cache.put(key(["A"]), small)
+    cache.put(key(["B"]), panel(["B"]))
+    cache.get(key(["A"]))
+    cache.put(key(["C"]), panel(["C"]))
+
+    assert cache.get(key(["A"])) is not None
+    assert cache.get(key(["B"])) is None
+
+
+def test_evict_by_ticker():
+    cache = PriceCache()
+    cache.put(key(["A", "B"]), panel(["A", "B"]))
+    cache.put(key(["C"]), panel(["C"]))
+
+    cache.evict("test", ["B"])
+
+    assert cache.get(key(["A", "B"])) is None
+    assert cache.get(key(["C"])) is not None
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+import statsmodels.api as sm
+from statsmodels.regression.rolling import RollingOLS
+
+from stat_arb.model.regressor.rolling_window_regressor import (
+    RollingWindowRegressor,
+    RollingWindowRegressorInputs,
+    rolling_least_squares,
+)
+
+PAIR = dict(n_obs=1000, beta=0.5)
+
+
+@pytest.mark.parametrize("window", [5, 30, 252])
+@pytest.mark.parametrize("expanding", [False, True])
+def test_matches_statsmodels(window, expanding, random_pair):
+    y, x = random_pair(**PAIR)
+    params = RollingOLS(y, sm.add_constant(x), window=window, expanding=expanding).fit().params
+
+    results = rolling_least_squares(y, x, window, expanding=expanding)
+
+    np.testing.assert_allclose(results.beta, params["X"], atol=1e-8)
+    np.testing.assert_allclose(results.intercept, params["const"], atol=1e-8)
+
+
+def test_missing_values_are_dropped_from_window(random_pair):
+    y, x = random_pair(**PAIR)
+    x.iloc[100:105] = np.nan
+    params = RollingOLS(y, sm.add_constant(x), window=30).fit().params
+
+    results = rolling_least_squares(y, x, 30)
+
+    np.testing.assert_allclose(results.beta, params["X"], atol=1e-8)
+
+
+def test_residual_excludes_first_window(random_pair):
+    y, x = random_pair(**PAIR)
+    regressor = RollingWindowRegressor(y, x)
+    resids = regressor.get_residual(RollingWindowRegressorInputs(30))
+
+    assert resids.iloc[:30].isna().all()
+    assert resids.iloc[30:].notna().all()
+    assert regressor.get_beta().columns.to_list() == ["X"]
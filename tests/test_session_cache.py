@@ -0,0 +1,63 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+from stat_arb.controller.session_cache import SessionModelCache, estimate_bytes
+
+
+class Model:
+    def __init__(self, n: int = 100):
+        self.close_prices = pd.DataFrame(np.zeros((n, 2)))
+        self.regressor = type("Regressor", (), {})()
+        self.regressor.resids = pd.Series(np.zeros(n))
+
+
+def test_sessions_are_isolated():
+    cache = SessionModelCache()
+    a, b = Model(), Model()
+    cache.put("a", a)
+    cache.put("b", b)
+
+    assert cache.get("a") is a
+    assert cache.get("b") is b
+    assert cache.get("c") is None
+    assert cache.get(None) is None
+
+
+def test_lru_eviction_by_session_count():
+    cache = SessionModelCache(max_sessions=2)
+    cache.put("a", Model())
+    cache.put("b", Model())
+    cache.get("a")
+    cache.put("c", Model())
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert len(cache) == 2
+
+
+def test_ttl_expiry():
+    cache = SessionModelCache(ttl=0.01)
+    cache.put("a", Model())
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_memory_cap():
+    model = Model()
+    cache = SessionModelCache(max_bytes=2 * estimate_bytes(model))
+    cache.put("a", model)
+    cache.put("b", Model())
+    cache.put("c", Model())
+
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+
+
+def test_estimate_bytes_follows_attributes():
+    model = Model(n=1000)
+
+    assert estimate_bytes(model) >= 3 * 1000 * 8
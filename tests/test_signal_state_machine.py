@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from stat_arb.model.trading_strategy.signal_state_machine import generate_signals
+
+
+def reference_signals(le, se, lx, sx) -> list[int]:
+    current_signal = 0
+    signals = []
+
+    for i in range(len(le)):
+        match current_signal:
+            case 0:
+                new_signal = 1 if le[i] else (-1 if se[i] else 0)
+            case 1:
+                new_signal = -1 if se[i] else (0 if lx[i] else 1)
+            case -1:
+                new_signal = 1 if le[i] else (0 if sx[i] else -1)
+
+        current_signal = new_signal
+        signals.append(new_signal)
+
+    return signals
+
+
+def z_score_signals(z, enter, exit):
+    return z < -enter, z > enter, z > -exit, z < exit
+
+
+@pytest.mark.parametrize("enter, exit", [(1, 0), (1.5, 0.5), (0.5, 0.5), (0.5, 1.0), (-0.5, 0)])
+def test_matches_reference_for_z_score(enter, exit):
+    rng = np.random.default_rng(0)
+    z = np.cumsum(rng.normal(size=1000)) / 10
+    z[:20] = np.nan
+
+    flags = z_score_signals(z, enter, exit)
+
+    assert generate_signals(*flags).tolist() == reference_signals(*flags)
+
+
+def test_matches_reference_for_arbitrary_flags():
+    rng = np.random.default_rng(1)
+    flags = [rng.random(500) < 0.2 for _ in range(4)]
+
+    assert generate_signals(*flags).tolist() == reference_signals(*flags)
+
+
+def test_column_stacked_strategies():
+    rng = np.random.default_rng(2)
+    z = np.cumsum(rng.normal(size=300)) / 10
+    thresholds = [(1, 0), (2, 0.5), (0.5, 1.0), (0.5, 0.25)]
+
+    stacked = [np.column_stack(x) for x in zip(*(z_score_signals(z, *t) for t in thresholds))]
+    signals = generate_signals(*stacked)
+
+    assert signals.shape == (300, 4)
+    for j, t in enumerate(thresholds):
+        assert signals[:, j].tolist() == reference_signals(*z_score_signals(z, *t))
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from stat_arb.model.data.simulated_data_handler import SimulatedDataHandler
+
+
+def test_views_share_one_simulation():
+    handler = SimulatedDataHandler(["A", "B"], "2025-01-01", "2025-03-01")
+
+    close = handler.get_close_prices()
+
+    np.testing.assert_allclose(handler.get_normalised_close_prices(), close / close.iloc[0])
+    np.testing.assert_allclose(handler.get_log_prices(), np.log(close))
+    np.testing.assert_allclose(handler.get_returns().iloc[1:], close.pct_change().iloc[1:])
+
+
+def test_refresh_resimulates():
+    handler = SimulatedDataHandler(["A", "B"], "2025-01-01", "2025-03-01")
+
+    close = handler.get_close_prices()
+
+    assert not handler.refresh().equals(close)
+
+
+def test_seeded_runs_are_reproducible():
+    close_a = SimulatedDataHandler(["A", "B"], "2025-01-01", "2025-03-01", seed=7).get_close_prices()
+    close_b = SimulatedDataHandler(["A", "B"], "2025-01-01", "2025-03-01", seed=7).get_close_prices()
+
+    assert close_a.equals(close_b)
+
+
+def test_business_day_calendar():
+    close = SimulatedDataHandler(["A"], "2025-01-01", "2025-01-31", seed=0).get_close_prices()
+
+    assert len(close) == 23
+    assert (pd.DatetimeIndex(close.index).dayofweek < 5).all()
+
+
+def test_simulate_paths_matches_euler_recursion():
+    handler = SimulatedDataHandler(["A", "B", "C"], "2025-01-01", "2025-03-01", seed=3)
+    paths = handler.simulate_paths(4, 50, 3)
+
+    handler.rng = np.random.default_rng(3)
+    rand = handler.get_correlated_random_numbers(50, 3, 4)
+
+    expected = np.full((4, 50, 3), 100.0)
+    for t in range(1, 50):
+        expected[:, t] = expected[:, t - 1] * (
+            1 + handler.mu * handler.dt + handler.sigma * np.sqrt(handler.dt) * rand[:, t]
+        )
+
+    assert paths.shape == (4, 50, 3)
+    np.testing.assert_allclose(paths, expected)
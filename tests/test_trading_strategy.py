@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from stat_arb.model.regressor import NaiveRegressor
+from stat_arb.model.regressor.naive_regressor import NaiveRegressorInputs
+from stat_arb.model.trading_strategy import RollingWindow, RollingWindowInputs, ToyStrategy, ToyStrategyInputs
+
+PAIR = dict(n_obs=750, beta=0.8, intercept=5.0, scale=100.0, noise=0.1, names=("X", "Y"))
+
+
+def reference_returns(resids, x, y, beta, inputs) -> pd.Series:
+    z = (resids - resids.mean()) / resids.std()
+
+    position, positions = 0, []
+    for z_t in z:
+        if z_t < -inputs.enter_threshold:
+            position = 1
+        elif z_t > inputs.enter_threshold:
+            position = -1
+        elif (position == 1 and z_t > -inputs.exit_threshold) or (
+            position == -1 and z_t < inputs.exit_threshold
+        ):
+            position = 0
+        positions.append(position)
+
+    return pd.Series(positions, x.index).shift(1) * (x.pct_change() - beta * y.pct_change())
+
+
+def test_scalar_beta_backtest_matches_pandas(random_pair):
+    x, y = random_pair(**PAIR)
+    regressor = NaiveRegressor(x, y)
+    resids = regressor.get_residual(NaiveRegressorInputs())
+    beta = regressor.get_beta()
+
+    results = ToyStrategy(resids, x, y, beta).backtest(ToyStrategyInputs(1, 0))
+
+    assert isinstance(results.beta, float)
+    assert results.positions.dtype == np.int8
+    expected = reference_returns(resids, x, y, beta.iloc[0], ToyStrategyInputs(1, 0))
+    np.testing.assert_allclose(results.period_return, expected, equal_nan=True)
+
+
+def test_wide_view_built_on_request(random_pair):
+    x, y = random_pair(**PAIR)
+    resids = NaiveRegressor(x, y).get_residual(NaiveRegressorInputs())
+
+    results = RollingWindow(resids, x, y, 0.8).backtest(RollingWindowInputs(1, 0, 30))
+    df = results.get_backtest()
+
+    assert list(df.columns) == [
+        "X_close",
+        "Y_close",
+        "Residual",
+        "Beta",
+        "Z-Score",
+        "LongEntrySignal",
+        "ShortEntrySignal",
+        "LongExitSignal",
+        "ShortExitSignal",
+        "Signal",
+        "X_returns",
+        "Y_returns",
+        "Portfolio_return",
+        "Cumulative_return",
+    ]
+    assert df.index.equals(x.index)
+    assert results.nbytes < df.memory_usage().sum() / 2
+
+
+def test_float32_mode(random_pair):
+    x, y = random_pair(**PAIR)
+    resids = NaiveRegressor(x, y).get_residual(NaiveRegressorInputs())
+
+    full = ToyStrategy(resids, x, y, 0.8).backtest()
+    single = ToyStrategy(resids, x, y, 0.8, dtype=np.float32).backtest()
+
+    assert single.portfolio_return.dtype == np.float32
+    assert single.nbytes < 0.6 * full.nbytes
+    assert single.get_sharpe_ratio() == pytest.approx(full.get_sharpe_ratio(), rel=1e-3)
+
+
+def test_misaligned_inputs_raise(random_pair):
+    x, y = random_pair(**PAIR)
+    with pytest.raises(ValueError):
+        ToyStrategy(np.zeros(10), x, y, 1.0)
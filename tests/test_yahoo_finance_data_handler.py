@@ -23,34 +23,34 @@ def test_empty_ticker_list():
 
 def test_spx_jan_2025_with_date_str():
     data = YahooFinanceDataHandler(["^SPX"], START_2025, DELTA_WEEK_2025)
-    data = data.get_close_prices()
-    assert isinstance(data, pd.DataFrame)
-    assert not data.empty
+    close = data.get_close_prices()
+    assert isinstance(close, pd.DataFrame)
+    assert not close.empty
 
 
 def test_spx_jan_2025_with_datetime():
     start = dt.datetime.strptime(START_2025, "%Y-%m-%d")
     end = dt.datetime.strptime(DELTA_WEEK_2025, "%Y-%m-%d")
     data = YahooFinanceDataHandler(["^SPX"], start, end)
-    data = data.get_close_prices()
-    assert isinstance(data, pd.DataFrame)
-    assert not data.empty
+    close = data.get_close_prices()
+    assert isinstance(close, pd.DataFrame)
+    assert not close.empty
 
 
 def test_spx_jan_2025_with_str_ticker():
     data = YahooFinanceDataHandler("^SPX", START_2025, DELTA_WEEK_2025)
-    data = data.get_close_prices()
-    assert isinstance(data, pd.DataFrame)
-    assert not data.empty
+    close = data.get_close_prices()
+    assert isinstance(close, pd.DataFrame)
+    assert not close.empty
 
 
 def test_multiple_jan_2025():
     tickers = ["^SPX", "^FTSE"]
     data = YahooFinanceDataHandler(tickers, START_2025, DELTA_WEEK_2025)
-    data = data.get_close_prices()
-    assert isinstance(data, pd.DataFrame)
-    assert not data.empty
-    assert set(data.columns.get_level_values(0)) == set(tickers)
+    close = data.get_close_prices()
+    assert isinstance(close, pd.DataFrame)
+    assert not close.empty
+    assert set(close.columns.get_level_values(0)) == set(tickers)
 
 
 def test_invalid_date_ranges():
@@ -0,0 +1,100 @@
+import datetime as dt
+import importlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stat_arb.model.local_store.yfinance_cache.database_util import connect, last_dates, refreshed_tickers
+
+yfinance_cache = importlib.import_module("stat_arb.model.local_store.yfinance_cache.yfinance_cache")
+
+START = dt.datetime(2025, 1, 1)
+
+
+class StubFetch:
+    """Deterministic stand-in for a single ticker yfinance fetch recording each request."""
+
+    def __init__(self, fail_on=None, empty=()):
+        self.calls = []
+        self.fail_on = fail_on
+        self.empty = set(empty)
+
+    def __call__(self, tickers, start, end):
+        (ticker,) = tickers
+        if ticker == self.fail_on:
+            raise ConnectionError(ticker)
+        self.calls.append((ticker, pd.Timestamp(start), pd.Timestamp(end)))
+
+        if ticker in self.empty:
+            return {}
+
+        dates = pd.bdate_range(start, end, inclusive="left", name="Date")
+        close = np.arange(len(dates), dtype=float) + dates.day
+        return {
+            ticker: pd.DataFrame(
+                {"Close": close, "High": close, "Low": close, "Open": close, "Volume": 1.0}, index=dates
+            )
+        }
+
+
+@pytest.fixture
+def db(tmp_path):
+    return str(tmp_path / "prices.db")
+
+
+def test_refresh_fetches_only_missing_range(db):
+    stub = StubFetch()
+
+    yfinance_cache.refresh_yfinance_data(["AAA", "BBB"], START, dt.datetime(2025, 1, 10), db=db, fetch=stub)
+    yfinance_cache.refresh_yfinance_data(["AAA", "BBB"], START, dt.datetime(2025, 1, 17), db=db, fetch=stub)
+
+    assert stub.calls[2:] == [
+        ("AAA", pd.Timestamp("2025-01-10"), pd.Timestamp("2025-01-17")),
+        ("BBB", pd.Timestamp("2025-01-10"), pd.Timestamp("2025-01-17")),
+    ]
+
+    conn = connect(db)
+    assert last_dates(conn) == {"AAA": pd.Timestamp("2025-01-16"), "BBB": pd.Timestamp("2025-01-16")}
+    assert conn.execute("SELECT COUNT(*) FROM prices").fetchone()[0] == 2 * 12
+    conn.close()
+
+
+def test_refresh_resumes_after_interruption(db):
+    end = dt.datetime(2025, 1, 10)
+
+    with pytest.raises(ConnectionError):
+        yfinance_cache.refresh_yfinance_data(["AAA", "BBB", "CCC"], START, end, db=db, fetch=StubFetch("BBB"))
+
+    stub = StubFetch()
+    yfinance_cache.refresh_yfinance_data(["AAA", "BBB", "CCC"], START, end, db=db, fetch=stub)
+
+    assert [x[0] for x in stub.calls] == ["BBB", "CCC"]
+
+    conn = connect(db)
+    assert sorted(last_dates(conn)) == ["AAA", "BBB", "CCC"]
+    conn.close()
+
+
+def test_refresh_up_to_date_is_noop(db):
+    stub = StubFetch()
+
+    end = dt.datetime(2025, 1, 10)
+    yfinance_cache.refresh_yfinance_data(["AAA"], START, end, db=db, fetch=stub)
+    yfinance_cache.refresh_yfinance_data(["AAA"], START, end, db=db, fetch=stub)
+
+    assert len(stub.calls) == 1
+
+
+def test_refresh_leaves_empty_downloads_pending(db):
+    end = dt.datetime(2025, 1, 10)
+    yfinance_cache.refresh_yfinance_data(["AAA", "BBB"], START, end, db=db, fetch=StubFetch(empty=["BBB"]))
+
+    conn = connect(db)
+    assert refreshed_tickers(conn, end) == {"AAA"}
+    conn.close()
+
+    stub = StubFetch()
+    yfinance_cache.refresh_yfinance_data(["AAA", "BBB"], START, end, db=db, fetch=stub)
+
+    assert [x[0] for x in stub.calls] == ["BBB"]